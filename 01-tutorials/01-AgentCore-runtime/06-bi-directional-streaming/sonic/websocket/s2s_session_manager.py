@@ -5,6 +5,9 @@ import warnings
 import uuid
 import os
 import logging
+import weakref
+from bisect import bisect_left
+from collections import defaultdict, deque
 from s2s_events import S2sEvent
 import time
 from aws_sdk_bedrock_runtime.client import BedrockRuntimeClient, InvokeModelWithBidirectionalStreamOperationInput
@@ -19,6 +22,193 @@ warnings.filterwarnings("ignore")
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Input audio is coalesced for at least one arrival interval plus jitter,
+# within these bounds, before it is sent to Bedrock
+JITTER_MIN_DELAY_MS = 60
+JITTER_MAX_DELAY_MS = 200
+# Largest span of audio sent in a single audioInput event
+MAX_INPUT_EVENT_MS = 1000
+# Buffered input audio beyond this is dropped, oldest first
+JITTER_CAPACITY_MS = 2000
+# 16 kHz 16-bit mono, the default audioInputConfiguration
+DEFAULT_INPUT_BYTES_PER_SECOND = 32000
+
+INPUT_BUFFER_MS_BUCKETS = (20, 50, 100, 200, 500, 1000, 2000)
+OUTPUT_QUEUE_DEPTH_BUCKETS = (0, 1, 5, 10, 25, 50, 100, 200)
+
+
+class DepthHistogram:
+    """Counts of observed queue depths per upper bucket bound."""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.max = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.max = max(self.max, value)
+
+    def snapshot(self):
+        labels = [f"le_{bound}" for bound in self.buckets] + ["inf"]
+        return {"buckets": dict(zip(labels, self.counts)), "max": self.max}
+
+
+class BufferMetrics:
+    """Drop, late and queue-depth statistics of all sessions, served on /health."""
+
+    def __init__(self):
+        self.counters = defaultdict(int)
+        self.input_buffer_ms = DepthHistogram(INPUT_BUFFER_MS_BUCKETS)
+        self.output_queue_depth = DepthHistogram(OUTPUT_QUEUE_DEPTH_BUCKETS)
+
+    def snapshot(self):
+        sessions = [session for session in active_sessions if session.is_active]
+        return {
+            "active_sessions": len(sessions),
+            "counters": dict(self.counters),
+            "input_buffer_ms": self.input_buffer_ms.snapshot(),
+            "output_queue_depth": self.output_queue_depth.snapshot(),
+            "sessions": [session.audio_buffer.snapshot() for session in sessions],
+        }
+
+
+buffer_metrics = BufferMetrics()
+active_sessions = weakref.WeakSet()
+
+
+class AudioJitterBuffer:
+    """
+    Per-session buffer that coalesces small input audio chunks.
+
+    The coalescing delay adapts to the observed arrival interval and its
+    jitter (estimated as in RFC 3550), so a steady client gets fewer, larger
+    audioInput events and a bursty one gets a deeper buffer. Chunks for a
+    different prompt or content are kept in separate segments so they are
+    never merged.
+    """
+
+    def __init__(self, bytes_per_second=DEFAULT_INPUT_BYTES_PER_SECOND):
+        self.bytes_per_second = bytes_per_second
+        self.block_align = 2
+        # Segments of (prompt_name, content_name, bytearray), oldest first
+        self.segments = deque()
+        self.buffered_bytes = 0
+        self.oldest_arrival = None
+        self.last_arrival = None
+        self.mean_interval_ms = None
+        self.jitter_ms = 0.0
+        self.target_delay_ms = JITTER_MIN_DELAY_MS
+        self._data_ready = asyncio.Event()
+
+    def set_format(self, audio_input_configuration):
+        """Update the byte rate from a contentStart audioInputConfiguration."""
+        sample_bytes = max(audio_input_configuration.get("sampleSizeBits", 16) // 8, 1)
+        self.block_align = sample_bytes * max(audio_input_configuration.get("channelCount", 1), 1)
+        self.bytes_per_second = audio_input_configuration.get("sampleRateHertz", 16000) * self.block_align
+
+    @property
+    def buffered_ms(self):
+        return self.buffered_bytes * 1000 / self.bytes_per_second
+
+    def push(self, prompt_name, content_name, audio_bytes):
+        """Add a decoded chunk, updating the arrival statistics."""
+        now = time.monotonic()
+        if self.last_arrival is not None:
+            interval_ms = (now - self.last_arrival) * 1000
+            if self.mean_interval_ms is None:
+                self.mean_interval_ms = interval_ms
+            else:
+                self.jitter_ms += (abs(interval_ms - self.mean_interval_ms) - self.jitter_ms) / 16
+                self.mean_interval_ms += (interval_ms - self.mean_interval_ms) / 16
+            # The buffer would have run dry waiting for this chunk
+            if interval_ms > self.target_delay_ms + self.buffered_ms:
+                buffer_metrics.counters["input_late_chunks"] += 1
+            self.target_delay_ms = min(
+                max(self.mean_interval_ms + 4 * self.jitter_ms, JITTER_MIN_DELAY_MS), JITTER_MAX_DELAY_MS
+            )
+        self.last_arrival = now
+
+        if self.segments and self.segments[-1][:2] == (prompt_name, content_name):
+            self.segments[-1][2].extend(audio_bytes)
+        else:
+            self.segments.append((prompt_name, content_name, bytearray(audio_bytes)))
+        if self.oldest_arrival is None:
+            self.oldest_arrival = now
+        self.buffered_bytes += len(audio_bytes)
+        buffer_metrics.counters["input_chunks"] += 1
+        buffer_metrics.input_buffer_ms.observe(self.buffered_ms)
+
+        self._drop_overflow()
+        self._data_ready.set()
+
+    def _drop_overflow(self):
+        """Drop the oldest audio beyond capacity; stale audio is useless in real time."""
+        capacity = int(JITTER_CAPACITY_MS * self.bytes_per_second / 1000) // self.block_align * self.block_align
+        excess = self.buffered_bytes - capacity
+        if excess <= 0:
+            return
+        buffer_metrics.counters["input_dropped_bytes"] += excess
+        logger.warning(f"Audio input buffer over {JITTER_CAPACITY_MS} ms, dropping {excess} bytes of oldest audio")
+        while excess > 0:
+            data = self.segments[0][2]
+            if len(data) <= excess:
+                self.segments.popleft()
+                excess -= len(data)
+                self.buffered_bytes -= len(data)
+            else:
+                del data[:excess]
+                self.buffered_bytes -= excess
+                excess = 0
+
+    async def wait_ready(self):
+        """Wait until a coalesced event should be sent."""
+        while True:
+            if not self.segments:
+                self._data_ready.clear()
+                await self._data_ready.wait()
+                continue
+            if len(self.segments) > 1 or self.buffered_ms >= self.target_delay_ms:
+                return
+            remaining_ms = self.target_delay_ms - (time.monotonic() - self.oldest_arrival) * 1000
+            if remaining_ms <= 0:
+                return
+            self._data_ready.clear()
+            try:
+                await asyncio.wait_for(self._data_ready.wait(), remaining_ms / 1000)
+            except asyncio.TimeoutError:
+                return
+
+    def pop(self):
+        """Take the oldest segment's audio, up to MAX_INPUT_EVENT_MS of it."""
+        if not self.segments:
+            return None
+        prompt_name, content_name, data = self.segments[0]
+        limit = int(MAX_INPUT_EVENT_MS * self.bytes_per_second / 1000) // self.block_align * self.block_align
+        if len(data) <= limit:
+            self.segments.popleft()
+            chunk = bytes(data)
+        else:
+            chunk = bytes(data[:limit])
+            del data[:limit]
+        self.buffered_bytes -= len(chunk)
+        self.oldest_arrival = time.monotonic() if self.segments else None
+        return prompt_name, content_name, chunk
+
+    def clear(self):
+        self.segments.clear()
+        self.buffered_bytes = 0
+        self.oldest_arrival = None
+        self.last_arrival = None
+
+    def snapshot(self):
+        return {
+            "target_delay_ms": round(self.target_delay_ms, 1),
+            "mean_interval_ms": round(self.mean_interval_ms, 1) if self.mean_interval_ms is not None else None,
+            "jitter_ms": round(self.jitter_ms, 1),
+            "buffered_ms": round(self.buffered_ms, 1),
+        }
+
 
 class S2sSessionManager:
     """Manages bidirectional streaming with AWS Bedrock using asyncio"""
@@ -28,11 +218,13 @@ class S2sSessionManager:
         self.model_id = model_id
         self.region = region
         
-        # Audio and output queues with size limits to prevent memory issues
-        self.audio_input_queue = asyncio.Queue(maxsize=100)  # Limit to 100 audio chunks (~2-3 seconds of audio)
+        # Input audio is coalesced in a jitter buffer; the output queue is bounded
+        self.audio_buffer = AudioJitterBuffer()
+        self._audio_send_lock = asyncio.Lock()
         self.output_queue = asyncio.Queue(maxsize=200)  # Larger output queue for responses
         
         self.response_task = None
+        self.audio_task = None
         self.stream = None
         self.is_active = False
         self.bedrock_client = None
@@ -47,6 +239,8 @@ class S2sSessionManager:
         
         # Track active tool processing tasks
         self.tool_processing_tasks = set()
+        
+        active_sessions.add(self)
 
     def _initialize_client(self):
         """
@@ -75,11 +269,7 @@ class S2sSessionManager:
         self.tool_processing_tasks.clear()
         
         # Clear queues
-        while not self.audio_input_queue.empty():
-            try:
-                self.audio_input_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
+        self.audio_buffer.clear()
         
         while not self.output_queue.empty():
             try:
@@ -119,7 +309,7 @@ class S2sSessionManager:
             self.response_task = asyncio.create_task(self._process_responses())
 
             # Start processing audio input
-            asyncio.create_task(self._process_audio_input())
+            self.audio_task = asyncio.create_task(self._process_audio_input())
             
             # Wait a bit to ensure everything is set up
             await asyncio.sleep(0.1)
@@ -157,46 +347,47 @@ class S2sSessionManager:
             # The response processing loop will detect if the stream is broken
     
     async def _process_audio_input(self):
-        """Process audio input from the queue and send to Bedrock."""
+        """Send coalesced audio from the jitter buffer to Bedrock."""
         while self.is_active:
             try:
-                # Get audio data from the queue
-                data = await self.audio_input_queue.get()
-                
-                # Extract data from the queue item
-                prompt_name = data.get('prompt_name')
-                content_name = data.get('content_name')
-                audio_bytes = data.get('audio_bytes')
-                
-                if not audio_bytes or not prompt_name or not content_name:
-                    logger.warning("Missing required audio data properties")
-                    continue
-
-                # Create the audio input event
-                audio_event = S2sEvent.audio_input(prompt_name, content_name, audio_bytes.decode('utf-8') if isinstance(audio_bytes, bytes) else audio_bytes)
-                
-                # Send the event
-                await self.send_raw_event(audio_event)
-                
+                await self.audio_buffer.wait_ready()
+                await self._send_buffered_audio(send_all=False)
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Error processing audio: {e}", exc_info=True)
     
+    async def flush_audio_input(self):
+        """Send all buffered input audio, so a following event can't overtake it."""
+        await self._send_buffered_audio(send_all=True)
+    
+    async def _send_buffered_audio(self, send_all):
+        """Send the oldest buffered audio as one audioInput event, or all of it."""
+        async with self._audio_send_lock:
+            while True:
+                item = self.audio_buffer.pop()
+                if item is None:
+                    return
+                prompt_name, content_name, chunk = item
+                audio_event = S2sEvent.audio_input(prompt_name, content_name, base64.b64encode(chunk).decode('ascii'))
+                await self.send_raw_event(audio_event)
+                buffer_metrics.counters["input_events_sent"] += 1
+                if not send_all:
+                    return
+    
     def add_audio_chunk(self, prompt_name, content_name, audio_data):
-        """Add an audio chunk to the queue."""
+        """Add an audio chunk to the jitter buffer."""
         # The audio_data is already a base64 string from the frontend
+        if not audio_data or not prompt_name or not content_name:
+            logger.warning("Missing required audio data properties")
+            return
         try:
-            self.audio_input_queue.put_nowait({
-                'prompt_name': prompt_name,
-                'content_name': content_name,
-                'audio_bytes': audio_data
-            })
-        except asyncio.QueueFull:
-            # Queue is full - drop this chunk to prevent backpressure
-            # This is acceptable for real-time audio streaming
-            logger.warning("Audio input queue full, dropping audio chunk to prevent backpressure")
-            pass
+            audio_bytes = base64.b64decode(audio_data)
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Dropping audio chunk that is not valid base64: {e}")
+            buffer_metrics.counters["input_invalid_chunks"] += 1
+            return
+        self.audio_buffer.push(prompt_name, content_name, audio_bytes)
     
     async def _process_responses(self):
         """Process incoming responses from Bedrock."""
@@ -240,12 +431,15 @@ class S2sSessionManager:
                             task.add_done_callback(self.tool_processing_tasks.discard)
                     
                     # Put the response in the output queue for forwarding to the frontend
+                    buffer_metrics.output_queue_depth.observe(self.output_queue.qsize())
                     try:
                         # Use put_nowait to avoid blocking, but handle queue full gracefully
                         self.output_queue.put_nowait(json_data)
+                        buffer_metrics.counters["output_events"] += 1
                     except asyncio.QueueFull:
                         # Queue is full - log warning but don't break the stream
                         # This can happen during high-throughput audio responses
+                        buffer_metrics.counters["output_dropped_events"] += 1
                         logger.warning("Output queue full, dropping response to prevent backpressure")
                         # Continue processing instead of breaking the stream
 
@@ -367,12 +561,8 @@ class S2sSessionManager:
             await asyncio.gather(*self.tool_processing_tasks, return_exceptions=True)
         self.tool_processing_tasks.clear()
         
-        # Clear audio queue to prevent processing old audio data
-        while not self.audio_input_queue.empty():
-            try:
-                self.audio_input_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
+        # Clear audio buffer to prevent processing old audio data
+        self.audio_buffer.clear()
         
         # Clear output queue
         while not self.output_queue.empty():
@@ -404,9 +594,13 @@ class S2sSessionManager:
             except asyncio.CancelledError:
                 pass
         
+        if self.audio_task and not self.audio_task.done():
+            self.audio_task.cancel()
+        
         # Set stream to None to ensure it's properly cleaned up
         self.stream = None
         self.response_task = None
+        self.audio_task = None
         
         logger.info("Bedrock stream closed successfully")
         
\ No newline at end of file
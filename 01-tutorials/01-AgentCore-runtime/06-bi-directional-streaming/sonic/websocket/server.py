@@ -1,6 +1,9 @@
 import asyncio
+import base64
 import json
 import logging
+import math
+import struct
 import warnings
 import os
 import uvicorn
@@ -10,7 +13,7 @@ from datetime import datetime
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from s2s_session_manager import S2sSessionManager
+from s2s_session_manager import S2sSessionManager, buffer_metrics
 
 # Configure logging
 LOGLEVEL = os.environ.get("LOGLEVEL", "INFO").upper()
@@ -21,6 +24,14 @@ logger = logging.getLogger(__name__)
 # Global variable to track credential refresh task
 credential_refresh_task = None
 
+# Largest WebSocket message sent to the client; larger events are split
+MAX_OUTBOUND_MESSAGE_SIZE = 10000
+
+# Binary audio frames: 1-byte frame type, 2-byte big-endian header length,
+# JSON header (the audioOutput fields except content), then raw PCM bytes
+AUDIO_FRAME_TYPE = 0x01
+AUDIO_FRAME_PREFIX = struct.Struct(">BH")
+
 
 def get_imdsv2_token():
     """
@@ -240,7 +251,7 @@ async def shutdown_event():
 @app.get("/")
 async def health_check():
     logger.info("Health check request received")
-    return JSONResponse({"status": "healthy"})
+    return JSONResponse({"status": "healthy", "audio": buffer_metrics.snapshot()})
 
 @app.get("/ping")
 async def ping():
@@ -278,6 +289,10 @@ async def websocket_endpoint(websocket: WebSocket):
     logger.info("WebSocket connection accepted")
     
     aws_region = os.getenv("AWS_DEFAULT_REGION", "us-east-1")
+    # Clients opt in to binary audio frames with ?audio_format=binary
+    binary_audio = websocket.query_params.get("audio_format") == "binary"
+    if binary_audio:
+        logger.info("Sending audio output as binary frames")
     stream_manager = None
     forward_task = None
     
@@ -328,7 +343,7 @@ async def websocket_endpoint(websocket: WebSocket):
                         
                         # Start a task to forward responses from Bedrock to the WebSocket
                         forward_task = asyncio.create_task(
-                            forward_responses(websocket, stream_manager)
+                            forward_responses(websocket, stream_manager, OutboundFramer(binary_audio=binary_audio))
                         )
                         
                         # Now send the sessionStart event to Bedrock
@@ -363,6 +378,9 @@ async def websocket_endpoint(websocket: WebSocket):
                             stream_manager.prompt_name = data['event']['promptStart']['promptName']
                         elif event_type == 'contentStart' and data['event']['contentStart'].get('type') == 'AUDIO':
                             stream_manager.audio_content_name = data['event']['contentStart']['contentName']
+                            audio_config = data['event']['contentStart'].get('audioInputConfiguration')
+                            if audio_config:
+                                stream_manager.audio_buffer.set_format(audio_config)
                         
                         # Handle audio input separately (queue-based processing)
                         if event_type == 'audioInput':
@@ -373,6 +391,9 @@ async def websocket_endpoint(websocket: WebSocket):
                             # Add to the audio queue for async processing
                             stream_manager.add_audio_chunk(prompt_name, content_name, audio_base64)
                         else:
+                            # Buffered audio must reach Bedrock before the content ends
+                            if event_type == 'contentEnd':
+                                await stream_manager.flush_audio_input()
                             # Send other events directly to Bedrock
                             await stream_manager.send_raw_event(data)
                     elif event_type not in ['sessionStart', 'sessionEnd']:
@@ -428,82 +449,105 @@ async def websocket_endpoint(websocket: WebSocket):
         logger.info("Connection closed")
 
 
-def split_large_event(response, max_size=16000):
-    """
-    Split a large event into smaller chunks by dividing the content field.
-    For audio events, ensures splits occur at sample boundaries to avoid noise.
-    Returns a list of events to send.
+class OutboundFramer:
     """
-    event = json.dumps(response)
-    event_size = len(event.encode('utf-8'))
-    
-    # If event is small enough, return as-is
-    if event_size <= max_size:
-        return [response]
-    
-    # Get event type and data
-    if 'event' not in response:
-        return [response]
+    Turns Bedrock output events into WebSocket messages for one connection.
     
-    event_type = list(response['event'].keys())[0]
-    event_data = response['event'][event_type]
-    
-    # Only split events that have a 'content' field (audioOutput, textOutput, etc.)
-    if 'content' not in event_data:
-        logger.warning(f"Event {event_type} is large ({event_size} bytes) but has no content field to split")
-        return [response]
-    
-    content = event_data['content']
-    
-    # Calculate how much content we can fit per chunk
-    # Create a template event to measure overhead
-    template_event = response.copy()
-    template_event['event'] = {event_type: event_data.copy()}
-    template_event['event'][event_type]['content'] = ''
-    overhead = len(json.dumps(template_event).encode('utf-8'))
+    Every event is serialized once. Events larger than max_size are split on
+    their content field: audio is decoded to PCM once and split on sample
+    boundaries, and chunks reuse the pre-serialized envelope around the
+    content. With binary_audio, audio is sent as binary frames carrying raw
+    PCM instead of base64 inside JSON.
+    """
     
-    # Calculate max content size per chunk (leave some margin)
-    max_content_size = max_size - overhead - 100
+    _CONTENT_PLACEHOLDER = "\x00content\x00"
     
-    # For audio events, align to sample boundaries
-    # Base64 encoding: 4 chars = 3 bytes of binary data
-    # PCM 16-bit: 2 bytes per sample
-    # Must align to multiples of 4 chars for valid base64 (no padding issues)
-    if event_type == 'audioOutput':
-        # Align to 4-char boundaries for complete base64 groups
-        # This ensures each chunk is valid base64 without padding issues
-        alignment = 4
-        max_content_size = (max_content_size // alignment) * alignment
-        logger.debug(f"Audio splitting: aligned chunk size to {max_content_size} chars (base64 boundary)")
+    def __init__(self, max_size=MAX_OUTBOUND_MESSAGE_SIZE, binary_audio=False):
+        self.max_size = max_size
+        self.binary_audio = binary_audio
+        # Bytes per PCM sample frame; Nova Sonic outputs 16-bit mono
+        self.block_align = 2
     
-    # Split content into chunks
-    chunks = []
-    for i in range(0, len(content), max_content_size):
-        chunk_content = content[i:i + max_content_size]
+    def frame(self, response):
+        """Return the messages (str for text frames, bytes for binary) for an event."""
+        event_type = next(iter(response['event']), None) if 'event' in response else None
+        event_data = response['event'][event_type] if event_type else None
+        
+        if event_type == 'contentStart':
+            self._track_audio_format(event_data)
         
-        # For base64 content, ensure proper padding if needed
-        if event_type == 'audioOutput':
-            # Each chunk should be a multiple of 4 chars (already aligned above)
-            # But verify and add padding if somehow needed
-            remainder = len(chunk_content) % 4
-            if remainder != 0:
-                # This shouldn't happen due to alignment, but just in case
-                padding_needed = 4 - remainder
-                chunk_content += '=' * padding_needed
-                logger.warning(f"Added {padding_needed} padding chars to audio chunk")
+        if event_type == 'audioOutput' and 'content' in event_data:
+            return self._frame_audio(response, event_type, event_data)
         
-        # Create new event with chunked content
-        chunk_event = response.copy()
-        chunk_event['event'] = {event_type: event_data.copy()}
-        chunk_event['event'][event_type]['content'] = chunk_content
+        # Serialized with ensure_ascii, so the length in characters is the size in bytes
+        message = json.dumps(response)
+        if len(message) <= self.max_size:
+            return [message]
+        if not event_type or not isinstance(event_data.get('content'), str):
+            logger.warning(f"Event {event_type} is large ({len(message)} bytes) but has no content field to split")
+            return [message]
         
-        chunks.append(chunk_event)
+        prefix, suffix = self._envelope(response, event_type, event_data)
+        content = event_data['content']
+        budget = self.max_size - len(prefix) - len(suffix)
+        # Escaping makes some characters longer, so size slices by the average
+        # and shrink any slice that still doesn't fit
+        step = max(budget * len(content) // (len(message) - len(prefix) - len(suffix)), 1)
+        messages = []
+        start = 0
+        while start < len(content):
+            size = step
+            chunk = json.dumps(content[start:start + size])
+            while len(chunk) > budget and size > 1:
+                size //= 2
+                chunk = json.dumps(content[start:start + size])
+            messages.append(prefix + chunk + suffix)
+            start += size
+        return messages
     
-    logger.info(f"Split {event_type} event ({event_size} bytes) into {len(chunks)} chunks")
-    return chunks
+    def _frame_audio(self, response, event_type, event_data):
+        """Frame audio without re-serializing or re-encoding it when possible."""
+        content = event_data['content']
+        
+        if not self.binary_audio:
+            prefix, suffix = self._envelope(response, event_type, event_data)
+            budget = self.max_size - len(prefix) - len(suffix) - 2
+            if len(content) <= budget:
+                return [f'{prefix}"{content}"{suffix}']
+            pcm = base64.b64decode(content)
+            # Whole samples that also encode to base64 without padding
+            alignment = math.lcm(self.block_align, 3)
+            step = max((budget // 4 * 3) // alignment * alignment, alignment)
+            return [
+                f'{prefix}"{base64.b64encode(pcm[i:i + step]).decode("ascii")}"{suffix}'
+                for i in range(0, len(pcm), step)
+            ]
+        
+        header = json.dumps(
+            {key: value for key, value in event_data.items() if key != 'content'}
+        ).encode('utf-8')
+        frame_prefix = AUDIO_FRAME_PREFIX.pack(AUDIO_FRAME_TYPE, len(header)) + header
+        pcm = base64.b64decode(content)
+        budget = self.max_size - len(frame_prefix)
+        step = max(budget // self.block_align * self.block_align, self.block_align)
+        return [frame_prefix + pcm[i:i + step] for i in range(0, len(pcm), step)]
+    
+    def _envelope(self, response, event_type, event_data):
+        """Serialize an event with a placeholder and return the text around its content."""
+        template = dict(response)
+        template['event'] = {event_type: dict(event_data, content=self._CONTENT_PLACEHOLDER)}
+        prefix, suffix = json.dumps(template).split(json.dumps(self._CONTENT_PLACEHOLDER))
+        return prefix, suffix
+    
+    def _track_audio_format(self, event_data):
+        """Pick up the sample size of the audio that follows a contentStart."""
+        config = event_data.get('audioOutputConfiguration') if event_data else None
+        if config:
+            sample_bytes = max(config.get('sampleSizeBits', 16) // 8, 1)
+            self.block_align = sample_bytes * max(config.get('channelCount', 1), 1)
 
 
-async def forward_responses(websocket: WebSocket, stream_manager):
+async def forward_responses(websocket: WebSocket, stream_manager, framer: OutboundFramer):
     """Forward responses from Bedrock to the WebSocket client."""
     try:
         while True:
@@ -512,31 +556,19 @@ async def forward_responses(websocket: WebSocket, stream_manager):
             
             # Send to WebSocket
             try:
-                # Check if event needs to be split
-                event = json.dumps(response)
-                event_size = len(event.encode('utf-8'))
-                
-                # Get event type for logging
-                event_type = list(response.get('event', {}).keys())[0] if 'event' in response else 'unknown'
-                
-                # Split large events
-                if event_size > 10000:
-                    logger.warning(f"!!!! Large {event_type} event detected (size: {event_size} bytes) - splitting...")
-                    events_to_send = split_large_event(response, max_size=10000)
-                else:
-                    events_to_send = [response]
+                messages = framer.frame(response)
                 
                 # Send all chunks
-                for idx, event_chunk in enumerate(events_to_send):
-                    chunk_json = json.dumps(event_chunk)
-                    chunk_size = len(chunk_json.encode('utf-8'))
-                    
-                    await websocket.send_text(chunk_json)
-                    
-                    if len(events_to_send) > 1:
-                        logger.info(f"Forwarded {event_type} chunk {idx+1}/{len(events_to_send)} to client (size: {chunk_size} bytes)")
+                for message in messages:
+                    if isinstance(message, bytes):
+                        await websocket.send_bytes(message)
                     else:
-                        logger.info(f"Forwarded {event_type} to client (size: {chunk_size} bytes)")
+                        await websocket.send_text(message)
+                
+                if logger.isEnabledFor(logging.DEBUG):
+                    event_type = next(iter(response.get('event', {})), 'unknown')
+                    size = sum(len(message) for message in messages)
+                    logger.debug(f"Forwarded {event_type} to client in {len(messages)} message(s) ({size} bytes)")
                         
             except Exception as e:
                 logger.error(f"Error sending response to client: {e}", exc_info=True)
@@ -8,8 +8,11 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, field_validator
 from typing import Optional, List, Dict, Any
+import asyncio
+import functools
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from bedrock_agentcore.memory import MemoryClient
 from dotenv import load_dotenv
@@ -152,11 +155,40 @@ except Exception as e:
     logger.error(f"❌ Failed to initialize AgentCore Memory client: {e}")
     memory_client = None
 
+# MemoryClient is synchronous, so its calls run on a bounded thread pool to keep
+# one slow AgentCore request from blocking the event loop for every other user
+MEMORY_CLIENT_MAX_WORKERS = int(os.getenv("MEMORY_CLIENT_MAX_WORKERS", "8"))
+memory_executor = ThreadPoolExecutor(
+    max_workers=MEMORY_CLIENT_MAX_WORKERS, thread_name_prefix="agentcore-memory"
+)
+
+# Largest page the ListEvents API returns in one call
+LIST_EVENTS_MAX_PAGE_SIZE = 100
+
+# Most records a RetrieveMemoryRecords search ranks; pages are cut from these
+RETRIEVE_MAX_TOP_K = 100
+
+
+async def run_memory_call(fn, *args, **kwargs):
+    """Run a blocking MemoryClient call on the memory executor"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        memory_executor, functools.partial(fn, *args, **kwargs)
+    )
+
+
+@app.on_event("shutdown")
+def shutdown_memory_executor():
+    """Stop the memory executor threads"""
+    memory_executor.shutdown(wait=False, cancel_futures=True)
+
 
 class MemoryQuery(BaseModel):
     namespace: Optional[str] = None
     max_results: Optional[int] = 50
     memory_id: Optional[str] = None
+    # Cursor returned as next_token by the previous page
+    next_token: Optional[str] = None
 
 
 @app.get("/health")
@@ -185,6 +217,8 @@ class ShortTermMemoryQuery(BaseModel):
     sort_order: Optional[str] = "desc"
     # Essential filters only
     content_search: Optional[str] = None
+    # Cursor returned as next_token by the previous page
+    next_token: Optional[str] = None
 
 
 class LongTermMemoryQuery(BaseModel):
@@ -194,6 +228,8 @@ class LongTermMemoryQuery(BaseModel):
     content_type: Optional[str] = "all"
     sort_by: Optional[str] = "timestamp"
     sort_order: Optional[str] = "desc"
+    # Cursor returned as next_token by the previous page
+    next_token: Optional[str] = None
 
     @field_validator("namespace")
     @classmethod
@@ -206,7 +242,14 @@ class LongTermMemoryQuery(BaseModel):
 def apply_short_term_filters(
     memories: List[Dict[str, Any]], query: ShortTermMemoryQuery
 ) -> List[Dict[str, Any]]:
-    """Apply client-side filters to short-term memory results"""
+    """Apply client-side filters to one page of short-term memory results.
+
+    Filters the AgentCore API can't evaluate (content search, role) run here;
+    event_type and role also decide which APIs get_short_term_memory calls.
+    Filtering and sorting only see the current page, so a filtered page may
+    be short or empty while next_token still points at more results. The
+    web UI requests unfiltered pages and filters everything it has loaded.
+    """
     filtered_memories = memories.copy()
 
     # Content search filtering
@@ -272,193 +315,232 @@ async def get_short_term_memory(query: ShortTermMemoryQuery):
         logger.info(f"📋 Memory ID: {memory_id}")
         logger.info(f"📋 Max results: {query.max_results}")
 
+        # ListEvents entries are plain events without a role, so a role or
+        # conversation-only filter rules them out before calling the API
+        fetch_events = (
+            query.event_type in ("all", "event") and query.role_filter == "all"
+        )
+        # get_last_k_turns always returns the latest turns, so it only
+        # contributes to the first page
+        fetch_turns = (
+            query.event_type in ("all", "conversation") and not query.next_token
+        )
+        next_token = None
+
         # Method 1: Try ListEvents API
-        try:
-            logger.info("📞 Using ListEvents API")
-            events = memory_client.list_events(
-                memory_id=memory_id,
-                actor_id=query.actor_id,
-                session_id=query.session_id,
-                max_results=query.max_results,
-            )
+        if fetch_events:
+            try:
+                logger.info("📞 Using ListEvents API")
+                params = {
+                    "memoryId": memory_id,
+                    "actorId": query.actor_id,
+                    "sessionId": query.session_id,
+                    "maxResults": min(
+                        query.max_results or 20, LIST_EVENTS_MAX_PAGE_SIZE
+                    ),
+                    "includePayloads": True,
+                }
+                if query.next_token:
+                    params["nextToken"] = query.next_token
 
-            if events:
-                logger.info(f"✅ Found {len(events)} events")
-
-                for event_idx, event in enumerate(events):
-                    payload = event.get("payload", {})
-                    content_text = ""
-
-                    # Handle the actual payload structure from MemoryClient.list_events
-                    if isinstance(payload, list) and len(payload) > 0:
-                        # Payload is a list, get first item
-                        first_item = payload[0]
-                        if isinstance(first_item, dict):
-                            # Look for conversational content
-                            if "conversational" in first_item:
-                                conversational = first_item["conversational"]
-                                if isinstance(conversational, dict):
-                                    content = conversational.get("content", {})
-                                    if isinstance(content, dict) and "text" in content:
-                                        content_text = content["text"]
+                # One page per request; the caller passes next_token back for more
+                response = await run_memory_call(
+                    memory_client.gmdp_client.list_events, **params
+                )
+                events = response.get("events", [])
+                next_token = response.get("nextToken")
+
+                if events:
+                    logger.info(f"✅ Found {len(events)} events")
+
+                    for event_idx, event in enumerate(events):
+                        payload = event.get("payload", {})
+                        content_text = ""
+
+                        # Handle the actual payload structure from MemoryClient.list_events
+                        if isinstance(payload, list) and len(payload) > 0:
+                            # Payload is a list, get first item
+                            first_item = payload[0]
+                            if isinstance(first_item, dict):
+                                # Look for conversational content
+                                if "conversational" in first_item:
+                                    conversational = first_item["conversational"]
+                                    if isinstance(conversational, dict):
+                                        content = conversational.get("content", {})
+                                        if (
+                                            isinstance(content, dict)
+                                            and "text" in content
+                                        ):
+                                            content_text = content["text"]
+                                        else:
+                                            content_text = str(conversational)
+                                else:
+                                    # Fallback to any content field
+                                    if "content" in first_item:
+                                        content = first_item["content"]
+                                        if (
+                                            isinstance(content, dict)
+                                            and "text" in content
+                                        ):
+                                            content_text = content["text"]
+                                        else:
+                                            content_text = str(content)
                                     else:
-                                        content_text = str(conversational)
+                                        content_text = str(first_item)
                             else:
-                                # Fallback to any content field
-                                if "content" in first_item:
-                                    content = first_item["content"]
-                                    if isinstance(content, dict) and "text" in content:
-                                        content_text = content["text"]
-                                    else:
-                                        content_text = str(content)
+                                content_text = str(first_item)
+                        elif isinstance(payload, dict):
+                            # Handle dict payload
+                            if "content" in payload:
+                                content = payload["content"]
+                                if isinstance(content, dict) and "text" in content:
+                                    content_text = content["text"]
                                 else:
-                                    content_text = str(first_item)
-                        else:
-                            content_text = str(first_item)
-                    elif isinstance(payload, dict):
-                        # Handle dict payload
-                        if "content" in payload:
-                            content = payload["content"]
-                            if isinstance(content, dict) and "text" in content:
-                                content_text = content["text"]
+                                    content_text = str(content)
+                            elif "message" in payload:
+                                content_text = str(payload["message"])
                             else:
-                                content_text = str(content)
-                        elif "message" in payload:
-                            content_text = str(payload["message"])
+                                content_text = str(payload)
                         else:
                             content_text = str(payload)
-                    else:
-                        content_text = str(payload)
-
-                    memory_entry = {
-                        "id": f"event-{event_idx}",
-                        "content": content_text,
-                        "type": "event",
-                        "memory_type": "SHORT_TERM",
-                        "actor_id": query.actor_id,
-                        "session_id": query.session_id,
-                        "event_id": event.get("eventId", f"event-{event_idx}"),
-                        "event_type": event.get("eventType", "unknown"),
-                        "timestamp": str(
-                            event.get(
-                                "eventTimestamp", datetime.now().isoformat() + "Z"
-                            )
-                        ),
-                        "size": len(content_text),
-                    }
-                    short_term_memories.append(memory_entry)
-
-        except Exception as e:
-            error_msg = str(e).lower()
-            logger.warning(
-                f"ListEvents failed for {query.actor_id}/{query.session_id}: {e}"
-            )
-            logger.warning(f"ListEvents error type: {type(e).__name__}")
-
-            # Clean the error message to remove ARNs and sensitive info
-            clean_error = clean_aws_error_message(str(e))
-
-            # Check for specific Memory ID not found errors
-            if any(
-                keyword in error_msg
-                for keyword in [
-                    "not found",
-                    "does not exist",
-                    "invalid memory",
-                    "memory id",
-                    "resourcenotfoundexception",
-                ]
-            ):
-                logger.error(f"❌ Memory ID '{memory_id}' not found or inaccessible")
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Memory ID '{memory_id}' not found. Please verify the Memory ID exists and you have access permissions.",
-                )
-            elif any(
-                keyword in error_msg
-                for keyword in [
-                    "access denied",
-                    "unauthorized",
-                    "permission",
-                    "accessdeniedexception",
-                ]
-            ):
-                logger.error(f"❌ Access denied for Memory ID '{memory_id}'")
-                raise HTTPException(status_code=403, detail=clean_error)
-
-        # Method 2: Try get_last_k_turns
-        try:
-            logger.info("🔄 Using get_last_k_turns API")
-            recent_turns = memory_client.get_last_k_turns(
-                memory_id=memory_id,
-                actor_id=query.actor_id,
-                session_id=query.session_id,
-                k=query.max_results or 10,
-            )
-
-            if recent_turns:
-                logger.info(f"✅ Found {len(recent_turns)} conversation turns")
-
-                for turn_idx, turn in enumerate(recent_turns):
-                    for message_idx, message in enumerate(turn):
-                        content = message.get("content", {})
-                        if isinstance(content, dict):
-                            content_text = content.get("text", str(content))
-                        else:
-                            content_text = str(content)
 
+                        event_id = event.get("eventId", f"event-{event_idx}")
                         memory_entry = {
-                            "id": f"turn-{turn_idx}-{message_idx}",
+                            # Event ids stay unique when the client appends pages
+                            "id": event_id,
                             "content": content_text,
-                            "type": "conversation",
+                            "type": "event",
                             "memory_type": "SHORT_TERM",
                             "actor_id": query.actor_id,
                             "session_id": query.session_id,
-                            "role": message.get("role", "unknown"),
-                            "turn_index": turn_idx,
-                            "message_index": message_idx,
-                            "timestamp": datetime.now().isoformat() + "Z",
+                            "event_id": event_id,
+                            "event_type": event.get("eventType", "unknown"),
+                            "timestamp": str(
+                                event.get(
+                                    "eventTimestamp", datetime.now().isoformat() + "Z"
+                                )
+                            ),
                             "size": len(content_text),
                         }
                         short_term_memories.append(memory_entry)
 
-        except Exception as e:
-            error_msg = str(e).lower()
-            logger.warning(
-                f"get_last_k_turns failed for {query.actor_id}/{query.session_id}: {e}"
-            )
-            logger.warning(f"get_last_k_turns error type: {type(e).__name__}")
+            except Exception as e:
+                error_msg = str(e).lower()
+                logger.warning(
+                    f"ListEvents failed for {query.actor_id}/{query.session_id}: {e}"
+                )
+                logger.warning(f"ListEvents error type: {type(e).__name__}")
 
-            # Clean the error message to remove ARNs and sensitive info
-            clean_error = clean_aws_error_message(str(e))
+                # Clean the error message to remove ARNs and sensitive info
+                clean_error = clean_aws_error_message(str(e))
 
-            # Check for specific Memory ID not found errors
-            if any(
-                keyword in error_msg
-                for keyword in [
-                    "not found",
-                    "does not exist",
-                    "invalid memory",
-                    "memory id",
-                    "resourcenotfoundexception",
-                ]
-            ):
-                logger.error(f"❌ Memory ID '{memory_id}' not found or inaccessible")
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Memory ID '{memory_id}' not found. Please verify the Memory ID exists and you have access permissions.",
+                # Check for specific Memory ID not found errors
+                if any(
+                    keyword in error_msg
+                    for keyword in [
+                        "not found",
+                        "does not exist",
+                        "invalid memory",
+                        "memory id",
+                        "resourcenotfoundexception",
+                    ]
+                ):
+                    logger.error(
+                        f"❌ Memory ID '{memory_id}' not found or inaccessible"
+                    )
+                    raise HTTPException(
+                        status_code=404,
+                        detail=f"Memory ID '{memory_id}' not found. Please verify the Memory ID exists and you have access permissions.",
+                    )
+                elif any(
+                    keyword in error_msg
+                    for keyword in [
+                        "access denied",
+                        "unauthorized",
+                        "permission",
+                        "accessdeniedexception",
+                    ]
+                ):
+                    logger.error(f"❌ Access denied for Memory ID '{memory_id}'")
+                    raise HTTPException(status_code=403, detail=clean_error)
+
+        # Method 2: Try get_last_k_turns
+        if fetch_turns:
+            try:
+                logger.info("🔄 Using get_last_k_turns API")
+                recent_turns = await run_memory_call(
+                    memory_client.get_last_k_turns,
+                    memory_id=memory_id,
+                    actor_id=query.actor_id,
+                    session_id=query.session_id,
+                    k=query.max_results or 10,
                 )
-            elif any(
-                keyword in error_msg
-                for keyword in [
-                    "access denied",
-                    "unauthorized",
-                    "permission",
-                    "accessdeniedexception",
-                ]
-            ):
-                logger.error(f"❌ Access denied for Memory ID '{memory_id}'")
-                raise HTTPException(status_code=403, detail=clean_error)
+
+                if recent_turns:
+                    logger.info(f"✅ Found {len(recent_turns)} conversation turns")
+
+                    for turn_idx, turn in enumerate(recent_turns):
+                        for message_idx, message in enumerate(turn):
+                            content = message.get("content", {})
+                            if isinstance(content, dict):
+                                content_text = content.get("text", str(content))
+                            else:
+                                content_text = str(content)
+
+                            memory_entry = {
+                                "id": f"turn-{turn_idx}-{message_idx}",
+                                "content": content_text,
+                                "type": "conversation",
+                                "memory_type": "SHORT_TERM",
+                                "actor_id": query.actor_id,
+                                "session_id": query.session_id,
+                                "role": message.get("role", "unknown"),
+                                "turn_index": turn_idx,
+                                "message_index": message_idx,
+                                "timestamp": datetime.now().isoformat() + "Z",
+                                "size": len(content_text),
+                            }
+                            short_term_memories.append(memory_entry)
+
+            except Exception as e:
+                error_msg = str(e).lower()
+                logger.warning(
+                    f"get_last_k_turns failed for {query.actor_id}/{query.session_id}: {e}"
+                )
+                logger.warning(f"get_last_k_turns error type: {type(e).__name__}")
+
+                # Clean the error message to remove ARNs and sensitive info
+                clean_error = clean_aws_error_message(str(e))
+
+                # Check for specific Memory ID not found errors
+                if any(
+                    keyword in error_msg
+                    for keyword in [
+                        "not found",
+                        "does not exist",
+                        "invalid memory",
+                        "memory id",
+                        "resourcenotfoundexception",
+                    ]
+                ):
+                    logger.error(
+                        f"❌ Memory ID '{memory_id}' not found or inaccessible"
+                    )
+                    raise HTTPException(
+                        status_code=404,
+                        detail=f"Memory ID '{memory_id}' not found. Please verify the Memory ID exists and you have access permissions.",
+                    )
+                elif any(
+                    keyword in error_msg
+                    for keyword in [
+                        "access denied",
+                        "unauthorized",
+                        "permission",
+                        "accessdeniedexception",
+                    ]
+                ):
+                    logger.error(f"❌ Access denied for Memory ID '{memory_id}'")
+                    raise HTTPException(status_code=403, detail=clean_error)
 
         logger.info(f"✅ Total short-term memories found: {len(short_term_memories)}")
 
@@ -470,6 +552,7 @@ async def get_short_term_memory(query: ShortTermMemoryQuery):
             "memories": filtered_memories,
             "total_count": len(filtered_memories),
             "raw_count": len(short_term_memories),
+            "next_token": next_token,
             "source": "short_term_memory",
             "actor_id": query.actor_id,
             "session_id": query.session_id,
@@ -532,7 +615,8 @@ async def search_event_by_id(query: EventSearchQuery):
                         f"🔍 Searching in actor_id={actor_id}, session_id={session_id}"
                     )
 
-                    events = memory_client.list_events(
+                    events = await run_memory_call(
+                        memory_client.list_events,
                         memory_id=memory_id,
                         actor_id=actor_id,
                         session_id=session_id,
@@ -615,8 +699,8 @@ async def get_event_by_id(query: EventQuery):
         try:
             # Note: This assumes there's a get_event method in the memory client
             # You may need to check the actual AgentCore Memory client API
-            event = memory_client.get_event(
-                memory_id=memory_id, event_id=query.event_id
+            event = await run_memory_call(
+                memory_client.get_event, memory_id=memory_id, event_id=query.event_id
             )
 
             if event:
@@ -744,7 +828,9 @@ async def list_namespaces_old(query: MemoryQuery):
 
         # Get memory strategies to discover namespaces
         try:
-            strategies = memory_client.get_memory_strategies(memory_id)
+            strategies = await run_memory_call(
+                memory_client.get_memory_strategies, memory_id
+            )
             logger.info(f"✅ Found {len(strategies)} memory strategies")
 
             namespaces = []
@@ -846,17 +932,29 @@ async def get_long_term_memory(query: LongTermMemoryQuery):
             f"📋 Filters: content_type={query.content_type}, sort_by={query.sort_by}, sort_order={query.sort_order}"
         )
 
-        # Use retrieve_memories to get long-term memory directly from AgentCore
+        next_token = None
+
+        # Use RetrieveMemoryRecords to get long-term memory directly from AgentCore
         try:
-            logger.info("📚 Using retrieve_memories API")
-
-            # Use retrieve_memories for semantic search
-            memory_results = memory_client.retrieve_memories(
-                memory_id=memory_id,
-                namespace=query.namespace,
-                query="*",  # Get all content - could be made configurable
-                top_k=query.max_results,
+            logger.info("📚 Using RetrieveMemoryRecords API")
+
+            params = {
+                "memoryId": memory_id,
+                "namespace": query.namespace,
+                "searchCriteria": {
+                    "searchQuery": "*",  # Get all content - could be made configurable
+                    "topK": RETRIEVE_MAX_TOP_K,
+                },
+                "maxResults": min(query.max_results or 20, RETRIEVE_MAX_TOP_K),
+            }
+            if query.next_token:
+                params["nextToken"] = query.next_token
+
+            # One page per request; the caller passes next_token back for more
+            memory_results = await run_memory_call(
+                memory_client.gmdp_client.retrieve_memory_records, **params
             )
+            next_token = memory_results.get("nextToken")
 
             if (
                 isinstance(memory_results, dict)
@@ -995,6 +1093,7 @@ async def get_long_term_memory(query: LongTermMemoryQuery):
         return {
             "memories": long_term_memories,
             "total_count": len(long_term_memories),
+            "next_token": next_token,
             "source": "long_term_memory",
             "namespace": query.namespace,
             "memory_id": memory_id,
@@ -1027,6 +1126,7 @@ async def get_memory_entries(query: MemoryQuery):
             )
 
         all_memories = []
+        next_token = None
 
         # Use ListMemoryRecords operation to browse all records without semantic search
         logger.info("🔍 Listing memory records using ListMemoryRecords operation")
@@ -1050,11 +1150,19 @@ async def get_memory_entries(query: MemoryQuery):
         try:
             logger.info(f"📋 Listing memory records from namespace: {query.namespace}")
 
-            memories = memory_client.list_memory_records(
-                memoryId=memory_id,
-                namespace=query.namespace,
-                maxResults=query.max_results or 50,
+            params = {
+                "memoryId": memory_id,
+                "namespace": query.namespace,
+                "maxResults": query.max_results or 50,
+            }
+            if query.next_token:
+                params["nextToken"] = query.next_token
+
+            memories = await run_memory_call(
+                memory_client.list_memory_records, **params
             )
+            if isinstance(memories, dict):
+                next_token = memories.get("nextToken")
 
             # Handle the actual response structure
             if isinstance(memories, dict) and "memoryRecordSummaries" in memories:
@@ -1121,6 +1229,7 @@ async def get_memory_entries(query: MemoryQuery):
         return {
             "memories": all_memories,
             "total_count": len(all_memories),
+            "next_token": next_token,
             "source": "list_memory_records",
             "memory_id": memory_id,
         }
@@ -1162,12 +1271,58 @@ async def list_namespaces_v2(query: ListNamespacesQuery):
             logger.info("📋 Getting memory strategies to discover namespaces...")
 
             # Get memory strategies which contain namespace information
-            strategies = memory_client.get_memory_strategies(memory_id)
+            strategies = await run_memory_call(
+                memory_client.get_memory_strategies, memory_id
+            )
             logger.info(f"✅ Found {len(strategies)} memory strategies")
 
-            found_namespaces = []
+            async def sample_namespace(namespace: str, strategy_type: str) -> Dict:
+                # Try to get a sample of records from this namespace to count them
+                try:
+                    # Use retrieve_memories to get sample content
+                    sample_memories = await run_memory_call(
+                        memory_client.retrieve_memories,
+                        memory_id=memory_id,
+                        namespace=namespace,
+                        query="*",  # Generic query to get any content
+                        top_k=3,  # Get a few samples
+                    )
+
+                    sample_content = ""
+                    if sample_memories and len(sample_memories) > 0:
+                        first_memory = sample_memories[0]
+                        content = first_memory.get("content", {})
+                        if isinstance(content, dict):
+                            sample_content = (
+                                content.get("text", str(content))[:100] + "..."
+                            )
+                        else:
+                            sample_content = str(content)[:100] + "..."
+
+                    logger.info(
+                        f"✅ Found namespace: {namespace} (type: {strategy_type}) with {len(sample_memories) if sample_memories else 0} sample records"
+                    )
+                    return {
+                        "namespace": namespace,
+                        "type": strategy_type,
+                        "count": len(sample_memories) if sample_memories else 0,
+                        "sample_content": sample_content,
+                    }
+
+                except Exception as e:
+                    # Still add the namespace even if we can't get samples
+                    logger.warning(
+                        f"⚠️ Found namespace: {namespace} (type: {strategy_type}) but couldn't retrieve samples: {e}"
+                    )
+                    return {
+                        "namespace": namespace,
+                        "type": strategy_type,
+                        "count": 0,
+                        "sample_content": f"Unable to retrieve sample: {clean_aws_error_message(str(e))}",
+                    }
 
             # Extract namespaces from strategies
+            to_sample = []
             for strategy in strategies:
                 strategy_type = strategy.get("type", "unknown")
                 namespaces = strategy.get("namespaces", [])
@@ -1175,55 +1330,12 @@ async def list_namespaces_v2(query: ListNamespacesQuery):
                 logger.info(
                     f"📋 Strategy '{strategy_type}' has namespaces: {namespaces}"
                 )
+                to_sample.extend((namespace, strategy_type) for namespace in namespaces)
 
-                for namespace in namespaces:
-                    # Try to get a sample of records from this namespace to count them
-                    try:
-                        # Use retrieve_memories to get sample content
-                        sample_memories = memory_client.retrieve_memories(
-                            memory_id=memory_id,
-                            namespace=namespace,
-                            query="*",  # Generic query to get any content
-                            top_k=3,  # Get a few samples
-                        )
-
-                        sample_content = ""
-                        if sample_memories and len(sample_memories) > 0:
-                            first_memory = sample_memories[0]
-                            content = first_memory.get("content", {})
-                            if isinstance(content, dict):
-                                sample_content = (
-                                    content.get("text", str(content))[:100] + "..."
-                                )
-                            else:
-                                sample_content = str(content)[:100] + "..."
-
-                        found_namespaces.append(
-                            {
-                                "namespace": namespace,
-                                "type": strategy_type,
-                                "count": len(sample_memories) if sample_memories else 0,
-                                "sample_content": sample_content,
-                            }
-                        )
-
-                        logger.info(
-                            f"✅ Found namespace: {namespace} (type: {strategy_type}) with {len(sample_memories) if sample_memories else 0} sample records"
-                        )
-
-                    except Exception as e:
-                        # Still add the namespace even if we can't get samples
-                        found_namespaces.append(
-                            {
-                                "namespace": namespace,
-                                "type": strategy_type,
-                                "count": 0,
-                                "sample_content": f"Unable to retrieve sample: {clean_aws_error_message(str(e))}",
-                            }
-                        )
-                        logger.warning(
-                            f"⚠️ Found namespace: {namespace} (type: {strategy_type}) but couldn't retrieve samples: {e}"
-                        )
+            # Sample all namespaces concurrently instead of one after another
+            found_namespaces = await asyncio.gather(
+                *(sample_namespace(ns, st) for ns, st in to_sample)
+            )
 
             # Remove duplicates based on namespace
             unique_namespaces = []
@@ -1268,8 +1380,11 @@ async def list_namespaces_v2(query: ListNamespacesQuery):
                 for pattern in namespace_patterns:
                     try:
                         # Use list_memory_records to test namespace existence
-                        memories = memory_client.list_memory_records(
-                            memoryId=memory_id, namespace=pattern, maxResults=1
+                        memories = await run_memory_call(
+                            memory_client.list_memory_records,
+                            memoryId=memory_id,
+                            namespace=pattern,
+                            maxResults=1,
                         )
 
                         if memories and len(memories) > 0:
@@ -1336,7 +1451,8 @@ async def validate_memory_id(query: MemoryIdValidationQuery):
 
         # Try to list memory records to validate the memory ID
         try:
-            _ = memory_client.list_memory_records(
+            _ = await run_memory_call(
+                memory_client.list_memory_records,
                 memoryId=query.memory_id,
                 maxResults=1,  # Just check if we can access it
             )
@@ -1442,60 +1558,65 @@ async def list_namespaces(request: dict):
 
         try:
             # Get memory strategies to discover namespaces
-            strategies = memory_client.get_memory_strategies(memory_id)
+            strategies = await run_memory_call(
+                memory_client.get_memory_strategies, memory_id
+            )
             logger.info(f"✅ Found {len(strategies)} memory strategies")
 
-            namespaces = []
-            for strategy in strategies:
-                strategy_type = strategy.get("type", "UNKNOWN")
-                strategy_namespaces = strategy.get("namespaces", [])
+            async def describe_namespace(namespace: str, strategy_type: str) -> Dict:
+                # Try to get a count of records in this namespace
+                try:
+                    # Sample a few records to get count and sample content
+                    sample_memories = await run_memory_call(
+                        memory_client.retrieve_memories,
+                        memory_id=memory_id,
+                        namespace=namespace,
+                        query="*",
+                        top_k=5,
+                    )
 
-                for namespace in strategy_namespaces:
-                    # Try to get a count of records in this namespace
-                    try:
-                        # Sample a few records to get count and sample content
-                        sample_memories = memory_client.retrieve_memories(
-                            memory_id=memory_id, namespace=namespace, query="*", top_k=5
+                    if (
+                        isinstance(sample_memories, dict)
+                        and "memoryRecordSummaries" in sample_memories
+                    ):
+                        memory_records = sample_memories["memoryRecordSummaries"]
+                    else:
+                        memory_records = (
+                            sample_memories if isinstance(sample_memories, list) else []
                         )
 
-                        if (
-                            isinstance(sample_memories, dict)
-                            and "memoryRecordSummaries" in sample_memories
-                        ):
-                            memory_records = sample_memories["memoryRecordSummaries"]
+                    count = len(memory_records)
+                    sample_content = ""
+                    if memory_records:
+                        first_record = memory_records[0]
+                        content = first_record.get("content", {})
+                        if isinstance(content, dict):
+                            sample_content = content.get("text", str(content))
                         else:
-                            memory_records = (
-                                sample_memories
-                                if isinstance(sample_memories, list)
-                                else []
-                            )
+                            sample_content = str(content)
 
-                        count = len(memory_records)
-                        sample_content = ""
-                        if memory_records:
-                            first_record = memory_records[0]
-                            content = first_record.get("content", {})
-                            if isinstance(content, dict):
-                                sample_content = content.get("text", str(content))
-                            else:
-                                sample_content = str(content)
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to get count for namespace {namespace}: {e}"
+                    )
+                    count = 0
+                    sample_content = ""
 
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to get count for namespace {namespace}: {e}"
-                        )
-                        count = 0
-                        sample_content = ""
+                return {
+                    "namespace": namespace,
+                    "type": strategy_type,
+                    "count": count,
+                    "sample_content": sample_content[:200] if sample_content else "",
+                }
 
-                    namespace_info = {
-                        "namespace": namespace,
-                        "type": strategy_type,
-                        "count": count,
-                        "sample_content": sample_content[:200]
-                        if sample_content
-                        else "",
-                    }
-                    namespaces.append(namespace_info)
+            # Sample all namespaces concurrently instead of one after another
+            namespaces = await asyncio.gather(
+                *(
+                    describe_namespace(namespace, strategy.get("type", "UNKNOWN"))
+                    for strategy in strategies
+                    for namespace in strategy.get("namespaces", [])
+                )
+            )
 
             logger.info(f"✅ Found {len(namespaces)} total namespaces")
 
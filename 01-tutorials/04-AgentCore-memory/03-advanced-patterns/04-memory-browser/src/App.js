@@ -41,8 +41,14 @@ function App() {
     setTimeout(() => setLoading(false), 1000); // Simulate refresh
   };
 
-  const handleShortTermMemoryFetch = (memories) => {
-    setShortTermMemories(memories);
+  // Add a further page to the loaded entries, skipping ids already shown
+  const appendPage = (loaded, page) => {
+    const loadedIds = new Set(loaded.map(memory => memory.id));
+    return [...loaded, ...page.filter(memory => !loadedIds.has(memory.id))];
+  };
+
+  const handleShortTermMemoryFetch = (memories, append = false) => {
+    setShortTermMemories(prev => (append ? appendPage(prev, memories) : memories));
     console.log('Short-term memories fetched:', memories);
     console.log('Current filters:', { eventTypeFilter, roleFilter, contentSearch });
 
@@ -53,8 +59,8 @@ function App() {
     console.log('Available roles in data:', roles);
   };
 
-  const handleLongTermMemoryFetch = (memories) => {
-    setLongTermMemories(memories);
+  const handleLongTermMemoryFetch = (memories, append = false) => {
+    setLongTermMemories(prev => (append ? appendPage(prev, memories) : memories));
     console.log('Long-term memories fetched:', memories);
   };
 
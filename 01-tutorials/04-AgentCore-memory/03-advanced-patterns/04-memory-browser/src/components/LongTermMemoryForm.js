@@ -1,5 +1,5 @@
 import { useState } from 'react';
-import { AlertCircle, CheckCircle, Loader, Layers, User, MessageCircle, X } from 'lucide-react';
+import { AlertCircle, CheckCircle, ChevronDown, Loader, Layers, User, MessageCircle, X } from 'lucide-react';
 
 const LongTermMemoryForm = ({ onMemoryFetch, memoryConfig, availableNamespaces }) => {
   const [formData, setFormData] = useState({
@@ -9,6 +9,9 @@ const LongTermMemoryForm = ({ onMemoryFetch, memoryConfig, availableNamespaces }
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState('');
   const [success, setSuccess] = useState('');
+  // Last request and the cursor of its next page, null when all are loaded
+  const [lastRequest, setLastRequest] = useState(null);
+  const [nextToken, setNextToken] = useState(null);
   
   // Modal state for collecting missing values
   const [showModal, setShowModal] = useState(false);
@@ -173,6 +176,8 @@ const LongTermMemoryForm = ({ onMemoryFetch, memoryConfig, availableNamespaces }
         throw new Error(errorMessage);
       }
       console.log('✅ Response data:', data);
+      setLastRequest(requestPayload);
+      setNextToken(data.next_token || null);
       
       if (data.memories && data.memories.length > 0) {
         setSuccess(`Found ${data.memories.length} long-term memory entries!`);
@@ -253,6 +258,8 @@ const LongTermMemoryForm = ({ onMemoryFetch, memoryConfig, availableNamespaces }
         throw new Error(errorMessage);
       }
       console.log('✅ Response data:', data);
+      setLastRequest(requestPayload);
+      setNextToken(data.next_token || null);
       
       if (data.memories && data.memories.length > 0) {
         setSuccess(`Found ${data.memories.length} long-term memory entries!`);
@@ -284,6 +291,38 @@ const LongTermMemoryForm = ({ onMemoryFetch, memoryConfig, availableNamespaces }
     }
   };
 
+  const handleLoadMore = async () => {
+    if (!lastRequest || !nextToken) return;
+
+    setLoading(true);
+    setError('');
+    setSuccess('');
+
+    try {
+      const response = await fetch('http://localhost:8000/api/agentcore/getLongTermMemory', {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({ ...lastRequest, next_token: nextToken })
+      });
+
+      const data = await response.json();
+      if (!response.ok) {
+        throw new Error(data.detail || `Request failed with status ${response.status}`);
+      }
+
+      setNextToken(data.next_token || null);
+      setSuccess(`Loaded ${(data.memories || []).length} more long-term memory entries.`);
+      onMemoryFetch(data.memories || [], true);
+    } catch (err) {
+      console.error('❌ Long-term memory load more error:', err);
+      setError(err.message || 'Failed to fetch long-term memory');
+    } finally {
+      setLoading(false);
+    }
+  };
+
   console.log('🔍 LongTermMemoryForm render:', { 
     availableNamespaces, 
     availableNamespacesLength: availableNamespaces.length,
@@ -380,6 +419,19 @@ const LongTermMemoryForm = ({ onMemoryFetch, memoryConfig, availableNamespaces }
               <span>Loading memory data...</span>
             </div>
           )}
+
+          {nextToken && !loading && (
+            <div className="form-group">
+              <button
+                type="button"
+                onClick={handleLoadMore}
+                className="submit-button-inline"
+              >
+                <ChevronDown size={16} />
+                Load More
+              </button>
+            </div>
+          )}
         </div>
 
         {/* Status Messages */}
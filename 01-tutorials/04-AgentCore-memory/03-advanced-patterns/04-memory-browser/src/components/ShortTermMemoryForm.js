@@ -12,6 +12,8 @@ const ShortTermMemoryForm = ({ onMemoryFetch, memoryConfig }) => {
   const [searchHistory, setSearchHistory] = useState([]);
   const [showActorHistory, setShowActorHistory] = useState(false);
   const [showSessionHistory, setShowSessionHistory] = useState(false);
+  // Cursor of the next page of the current session, null when all are loaded
+  const [nextToken, setNextToken] = useState(null);
 
   // Load search history from localStorage on component mount
   useEffect(() => {
@@ -54,6 +56,8 @@ const ShortTermMemoryForm = ({ onMemoryFetch, memoryConfig }) => {
     }));
     setError('');
     setSuccess('');
+    // A cursor only continues the query it came from
+    setNextToken(null);
   };
 
   const handleHistorySelect = (historyItem) => {
@@ -68,7 +72,10 @@ const ShortTermMemoryForm = ({ onMemoryFetch, memoryConfig }) => {
 
   const handleSubmit = async (e) => {
     e.preventDefault();
-    
+    fetchPage(null);
+  };
+
+  const fetchPage = async (pageToken) => {
     if (!memoryConfig.actor_id || !memoryConfig.actor_id.trim()) {
       setError('Actor ID is required in configuration');
       return;
@@ -92,7 +99,8 @@ const ShortTermMemoryForm = ({ onMemoryFetch, memoryConfig }) => {
         body: JSON.stringify({
           ...formData,
           memory_id: memoryConfig.memory_id,
-          actor_id: memoryConfig.actor_id
+          actor_id: memoryConfig.actor_id,
+          next_token: pageToken
         })
       });
 
@@ -112,8 +120,12 @@ const ShortTermMemoryForm = ({ onMemoryFetch, memoryConfig }) => {
       }
 
       // data is already parsed above
+      setNextToken(data.next_token || null);
       
-      if (data.memories && data.memories.length > 0) {
+      if (pageToken) {
+        setSuccess(`Loaded ${(data.memories || []).length} more short-term memory entries.`);
+        onMemoryFetch(data.memories || [], true);
+      } else if (data.memories && data.memories.length > 0) {
         setSuccess(`Found ${data.memories.length} short-term memory entries!`);
         onMemoryFetch(data.memories);
         // Save successful search to history
@@ -210,6 +222,20 @@ const ShortTermMemoryForm = ({ onMemoryFetch, memoryConfig }) => {
             </button>
             <div className="form-help">&nbsp;</div>
           </div>
+
+          {nextToken && (
+            <div className="form-group">
+              <button
+                type="button"
+                onClick={() => fetchPage(nextToken)}
+                disabled={loading}
+                className="submit-button-inline"
+              >
+                <ChevronDown size={16} />
+                Load More
+              </button>
+            </div>
+          )}
         </div>
 
         {/* Status Messages */}
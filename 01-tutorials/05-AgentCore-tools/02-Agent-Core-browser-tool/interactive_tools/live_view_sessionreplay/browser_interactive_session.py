@@ -40,7 +40,7 @@ import io
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Optional, Tuple
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse
 import mimetypes
 
@@ -617,7 +617,7 @@ def view_recordings(s3_location):
                     return CustomSessionReplayHandler(self.data_source, self.viewer_path, *args, **kwargs)
                 
                 # Start server
-                self.server = HTTPServer(('', port), handler_factory)
+                self.server = ThreadingHTTPServer(('', port), handler_factory)
                 
                 # Start in thread
                 server_thread = threading.Thread(target=self.server.serve_forever)
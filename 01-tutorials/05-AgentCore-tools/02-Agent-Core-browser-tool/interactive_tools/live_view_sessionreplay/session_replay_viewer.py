@@ -15,11 +15,15 @@ import threading
 import webbrowser
 import socket
 import signal
-import shutil
 import gzip
+import hashlib
+import heapq
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import urlparse
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
 import mimetypes
 from datetime import datetime
 
@@ -31,6 +35,67 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 
 console = Console()
 
+# Batch files larger than this are downloaded as concurrent ranged GETs
+RANGE_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_CACHE_DIR = Path(tempfile.gettempdir()) / "bedrock_agentcore_replay_cache"
+# Least recently used batch files are evicted beyond this total size
+DEFAULT_CACHE_MAX_MB = 1024
+# Parsed recordings kept in memory; older ones are reloaded from the disk cache
+MAX_LOADED_RECORDINGS = 2
+# Span of recording time sent per chunk by /api/stream
+STREAM_WINDOW_MS = 10000
+
+# rrweb event type that the player needs before it can render anything
+RRWEB_FULL_SNAPSHOT = 2
+
+
+def iter_gzip_lines(chunks):
+    """Decompress gzip data arriving in chunks and yield complete text lines.
+    
+    Handles files made of several concatenated gzip members, so nothing has
+    to be written to disk or held in memory as a whole.
+    """
+    decompressor = zlib.decompressobj(wbits=31)
+    pending = b''
+    for chunk in chunks:
+        while chunk:
+            pending += decompressor.decompress(chunk)
+            chunk = decompressor.unused_data
+            if chunk:
+                # Start of the next gzip member
+                decompressor = zlib.decompressobj(wbits=31)
+        *lines, pending = pending.split(b'\n')
+        for line in lines:
+            yield line.decode('utf-8')
+    pending += decompressor.flush()
+    for line in pending.split(b'\n'):
+        yield line.decode('utf-8')
+
+
+def iter_event_windows(events, window_ms):
+    """Split timestamp-ordered events into chunks covering window_ms each.
+    
+    The first chunk always reaches the first full snapshot, so the player can
+    start rendering from it alone.
+    """
+    if not events:
+        return
+    first_snapshot = next(
+        (i for i, event in enumerate(events) if event.get('type') == RRWEB_FULL_SNAPSHOT), 0
+    )
+    window_end = max(
+        events[0]['timestamp'] + window_ms, events[first_snapshot]['timestamp'] + 1
+    )
+    chunk = []
+    for event in events:
+        if event['timestamp'] >= window_end:
+            yield chunk
+            chunk = []
+            while event['timestamp'] >= window_end:
+                window_end += window_ms
+        chunk.append(event)
+    yield chunk
+
 
 class SessionReplayHandler(BaseHTTPRequestHandler):
     """HTTP request handler for session replay viewer"""
@@ -56,6 +121,11 @@ class SessionReplayHandler(BaseHTTPRequestHandler):
             elif path.startswith('/api/download/'):
                 recording_id = path.split('/')[-1]
                 self.download_and_serve_recording(recording_id)
+            elif path.startswith('/api/stream/'):
+                recording_id = path.split('/')[-1]
+                query = parse_qs(urlparse(self.path).query)
+                window_ms = int(query.get('window', [STREAM_WINDOW_MS])[0])
+                self.stream_recording(recording_id, max(window_ms, 1))
             else:
                 self.serve_file(path.lstrip('/'))
                 
@@ -286,6 +356,7 @@ class SessionReplayHandler(BaseHTTPRequestHandler):
     
     <script>
         let currentPlayer = null;
+        let currentLoad = null;
         let recordings = [];
         
         async function loadRecordings() {
@@ -351,6 +422,28 @@ class SessionReplayHandler(BaseHTTPRequestHandler):
             }
         }
         
+        function createPlayer(playerEl, events) {
+            const width = Math.min(playerEl.offsetWidth, 1200);
+            const height = Math.min(playerEl.offsetHeight, 800);
+            
+            // CHANGED: Use string concatenation
+            console.log('Creating player with dimensions ' + width + 'x' + height);
+            
+            const player = new rrwebPlayer({
+                target: playerEl,
+                props: {
+                    events: events,
+                    width: width,
+                    height: height,
+                    autoPlay: true,
+                    showController: true
+                }
+            });
+            
+            console.log('Player created:', player);
+            return player;
+        }
+        
         async function loadRecording(index) {
             const recording = recordings[index];
             
@@ -363,6 +456,11 @@ class SessionReplayHandler(BaseHTTPRequestHandler):
             const playerEl = document.getElementById('player');
             playerEl.innerHTML = '<div class="empty-state"><div class="loading"></div>Downloading recording...</div>';
             
+            if (currentLoad) {
+                currentLoad.abort();
+                currentLoad = null;
+            }
+            
             try {
                 // Safely dispose of the existing player first
                 if (currentPlayer) {
@@ -378,49 +476,66 @@ class SessionReplayHandler(BaseHTTPRequestHandler):
                     currentPlayer = null;
                 }
                 
-                // CHANGED: Use string concatenation
-                const response = await fetch('/api/download/' + recording.id);
-                const result = await response.json();
+                // Stream the recording in time windows so playback starts
+                // as soon as the first window arrives
+                const load = new AbortController();
+                currentLoad = load;
                 
-                if (!result.success || !result.data) {
+                const response = await fetch('/api/stream/' + recording.id, { signal: load.signal });
+                if (!response.ok || !response.body) {
+                    const result = await response.json().catch(function() { return {}; });
                     throw new Error(result.error || 'Failed to download recording');
                 }
                 
-                const { events } = result.data;
-                
-                if (!events || events.length === 0) {
-                    throw new Error('Recording contains no events');
-                }
-                
-                // CHANGED: Use string concatenation for logging
-                console.log('Loaded ' + events.length + ' events. First event type: ' + events[0].type);
-                
-                playerEl.innerHTML = '';
-                
                 if (typeof rrwebPlayer !== 'function') {
                     throw new Error('rrwebPlayer not found - make sure the library is loaded');
                 }
                 
-                const width = Math.min(playerEl.offsetWidth, 1200);
-                const height = Math.min(playerEl.offsetHeight, 800);
-                
-                // CHANGED: Use string concatenation
-                console.log('Creating player with dimensions ' + width + 'x' + height);
+                const reader = response.body.getReader();
+                const decoder = new TextDecoder();
+                let buffered = '';
+                let loadedEvents = 0;
                 
-                currentPlayer = new rrwebPlayer({
-                    target: playerEl,
-                    props: {
-                        events: events,
-                        width: width,
-                        height: height,
-                        autoPlay: true,
-                        showController: true
+                while (true) {
+                    const { done, value } = await reader.read();
+                    if (done) break;
+                    // Another recording was selected while this one was loading
+                    if (currentLoad !== load) return;
+                    
+                    buffered += decoder.decode(value, { stream: true });
+                    const lines = buffered.split('\n');
+                    buffered = lines.pop();
+                    
+                    for (const line of lines) {
+                        if (!line.trim()) continue;
+                        const message = JSON.parse(line);
+                        
+                        if (message.type === 'error') {
+                            throw new Error(message.error);
+                        } else if (message.type === 'metadata') {
+                            if (message.totalEvents === 0) {
+                                throw new Error('Recording contains no events');
+                            }
+                            console.log('Streaming ' + message.totalEvents + ' events');
+                        } else if (message.type === 'events') {
+                            loadedEvents += message.events.length;
+                            if (!currentPlayer) {
+                                playerEl.innerHTML = '';
+                                currentPlayer = createPlayer(playerEl, message.events);
+                            } else {
+                                message.events.forEach(function(event) {
+                                    currentPlayer.addEvent(event);
+                                });
+                            }
+                        }
                     }
-                });
+                }
                 
-                console.log('Player created:', currentPlayer);
+                // CHANGED: Use string concatenation for logging
+                console.log('Loaded ' + loadedEvents + ' events');
                 
             } catch (e) {
+                if (e.name === 'AbortError') return;
                 console.error('Failed to load recording:', e);
                 // CHANGED: Use string concatenation
                 playerEl.innerHTML = '<div class="error">Error: ' + e.message + '</div>';
@@ -539,6 +654,65 @@ class SessionReplayHandler(BaseHTTPRequestHandler):
             self.end_headers()
             self.wfile.write(error_response.encode('utf-8'))
 
+    def stream_recording(self, recording_id, window_ms=STREAM_WINDOW_MS):
+        """Serve a recording as NDJSON, one line per window of events.
+        
+        The first line holds the metadata and event count, followed by
+        'events' lines in time order and a final 'end' line. Each line is
+        written as soon as it is serialized, so the player can start after
+        the first window instead of waiting for the whole recording.
+        """
+        recording_data = self.data_source.download_recording(recording_id)
+        
+        if not recording_data:
+            error_response = json.dumps({
+                'success': False,
+                'error': 'Recording not found'
+            })
+            self.send_response(404)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(error_response)))
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(error_response.encode('utf-8'))
+            return
+        
+        events = recording_data['events']
+        
+        # No Content-Length: the body ends when the connection closes
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        self.close_connection = True
+        
+        def write_line(message):
+            self.wfile.write(json.dumps(message).encode('utf-8') + b'\n')
+            self.wfile.flush()
+        
+        try:
+            write_line({
+                'type': 'metadata',
+                'metadata': recording_data.get('metadata', {}),
+                'totalEvents': len(events),
+                'windowMs': window_ms
+            })
+            for chunk in iter_event_windows(events, window_ms):
+                write_line({
+                    'type': 'events',
+                    'start': chunk[0]['timestamp'],
+                    'end': chunk[-1]['timestamp'],
+                    'events': chunk
+                })
+            write_line({'type': 'end'})
+        except (BrokenPipeError, ConnectionResetError):
+            # The viewer moved on to another recording
+            pass
+        except Exception as e:
+            console.print(f"[red]Error in stream_recording: {e}[/red]")
+            write_line({'type': 'error', 'error': str(e)})
+
     def do_OPTIONS(self):
         """Handle OPTIONS requests for CORS preflight"""
         self.send_response(200)
@@ -636,22 +810,38 @@ class LocalDataSource(DataSource):
 
 
 class S3DataSource(DataSource):
-    """S3 data source"""
+    """S3 data source
     
-    def __init__(self, bucket, prefix=''):
+    Batch files are downloaded concurrently (large files as ranged GETs) and
+    decompressed while they stream in. The parsed events of every batch file
+    are cached on disk under its S3 ETag, and the last MAX_LOADED_RECORDINGS
+    loaded recordings are kept in memory, so reopening a recording only lists its files again.
+    A recording with a batch file that failed to load is never cached, so
+    the next request retries the failed files.
+    """
+    
+    def __init__(self, bucket, prefix='', cache_dir=None, max_workers=8,
+                 cache_max_mb=DEFAULT_CACHE_MAX_MB):
         self.s3_client = boto3.client('s3')
         self.bucket = bucket
         self.prefix = prefix.rstrip('/')
-        self.temp_dir = Path(tempfile.mkdtemp(prefix="bedrock_agentcore_replay_"))
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_max_bytes = int(cache_max_mb * 1024 * 1024)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="replay-s3")
+        # recording_id -> (ETags of its files, loaded recording), least recently used first
+        self._recordings = OrderedDict()
+        self._lock = threading.Lock()
         
         console.print(f"[cyan]Using S3 location:[/cyan]")
         console.print(f"  Bucket: {bucket}")
         console.print(f"  Prefix: {prefix}")
+        console.print(f"  Cache: {self.cache_dir} (up to {cache_max_mb} MB)")
     
     def cleanup(self):
-        """Clean up temp files"""
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+        """Stop download threads. The on-disk cache is kept for the next run."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self._recordings.clear()
     
     def list_recordings(self):
         """List recordings from S3"""
@@ -771,68 +961,175 @@ class S3DataSource(DataSource):
             console.print(f"[dim]Error getting metadata: {e}[/dim]")
             return {}
     
+    def _cache_path(self, key, etag):
+        """Cache file for the parsed events of one version of a batch file"""
+        digest = hashlib.sha256(f"{self.bucket}/{key}/{etag}".encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+    
+    def _get_range(self, key, etag, byte_range=None):
+        """Download an object, or one byte range of it, as bytes"""
+        params = {'Bucket': self.bucket, 'Key': key, 'IfMatch': etag}
+        if byte_range:
+            params['Range'] = byte_range
+        return self.s3_client.get_object(**params)['Body'].read()
+    
+    def _download_parts(self, obj):
+        """Start downloading an object and return futures of its parts in order"""
+        size = obj['Size']
+        if size <= RANGE_PART_SIZE:
+            return [self.executor.submit(self._get_range, obj['Key'], obj['ETag'])]
+        return [
+            self.executor.submit(
+                self._get_range, obj['Key'], obj['ETag'],
+                f"bytes={start}-{min(start + RANGE_PART_SIZE, size) - 1}"
+            )
+            for start in range(0, size, RANGE_PART_SIZE)
+        ]
+    
+    def _parse_batch(self, filename, parts):
+        """Parse the rrweb events of a gzipped NDJSON batch as its parts arrive"""
+        events = []
+        for line in iter_gzip_lines(part.result() for part in parts):
+            if not line.strip():
+                continue
+            try:
+                event_data = json.loads(line)
+            except json.JSONDecodeError:
+                console.print(f"[yellow]Warning: Invalid JSON in line: {line[:50]}...[/yellow]")
+                continue
+            # Validate event structure for rrweb
+            if 'type' in event_data and 'timestamp' in event_data:
+                events.append(event_data)
+            else:
+                console.print(f"[yellow]Skipping invalid event: missing required fields[/yellow]")
+        # Batches are merged by timestamp, so each must be sorted on its own
+        events.sort(key=lambda event: event['timestamp'])
+        return events
+    
+    def _load_batch(self, obj, parts):
+        """
+        Get a batch file's events from the cache, or parse and cache them.
+        Returns (events, loaded), where loaded is False if the file failed.
+        """
+        filename = obj['Key'].split('/')[-1]
+        cache_path = self._cache_path(obj['Key'], obj['ETag'])
+        if parts is None:
+            try:
+                with open(cache_path, 'r') as f:
+                    events = json.load(f)
+                # Mark as recently used for cache eviction
+                os.utime(cache_path)
+                return events, True
+            except (OSError, ValueError) as e:
+                console.print(f"[yellow]Warning: Discarding unreadable cache of {filename}: {e}[/yellow]")
+                cache_path.unlink(missing_ok=True)
+                return [], False
+        
+        try:
+            events = self._parse_batch(filename, parts)
+        except Exception as e:
+            console.print(f"[yellow]Warning: Error processing batch file {filename}: {e}[/yellow]")
+            return [], False
+        
+        # Write atomically so a concurrent reader never sees a partial file
+        tmp_path = cache_path.with_suffix(f".{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(events, f, separators=(',', ':'))
+        os.replace(tmp_path, cache_path)
+        return events, True
+    
+    def _prune_cache(self):
+        """Delete the least recently used cache files beyond cache_max_bytes"""
+        entries = []
+        for path in self.cache_dir.glob('*.json'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        if total <= self.cache_max_bytes:
+            return
+        
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.cache_max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        console.print(f"[dim]Pruned replay cache to {total // (1024 * 1024)} MB[/dim]")
+    
     def download_recording(self, recording_id):
         """Download recording from S3"""
-        console.print(f"[cyan]Downloading recording: {recording_id}[/cyan]")
-        
-        recording_dir = self.temp_dir / recording_id
-        recording_dir.mkdir(exist_ok=True)
+        console.print(f"[cyan]Loading recording: {recording_id}[/cyan]")
         
         try:
+            # List files for this recording
+            prefix = f"{self.prefix}/{recording_id}/" if self.prefix else f"{recording_id}/"
+            console.print(f"Looking for files with prefix: {prefix}")
+            
+            paginator = self.s3_client.get_paginator('list_objects_v2')
+            
+            objects = []
+            for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+                if 'Contents' in page:
+                    objects.extend(page['Contents'])
+            objects.sort(key=lambda obj: obj['Key'])
+            
+            # Reuse the loaded recording if none of its files changed
+            signature = tuple((obj['Key'], obj['ETag']) for obj in objects)
+            with self._lock:
+                cached = self._recordings.get(recording_id)
+                if cached:
+                    self._recordings.move_to_end(recording_id)
+            if cached and cached[0] == signature:
+                console.print(f"[green]✓ Using loaded recording ({len(cached[1]['events'])} events)[/green]")
+                return cached[1]
+            
+            metadata_obj = None
+            batches = []
+            for obj in objects:
+                filename = obj['Key'].split('/')[-1]
+                if filename == 'metadata.json':
+                    metadata_obj = obj
+                elif filename.startswith('batch-') and (filename.endswith('.ndjson.gz') or filename.endswith('.jsonl.gz')):
+                    batches.append(obj)
+            
+            # Start every download up front; cached batch files aren't downloaded
+            metadata_parts = self._download_parts(metadata_obj) if metadata_obj else None
+            batch_parts = [
+                None if self._cache_path(obj['Key'], obj['ETag']).exists() else self._download_parts(obj)
+                for obj in batches
+            ]
+            downloads = sum(1 for parts in batch_parts if parts is not None)
+            console.print(f"Loading {len(batches)} batch files ({len(batches) - downloads} cached, {downloads} to download)")
+            
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
                 console=console
             ) as progress:
+                task = progress.add_task(f"Loading {len(batches)} batch files...", total=len(batches))
                 
-                # List files for this recording
-                prefix = f"{self.prefix}/{recording_id}/" if self.prefix else f"{recording_id}/"
-                console.print(f"Looking for files with prefix: {prefix}")
-                
-                paginator = self.s3_client.get_paginator('list_objects_v2')
-                
-                files_to_download = []
-                for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
-                    if 'Contents' in page:
-                        for obj in page['Contents']:
-                            files_to_download.append(obj['Key'])
-                
-                # Download files
-                console.print(f"Downloading {len(files_to_download)} files")
-                task = progress.add_task(f"Downloading {len(files_to_download)} files...", total=len(files_to_download))
-                
-                all_events = []
                 metadata = {}
+                if metadata_parts:
+                    metadata = json.loads(b''.join(part.result() for part in metadata_parts).decode('utf-8'))
                 
-                for key in files_to_download:
-                    filename = key.split('/')[-1]
-                    local_path = recording_dir / filename
-                    
-                    self.s3_client.download_file(self.bucket, key, str(local_path))
+                batch_events = []
+                failed = 0
+                for obj, parts in zip(batches, batch_parts):
+                    events, loaded = self._load_batch(obj, parts)
+                    batch_events.append(events)
+                    failed += not loaded
                     progress.advance(task)
-                    
-                    # Process file
-                    if filename == 'metadata.json':
-                        with open(local_path, 'r') as f:
-                            metadata = json.load(f)
-                    elif filename.startswith('batch-') and (filename.endswith('.ndjson.gz') or filename.endswith('.jsonl.gz')):
-                        try:
-                            with gzip.open(local_path, 'rt') as f:
-                                for line in f:
-                                    if line.strip():
-                                        try:
-                                            event_data = json.loads(line)
-                                            # Validate event structure for rrweb
-                                            if 'type' in event_data and 'timestamp' in event_data:
-                                                all_events.append(event_data)
-                                            else:
-                                                console.print(f"[yellow]Skipping invalid event: missing required fields[/yellow]")
-                                        except json.JSONDecodeError as e:
-                                            console.print(f"[yellow]Warning: Invalid JSON in line: {line[:50]}...[/yellow]")
-                        except Exception as e:
-                            console.print(f"[yellow]Warning: Error processing batch file {filename}: {e}[/yellow]")
-            
-            console.print(f"[green]✓ Downloaded {len(all_events)} events[/green]")
+            
+            if downloads:
+                self._prune_cache()
+            
+            # Merge the sorted batches into one timestamp-ordered event list
+            all_events = list(heapq.merge(*batch_events, key=lambda event: event['timestamp']))
+            
+            console.print(f"[green]✓ Loaded {len(all_events)} events[/green]")
             
             # If no events were parsed, check the files
             if len(all_events) == 0:
@@ -880,15 +1177,25 @@ class S3DataSource(DataSource):
                     }
                 ]
                 
-                # List downloaded files for debugging
-                console.print("Downloaded files:")
-                for path in recording_dir.iterdir():
-                    console.print(f"  - {path.name} ({path.stat().st_size} bytes)")
+                # List recording files for debugging
+                console.print("Recording files:")
+                for obj in objects:
+                    console.print(f"  - {obj['Key'].split('/')[-1]} ({obj['Size']} bytes)")
             
-            return {
+            recording = {
                 'metadata': metadata,
                 'events': all_events
             }
+            if failed:
+                # Serve what loaded, but retry the failed files next time
+                console.print(f"[yellow]Warning: {failed} of {len(batches)} batch files failed to load; recording is incomplete and won't be cached[/yellow]")
+            else:
+                with self._lock:
+                    self._recordings[recording_id] = (signature, recording)
+                    self._recordings.move_to_end(recording_id)
+                    while len(self._recordings) > MAX_LOADED_RECORDINGS:
+                        self._recordings.popitem(last=False)
+            return recording
             
         except Exception as e:
             console.print(f"[red]Error downloading recording: {e}[/red]")
@@ -929,8 +1236,9 @@ class SessionReplayViewer:
         def handler_factory(*args, **kwargs):
             return SessionReplayHandler(self.data_source, self.viewer_path, *args, **kwargs)
         
-        # Start server
-        self.server = HTTPServer(('', port), handler_factory)
+        # Start server; each request gets its own thread so a long recording
+        # download doesn't block the page or other requests
+        self.server = ThreadingHTTPServer(('', port), handler_factory)
         
         # Start in thread
         server_thread = threading.Thread(target=self.server.serve_forever)
@@ -995,6 +1303,17 @@ def main():
         default=8080,
         help='Port to run server on (default: 8080)'
     )
+    parser.add_argument(
+        '--cache-dir',
+        default=os.environ.get('REPLAY_CACHE_DIR'),
+        help=f'Directory caching parsed S3 batch files (default: {DEFAULT_CACHE_DIR})'
+    )
+    parser.add_argument(
+        '--cache-max-mb',
+        type=int,
+        default=int(os.environ.get('REPLAY_CACHE_MAX_MB', DEFAULT_CACHE_MAX_MB)),
+        help=f'Maximum size of the batch file cache in MB (default: {DEFAULT_CACHE_MAX_MB})'
+    )
     
     args = parser.parse_args()
     
@@ -1011,7 +1330,9 @@ def main():
         bucket = path_parts[0]
         prefix = path_parts[1] if len(path_parts) > 1 else ''
         
-        data_source = S3DataSource(bucket, prefix)
+        data_source = S3DataSource(
+            bucket, prefix, cache_dir=args.cache_dir, cache_max_mb=args.cache_max_mb
+        )
     
     # Start viewer
     viewer = SessionReplayViewer(data_source, port=args.port)
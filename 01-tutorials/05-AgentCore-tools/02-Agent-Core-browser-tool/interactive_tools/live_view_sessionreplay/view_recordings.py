@@ -32,7 +32,7 @@ import io
 import argparse
 from pathlib import Path
 from datetime import datetime
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 
 import boto3
 from rich.console import Console
@@ -348,7 +348,7 @@ class CustomSessionReplayViewer(SessionReplayViewer):
             return CustomSessionReplayHandler(self.data_source, self.viewer_path, *args, **kwargs)
         
         # Start server
-        self.server = HTTPServer(('', port), handler_factory)
+        self.server = ThreadingHTTPServer(('', port), handler_factory)
         
         # Start in thread
         server_thread = threading.Thread(target=self.server.serve_forever)
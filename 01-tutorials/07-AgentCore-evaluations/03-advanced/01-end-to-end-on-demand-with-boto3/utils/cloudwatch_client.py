@@ -2,7 +2,8 @@
 
 import logging
 import time
-from typing import List
+from collections import deque
+from typing import List, Optional, Tuple
 
 import boto3
 
@@ -91,7 +92,18 @@ class ObservabilityClient:
 
     SPANS_LOG_GROUP = "aws/spans"
     QUERY_TIMEOUT_SECONDS = 60
+    # Polling starts fast and backs off to POLL_INTERVAL_SECONDS
+    MIN_POLL_INTERVAL_SECONDS = 0.25
     POLL_INTERVAL_SECONDS = 2
+    POLL_BACKOFF = 1.5
+    # Rows returned per query; a full page means the time range is bisected
+    QUERY_RESULT_LIMIT = 10000
+    MAX_CONCURRENT_QUERIES = 8
+    # Long time ranges are split into slices of this size and queried concurrently
+    QUERY_SLICE_SECONDS = 24 * 60 * 60
+    TRACE_IDS_PER_QUERY = 100
+    # Padding around the session's spans when querying its runtime logs
+    LOG_WINDOW_MARGIN_MS = 5 * 60 * 1000
 
     def __init__(
         self,
@@ -175,17 +187,22 @@ class ObservabilityClient:
 
         self.logger.info("Querying runtime logs for %d traces", len(trace_ids))
 
-        query_string = self.query_builder.build_runtime_logs_by_traces_batch(trace_ids)
+        queries = [
+            (
+                self.query_builder.build_runtime_logs_by_traces_batch(trace_ids[i : i + self.TRACE_IDS_PER_QUERY]),
+                self.runtime_log_group,
+                start_time_ms,
+                end_time_ms,
+            )
+            for i in range(0, len(trace_ids), self.TRACE_IDS_PER_QUERY)
+        ]
 
         try:
-            results = self._execute_cloudwatch_query(
-                query_string=query_string,
-                log_group_name=self.runtime_log_group,
-                start_time=start_time_ms,
-                end_time=end_time_ms,
-            )
+            batches = self._execute_cloudwatch_queries(queries)
 
-            logs = [RuntimeLog.from_cloudwatch_result(result) for result in results]
+            logs = [RuntimeLog.from_cloudwatch_result(result) for results in batches for result in results]
+            if len(batches) > 1:
+                logs.sort(key=lambda log: log.timestamp)
             self.logger.info("Found %d runtime logs across %d traces", len(logs), len(trace_ids))
             return logs
 
@@ -223,7 +240,10 @@ class ObservabilityClient:
         if include_runtime_logs:
             trace_ids = session_data.get_trace_ids()
             if trace_ids:
-                runtime_logs = self.query_runtime_logs_by_traces(trace_ids, start_time_ms, end_time_ms)
+                # Runtime logs are written while the spans run, so only their
+                # time range needs to be searched
+                logs_start_ms, logs_end_ms = self._get_spans_time_range(spans, start_time_ms, end_time_ms)
+                runtime_logs = self.query_runtime_logs_by_traces(trace_ids, logs_start_ms, logs_end_ms)
                 session_data.runtime_logs = runtime_logs
 
         self.logger.info(
@@ -235,6 +255,39 @@ class ObservabilityClient:
 
         return session_data
 
+    def _get_spans_time_range(self, spans: List[Span], start_time_ms: int, end_time_ms: int) -> Tuple[int, int]:
+        """Get the time range covered by spans, padded and clipped to the query window.
+
+        Args:
+            spans: Spans of the session
+            start_time_ms: Start of the query window in milliseconds since epoch
+            end_time_ms: End of the query window in milliseconds since epoch
+
+        Returns:
+            Tuple of (start_time_ms, end_time_ms), the full window if spans have no timestamps
+        """
+        times_ns = []
+        for span in spans:
+            if span.start_time_unix_nano:
+                times_ns.append(span.start_time_unix_nano)
+            end_time_ns = span.raw_message.get("endTimeUnixNano") if isinstance(span.raw_message, dict) else None
+            if end_time_ns:
+                try:
+                    times_ns.append(int(end_time_ns))
+                except (ValueError, TypeError):
+                    pass
+        if not times_ns:
+            return start_time_ms, end_time_ms
+
+        spans_start_ms = min(times_ns) // 1_000_000 - self.LOG_WINDOW_MARGIN_MS
+        spans_end_ms = max(times_ns) // 1_000_000 + self.LOG_WINDOW_MARGIN_MS
+        narrowed = (max(start_time_ms, spans_start_ms), min(end_time_ms, spans_end_ms))
+        if narrowed[0] > narrowed[1]:
+            return start_time_ms, end_time_ms
+
+        self.logger.debug("Narrowed runtime log window to %s-%s", *narrowed)
+        return narrowed
+
     def _execute_cloudwatch_query(
         self,
         query_string: str,
@@ -257,36 +310,130 @@ class ObservabilityClient:
             TimeoutError: If query doesn't complete within timeout
             Exception: If query fails
         """
-        self.logger.debug("Starting CloudWatch query on log group: %s", log_group_name)
+        return self._execute_cloudwatch_queries([(query_string, log_group_name, start_time, end_time)])[0]
 
-        try:
-            response = self.logs_client.start_query(
-                logGroupName=log_group_name,
-                startTime=start_time // 1000,
-                endTime=end_time // 1000,
-                queryString=query_string,
-            )
-        except self.logs_client.exceptions.ResourceNotFoundException as e:
-            self.logger.error("Log group not found: %s", log_group_name)
-            raise Exception(f"Log group not found: {log_group_name}") from e
+    def _execute_cloudwatch_queries(self, queries: List[Tuple[str, str, int, int]]) -> List[list]:
+        """Execute several CloudWatch Logs Insights queries concurrently.
 
-        query_id = response["queryId"]
-        self.logger.debug("Query started with ID: %s", query_id)
+        Each query's time range is split into slices of QUERY_SLICE_SECONDS,
+        and a slice whose results fill QUERY_RESULT_LIMIT is bisected and
+        queried again, so no rows are silently dropped. Up to
+        MAX_CONCURRENT_QUERIES run at once, polled with backoff.
 
-        start_poll_time = time.time()
-        while True:
-            elapsed = time.time() - start_poll_time
-            if elapsed > self.QUERY_TIMEOUT_SECONDS:
-                raise TimeoutError(f"Query {query_id} timed out after {self.QUERY_TIMEOUT_SECONDS} seconds")
+        Args:
+            queries: List of (query_string, log_group_name, start_time_ms, end_time_ms)
 
-            result = self.logs_client.get_query_results(queryId=query_id)
-            status = result["status"]
+        Returns:
+            List of result dictionaries per query, in time order of the slices
 
-            if status == "Complete":
-                results = result.get("results", [])
-                self.logger.debug("Query completed with %d results", len(results))
-                return results
-            elif status == "Failed" or status == "Cancelled":
-                raise Exception(f"Query {query_id} failed with status: {status}")
+        Raises:
+            TimeoutError: If a query doesn't complete within timeout
+            Exception: If a query fails
+        """
+        # Insights time ranges are inclusive whole seconds, so slices are
+        # [start, mid] and [mid + 1, end]
+        roots = []
+        pending = deque()
+        for query_string, log_group_name, start_time_ms, end_time_ms in queries:
+            root = []
+            roots.append(root)
+            start_s, end_s = start_time_ms // 1000, end_time_ms // 1000
+            for slice_start in range(start_s, end_s + 1, self.QUERY_SLICE_SECONDS):
+                piece = _QueryPiece(
+                    query_string, log_group_name, slice_start, min(slice_start + self.QUERY_SLICE_SECONDS - 1, end_s)
+                )
+                root.append(piece)
+                pending.append(piece)
+
+        running = {}
+        poll_interval = self.MIN_POLL_INTERVAL_SECONDS
+        try:
+            while pending or running:
+                while pending and len(running) < self.MAX_CONCURRENT_QUERIES:
+                    piece = pending.popleft()
+                    running[self._start_query(piece)] = piece
+
+                time.sleep(poll_interval)
+                poll_interval = min(poll_interval * self.POLL_BACKOFF, self.POLL_INTERVAL_SECONDS)
+
+                for query_id, piece in list(running.items()):
+                    result = self.logs_client.get_query_results(queryId=query_id)
+                    status = result["status"]
+
+                    if status == "Complete":
+                        del running[query_id]
+                        piece.results = result.get("results", [])
+                        self.logger.debug("Query %s completed with %d results", query_id, len(piece.results))
+                        if len(piece.results) >= self.QUERY_RESULT_LIMIT:
+                            if piece.start_s < piece.end_s:
+                                piece.children = piece.split()
+                                pending.extend(piece.children)
+                                poll_interval = self.MIN_POLL_INTERVAL_SECONDS
+                                self.logger.debug("Query %s hit the result limit, bisecting its time range", query_id)
+                            else:
+                                self.logger.warning(
+                                    "Query on %s returned %d results within one second; results may be truncated",
+                                    piece.log_group_name,
+                                    len(piece.results),
+                                )
+                    elif status in ("Failed", "Cancelled", "Timeout"):
+                        del running[query_id]
+                        raise Exception(f"Query {query_id} failed with status: {status}")
+                    elif time.time() - piece.started_at > self.QUERY_TIMEOUT_SECONDS:
+                        raise TimeoutError(f"Query {query_id} timed out after {self.QUERY_TIMEOUT_SECONDS} seconds")
+        except BaseException:
+            for query_id in running:
+                try:
+                    self.logs_client.stop_query(queryId=query_id)
+                except Exception:
+                    pass
+            raise
+
+        return [[row for piece in root for row in piece.collect()] for root in roots]
+
+    def _start_query(self, piece: "_QueryPiece") -> str:
+        """Start a query for one time slice and return its query ID."""
+        self.logger.debug("Starting CloudWatch query on log group: %s", piece.log_group_name)
 
-            time.sleep(self.POLL_INTERVAL_SECONDS)
+        try:
+            response = self.logs_client.start_query(
+                logGroupName=piece.log_group_name,
+                startTime=piece.start_s,
+                endTime=piece.end_s,
+                queryString=piece.query_string,
+                limit=self.QUERY_RESULT_LIMIT,
+            )
+        except self.logs_client.exceptions.ResourceNotFoundException as e:
+            self.logger.error("Log group not found: %s", piece.log_group_name)
+            raise Exception(f"Log group not found: {piece.log_group_name}") from e
+
+        piece.started_at = time.time()
+        self.logger.debug("Query started with ID: %s", response["queryId"])
+        return response["queryId"]
+
+
+class _QueryPiece:
+    """One time slice of a Logs Insights query, bisected when it hits the result limit."""
+
+    def __init__(self, query_string: str, log_group_name: str, start_s: int, end_s: int):
+        self.query_string = query_string
+        self.log_group_name = log_group_name
+        self.start_s = start_s
+        self.end_s = end_s
+        self.started_at = 0.0
+        self.results: list = []
+        self.children: Optional[List["_QueryPiece"]] = None
+
+    def split(self) -> List["_QueryPiece"]:
+        """Split the time range into two halves that don't overlap."""
+        mid = (self.start_s + self.end_s) // 2
+        return [
+            _QueryPiece(self.query_string, self.log_group_name, self.start_s, mid),
+            _QueryPiece(self.query_string, self.log_group_name, mid + 1, self.end_s),
+        ]
+
+    def collect(self) -> list:
+        """Get the results of this slice, taken from its halves if it was bisected."""
+        if self.children is None:
+            return self.results
+        return [row for child in self.children for row in child.collect()]
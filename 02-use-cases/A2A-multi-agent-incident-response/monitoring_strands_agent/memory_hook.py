@@ -1,6 +1,11 @@
 # import the memory client
+import hashlib
 import logging
-from typing import Dict, List
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
 from bedrock_agentcore.memory import MemoryClient
 from strands.hooks import (
     AgentInitializedEvent,
@@ -14,6 +19,65 @@ from strands.hooks import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger()
 
+# Seconds a namespace lookup is reused for the same actor and query
+MEMORY_CACHE_TTL_SECONDS = 60
+MEMORY_CACHE_MAX_ENTRIES = 256
+
+# Seconds to wait for a namespace before answering without it
+NAMESPACE_TIMEOUT_SECONDS = 3.0
+MAX_RETRIEVAL_WORKERS = 8
+
+_retrieval_executor = ThreadPoolExecutor(
+    max_workers=MAX_RETRIEVAL_WORKERS, thread_name_prefix="memory-retrieval"
+)
+
+
+class MemoryResultCache:
+    """Short-lived cache of filtered long-term memory lookups"""
+
+    def __init__(
+        self,
+        ttl_seconds: float = MEMORY_CACHE_TTL_SECONDS,
+        max_entries: int = MEMORY_CACHE_MAX_ENTRIES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple, Tuple[float, List[Dict]]]" = OrderedDict()
+
+    @staticmethod
+    def key(
+        memory_id: str,
+        actor_id: str,
+        namespace: str,
+        query: str,
+        top_k: int,
+        relevance_score: float,
+    ) -> Tuple:
+        query_hash = hashlib.sha256(query.encode("utf-8")).hexdigest()
+        return (memory_id, actor_id, namespace, query_hash, top_k, relevance_score)
+
+    def get(self, key: Tuple) -> Optional[List[Dict]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: Tuple, memories: List[Dict]) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), memories)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+memory_cache = MemoryResultCache()
+
 
 # Retrieval configuration class
 class RetrievalConfig:
@@ -45,6 +109,70 @@ class MonitoringMemoryHooks(HookProvider):
             "/knowledge/{actorId}": RetrievalConfig(top_k=5, relevance_score=0.2),
         }
 
+    def _retrieve_namespace(
+        self, namespace: str, query: str, config: RetrievalConfig
+    ) -> List[Dict]:
+        """Retrieve memories above the relevance score from one namespace"""
+        key = MemoryResultCache.key(
+            self.memory_id,
+            self.actor_id,
+            namespace,
+            query,
+            config.top_k,
+            config.relevance_score,
+        )
+        filtered_memories = memory_cache.get(key)
+        if filtered_memories is None:
+            memories = self.client.retrieve_memories(
+                memory_id=self.memory_id,
+                namespace=namespace,
+                query=query,
+                top_k=config.top_k,
+            )
+            # Filter by relevance score once, cached results are already filtered
+            filtered_memories = [
+                memory
+                for memory in memories
+                if memory.get("score", 0) >= config.relevance_score
+            ]
+            memory_cache.put(key, filtered_memories)
+        return filtered_memories
+
+    def retrieve_namespaces(self, query: str) -> List[Dict]:
+        """Search all long-term memory namespaces concurrently.
+
+        Namespaces that fail or take longer than NAMESPACE_TIMEOUT_SECONDS are
+        skipped for this query; a late result is still cached for the next one.
+        """
+        futures = {}
+        for namespace_template, config in self.retrieval_config.items():
+            # Resolve namespace template with actual actor ID
+            resolved_namespace = namespace_template.format(actorId=self.actor_id)
+            future = _retrieval_executor.submit(
+                self._retrieve_namespace, resolved_namespace, query, config
+            )
+            futures[future] = resolved_namespace
+
+        wait(futures, timeout=NAMESPACE_TIMEOUT_SECONDS)
+
+        relevant_memories = []
+        for future, namespace in futures.items():
+            if not future.done():
+                logger.warning(
+                    f"Memory retrieval from {namespace} timed out after {NAMESPACE_TIMEOUT_SECONDS}s"
+                )
+                continue
+            try:
+                filtered_memories = future.result()
+            except Exception as e:
+                logger.error(f"Failed to retrieve memories from {namespace}: {e}")
+                continue
+            relevant_memories.extend(filtered_memories)
+            logger.info(
+                f"Found {len(filtered_memories)} relevant memories in {namespace}"
+            )
+        return relevant_memories
+
     def retrieve_monitoring_context(self, event: MessageAddedEvent):
         """Retrieve long-term monitoring context before processing queries"""
         messages = event.agent.messages
@@ -56,33 +184,7 @@ class MonitoringMemoryHooks(HookProvider):
 
             try:
                 # Search across different long-term memory namespaces
-                relevant_memories = []
-
-                for namespace_template, config in self.retrieval_config.items():
-                    # Resolve namespace template with actual actor ID
-                    resolved_namespace = namespace_template.format(
-                        actorId=self.actor_id
-                    )
-
-                    # Retrieve memories from this namespace
-                    memories = self.client.retrieve_memories(
-                        memory_id=self.memory_id,
-                        namespace=resolved_namespace,
-                        query=user_query,
-                        top_k=config.top_k,
-                    )
-
-                    # Filter by relevance score
-                    filtered_memories = [
-                        memory
-                        for memory in memories
-                        if memory.get("score", 0) >= config.relevance_score
-                    ]
-
-                    relevant_memories.extend(filtered_memories)
-                    logger.info(
-                        f"Found {len(filtered_memories)} relevant memories in {resolved_namespace}"
-                    )
+                relevant_memories = self.retrieve_namespaces(user_query)
 
                 # Inject context into agent's system prompt if memories found
                 if relevant_memories:
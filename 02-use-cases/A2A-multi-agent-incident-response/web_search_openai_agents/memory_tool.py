@@ -1,14 +1,72 @@
 # Memory Tools for OpenAI Agents
 # Based on the MonitoringMemoryHooks functionality
 
+import hashlib
 import logging
+import threading
 import time
-from typing import Dict, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
 from bedrock_agentcore.memory import MemoryClient
 from agents import function_tool
 
 logger = logging.getLogger(__name__)
 
+# Seconds a namespace lookup is reused for the same actor and query
+MEMORY_CACHE_TTL_SECONDS = 60
+MEMORY_CACHE_MAX_ENTRIES = 256
+
+# Seconds to wait for a namespace before answering without it
+NAMESPACE_TIMEOUT_SECONDS = 3.0
+MAX_RETRIEVAL_WORKERS = 8
+
+_retrieval_executor = ThreadPoolExecutor(
+    max_workers=MAX_RETRIEVAL_WORKERS, thread_name_prefix="memory-retrieval"
+)
+
+
+class MemoryResultCache:
+    """Short-lived cache of long-term memory lookups"""
+
+    def __init__(
+        self,
+        ttl_seconds: float = MEMORY_CACHE_TTL_SECONDS,
+        max_entries: int = MEMORY_CACHE_MAX_ENTRIES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple, Tuple[float, List[str]]]" = OrderedDict()
+
+    @staticmethod
+    def key(
+        memory_id: str, actor_id: str, namespace: str, query: str, top_k: int
+    ) -> Tuple:
+        query_hash = hashlib.sha256(query.encode("utf-8")).hexdigest()
+        return (memory_id, actor_id, namespace, query_hash, top_k)
+
+    def get(self, key: Tuple) -> Optional[List[str]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: Tuple, texts: List[str]) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), texts)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+memory_cache = MemoryResultCache()
+
 
 class AgentMemoryTools:
     """Memory tools for OpenAI agents based on MonitoringMemoryHooks functionality"""
@@ -36,10 +94,65 @@ class AgentMemoryTools:
             logger.error(f"Failed to get namespaces: {e}")
             return {}
 
+    def _retrieve_namespace(self, namespace: str, query: str, top_k: int) -> List[str]:
+        """Retrieve the text of matching memories from one namespace"""
+        resolved_namespace = namespace.format(actorId=self.actor_id)
+        key = MemoryResultCache.key(
+            self.memory_id, self.actor_id, resolved_namespace, query, top_k
+        )
+        texts = memory_cache.get(key)
+        if texts is None:
+            memories = self.client.retrieve_memories(
+                memory_id=self.memory_id,
+                namespace=resolved_namespace,
+                query=query,
+                top_k=top_k,
+            )
+            texts = []
+            for memory in memories:
+                if isinstance(memory, dict):
+                    content = memory.get("content", {})
+                    if isinstance(content, dict):
+                        text = content.get("text", "").strip()
+                        if text:
+                            texts.append(text)
+            memory_cache.put(key, texts)
+        return texts
+
+    def retrieve_namespaces(
+        self, namespaces: Dict[str, str], query: str, top_k: int
+    ) -> Dict[str, List[str]]:
+        """Search several namespaces concurrently, keyed by context type.
+
+        Namespaces that fail or take longer than NAMESPACE_TIMEOUT_SECONDS are
+        skipped for this query; a late result is still cached for the next one.
+        """
+        futures = {
+            _retrieval_executor.submit(
+                self._retrieve_namespace, namespace, query, top_k
+            ): ctx_type
+            for ctx_type, namespace in namespaces.items()
+        }
+        wait(futures, timeout=NAMESPACE_TIMEOUT_SECONDS)
+
+        results = {}
+        for future, ctx_type in futures.items():
+            if not future.done():
+                logger.warning(
+                    f"Memory retrieval for {ctx_type} timed out after {NAMESPACE_TIMEOUT_SECONDS}s"
+                )
+                continue
+            try:
+                results[ctx_type] = future.result()
+            except Exception as e:
+                logger.error(f"Failed to retrieve memories for {ctx_type}: {e}")
+        return results
+
     def create_memory_tools(self):
         """Create and return all memory-related tools for the agent"""
 
         # Capture self in closure for tool functions
+        memory_tools = self
         memory_id = self.memory_id
         client = self.client
         actor_id = self.actor_id
@@ -70,22 +183,13 @@ class AgentMemoryTools:
                     # Search all namespaces
                     search_namespaces = namespaces
 
-                for ctx_type, namespace in search_namespaces.items():
-                    # We will retrieve memories for the given namespaces if any
-                    memories = client.retrieve_memories(
-                        memory_id=memory_id,
-                        namespace=namespace.format(actorId=actor_id),
-                        query=query,
-                        top_k=top_k,
-                    )
-
-                    for memory in memories:
-                        if isinstance(memory, dict):
-                            content = memory.get("content", {})
-                            if isinstance(content, dict):
-                                text = content.get("text", "").strip()
-                                if text:
-                                    all_context.append(f"[{ctx_type.upper()}] {text}")
+                # We will retrieve memories for the given namespaces concurrently
+                results = memory_tools.retrieve_namespaces(
+                    search_namespaces, query, top_k
+                )
+                for ctx_type in search_namespaces:
+                    for text in results.get(ctx_type, []):
+                        all_context.append(f"[{ctx_type.upper()}] {text}")
 
                 if all_context:
                     context_text = "\n".join(all_context)
@@ -217,23 +321,10 @@ class AgentMemoryTools:
                     available = ", ".join(namespaces.keys())
                     return f"Invalid namespace type. Available types: {available}"
 
-                namespace = namespaces[namespace_type]
-                memories = client.retrieve_memories(
-                    memory_id=memory_id,
-                    namespace=namespace.format(actorId=actor_id),
-                    query=query,
-                    top_k=top_k,
+                results = memory_tools._retrieve_namespace(
+                    namespaces[namespace_type], query, top_k
                 )
 
-                results = []
-                for memory in memories:
-                    if isinstance(memory, dict):
-                        content = memory.get("content", {})
-                        if isinstance(content, dict):
-                            text = content.get("text", "").strip()
-                            if text:
-                                results.append(text)
-
                 if results:
                     return (
                         f"Found {len(results)} results in {namespace_type}:\n"
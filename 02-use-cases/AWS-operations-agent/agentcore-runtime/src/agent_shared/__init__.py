@@ -10,6 +10,7 @@ Modules:
 - mcp: MCP client management  
 - memory: AgentCore Memory integration
 - responses: Response formatting utilities
+- runtime_context: Per-process config, token and MCP session reuse
 """
 
 __version__ = "1.0.0"
\ No newline at end of file
@@ -2,7 +2,11 @@
 # IMPORTS
 # ============================================================================
 
+import base64
+import json
 import logging
+import threading
+import time
 from .config import get_oauth_settings
 from . import mylogger
  
@@ -12,6 +16,16 @@ logger = mylogger.get_logger()
 _oauth_initialized = False
 _token_getter = None
 
+# Cached M2M token and when it expires (epoch seconds)
+_cached_token = None
+_cached_token_expires_at = 0.0
+_token_lock = threading.Lock()
+
+# Tokens are refreshed this long before they expire
+TOKEN_REFRESH_MARGIN_SECONDS = 300
+# Lifetime assumed for tokens whose expiry can't be read
+DEFAULT_TOKEN_TTL_SECONDS = 3000
+
 # ============================================================================
 # OAUTH SETUP
 # ============================================================================
@@ -127,6 +141,56 @@ def get_m2m_token():
         logger.error(f"❌ Full traceback: {traceback.format_exc()}")
         return None
 
+def get_cached_m2m_token():
+    """
+    Get M2M token for gateway access, reusing the cached token until shortly
+    before it expires.
+    
+    Returns:
+        str: OAuth token or None if not available
+    """
+    global _cached_token, _cached_token_expires_at
+    
+    with _token_lock:
+        now = time.time()
+        if _cached_token and now < _cached_token_expires_at - TOKEN_REFRESH_MARGIN_SECONDS:
+            return _cached_token
+        
+        token = get_m2m_token()
+        if token:
+            _cached_token = token
+            _cached_token_expires_at = _get_token_expiry(token)
+            logger.info(f"🔑 M2M token cached for {_cached_token_expires_at - now:.0f} seconds")
+            return token
+        
+        # Keep using the old token while it is still valid
+        if _cached_token and now < _cached_token_expires_at:
+            logger.warning("⚠️ Token refresh failed - using cached token until it expires")
+            return _cached_token
+        return None
+
+def invalidate_m2m_token():
+    """Drop the cached M2M token, e.g. after the gateway rejected it."""
+    global _cached_token, _cached_token_expires_at
+    
+    with _token_lock:
+        _cached_token = None
+        _cached_token_expires_at = 0.0
+
+def _get_token_expiry(token):
+    """
+    Read the expiry of a JWT access token without verifying it.
+    
+    Returns:
+        float: Expiry in epoch seconds, or a default lifetime from now
+    """
+    try:
+        payload = token.split('.')[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+        return float(claims['exp'])
+    except Exception:
+        return time.time() + DEFAULT_TOKEN_TTL_SECONDS
+
 # ============================================================================
 # ERROR HANDLING
 # ============================================================================
@@ -18,8 +18,11 @@ def load_configs():
     """
     Load configuration using unified AgentCore configuration system.
     
+    The configuration is parsed once per process and reloaded only when the
+    config files change, so this is cheap to call on every request.
+    
     Returns:
-        tuple: (merged_config, okta_config) - Two dictionaries with config data
+        tuple: (merged_config, okta_config) - Two read-only mappings with config data
     """
     try:
         # Import the unified config manager
@@ -33,14 +36,11 @@ def load_configs():
         # Initialize config manager
         config_manager = AgentCoreConfigManager()
         
-        # Get merged configuration (static + dynamic)
-        merged_config = config_manager.get_merged_config()
-        
-        # Get OAuth settings
-        okta_config = config_manager.get_oauth_settings()
+        # Shared immutable snapshot of the merged configuration (static + dynamic)
+        snapshot = config_manager.snapshot()
         
-        logger.info("✅ Loaded configuration using unified AgentCore config system")
-        return merged_config, okta_config
+        logger.debug("✅ Loaded configuration using unified AgentCore config system")
+        return snapshot.merged, snapshot.section('okta')
         
     except Exception as e:
         logger.error(f"❌ Failed to load unified configuration: {e}")
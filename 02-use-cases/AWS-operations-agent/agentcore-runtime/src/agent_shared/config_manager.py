@@ -4,16 +4,149 @@ Unified configuration management for all AgentCore consumers
 """
 
 import os
+import threading
+import time
 import yaml
 import logging
-from typing import Dict, Any, List, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from pathlib import Path
 from . import mylogger
  
 logger = mylogger.get_logger()
 
+STATIC_CONFIG_PATH = "config/static-config.yaml"
+DYNAMIC_CONFIG_PATH = "config/dynamic-config.yaml"
+
+# Config files are checked for changes at most this often
+CONFIG_RELOAD_CHECK_SECONDS = 2.0
+
+
+def _freeze(value: Any) -> Any:
+    """Make a read-only copy of parsed YAML"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Make a mutable copy of frozen config"""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+@lru_cache(maxsize=None)
+def _find_project_root() -> Path:
+    """Find the project root directory containing .agentcore.yaml"""
+    current = Path(__file__).parent
+    while current != current.parent:
+        if (current / '.agentcore.yaml').exists():
+            return current
+        current = current.parent
+    
+    # Fallback to parent of shared directory
+    return Path(__file__).parent.parent
+
+
+def _files_signature(project_root: Path) -> Tuple:
+    """Modification time and size of the config files, None for missing ones"""
+    signature = []
+    for relative_path in (STATIC_CONFIG_PATH, DYNAMIC_CONFIG_PATH):
+        try:
+            stat = (project_root / relative_path).stat()
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """Immutable configuration loaded from one version of the config files"""
+    
+    static: Mapping[str, Any]
+    dynamic: Mapping[str, Any]
+    merged: Mapping[str, Any]
+    signature: Tuple
+    
+    def section(self, name: str) -> Mapping[str, Any]:
+        """Get a top-level section of the merged configuration"""
+        return self.merged.get(name) or MappingProxyType({})
+    
+    @property
+    def region(self) -> str:
+        return self.section("aws").get("region", "us-east-1")
+    
+    @property
+    def model_id(self) -> str:
+        return self.section("agents").get("modelid", "global.anthropic.claude-haiku-4-5-20251001-v1:0")
+    
+    @property
+    def gateway_url(self) -> str:
+        return self.section("gateway").get("url", "")
+    
+    @property
+    def memory_id(self) -> Optional[str]:
+        return self.section("memory").get("id")
+
+
+class _SnapshotCache:
+    """Process-wide config snapshots per project root, reloaded when the files change"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshots: Dict[Path, ConfigSnapshot] = {}
+        self._last_check: Dict[Path, float] = {}
+    
+    def get(self, manager: "AgentCoreConfigManager") -> ConfigSnapshot:
+        root = manager.project_root
+        now = time.monotonic()
+        snapshot = self._snapshots.get(root)
+        if snapshot is not None and now - self._last_check.get(root, 0.0) < CONFIG_RELOAD_CHECK_SECONDS:
+            return snapshot
+        
+        with self._lock:
+            snapshot = self._snapshots.get(root)
+            signature = _files_signature(root)
+            if snapshot is None or snapshot.signature != signature:
+                static = manager._load_yaml(STATIC_CONFIG_PATH)
+                dynamic = manager._load_yaml(DYNAMIC_CONFIG_PATH)
+                snapshot = ConfigSnapshot(
+                    static=_freeze(static),
+                    dynamic=_freeze(dynamic),
+                    merged=_freeze(manager._deep_merge(static, dynamic)),
+                    signature=signature,
+                )
+                if root in self._snapshots:
+                    logger.info(f"🔄 Configuration files changed - reloaded from {root}")
+                self._snapshots[root] = snapshot
+            self._last_check[root] = now
+            return snapshot
+    
+    def invalidate(self, root: Path) -> None:
+        with self._lock:
+            self._snapshots.pop(root, None)
+            self._last_check.pop(root, None)
+
+
+_snapshot_cache = _SnapshotCache()
+
+
 class AgentCoreConfigManager:
-    """Unified configuration management for all AgentCore consumers"""
+    """Unified configuration management for all AgentCore consumers
+    
+    Configuration is parsed once per process into an immutable ConfigSnapshot
+    shared by all managers, and reloaded only when a config file's
+    modification time or size changes. The get_* methods return mutable
+    copies for backward compatibility; snapshot() avoids the copy.
+    """
     
     def __init__(self, environment: str = "debug"):
         """
@@ -28,14 +161,11 @@ class AgentCoreConfigManager:
         
     def _find_project_root(self) -> Path:
         """Find the project root directory containing .agentcore.yaml"""
-        current = Path(__file__).parent
-        while current != current.parent:
-            if (current / '.agentcore.yaml').exists():
-                return current
-            current = current.parent
-        
-        # Fallback to parent of shared directory
-        return Path(__file__).parent.parent
+        return _find_project_root()
+    
+    def snapshot(self) -> ConfigSnapshot:
+        """Get the current immutable configuration snapshot"""
+        return _snapshot_cache.get(self)
     
     def _load_yaml(self, relative_path: str) -> Dict[str, Any]:
         """Load YAML file relative to project root"""
@@ -84,8 +214,7 @@ class AgentCoreConfigManager:
     # Static Configuration Methods
     def get_static_config(self) -> Dict[str, Any]:
         """Get static configuration (version controlled)"""
-        # Load consolidated static config file
-        return self._load_yaml("config/static-config.yaml")
+        return _thaw(self.snapshot().static)
     
     def get_base_settings(self) -> Dict[str, Any]:
         """Get base settings only (backward compatibility)"""
@@ -94,56 +223,47 @@ class AgentCoreConfigManager:
     # Dynamic Configuration Methods
     def get_dynamic_config(self) -> Dict[str, Any]:
         """Get dynamic configuration (deployment generated)"""
-        # Load consolidated dynamic config file
-        return self._load_yaml("config/dynamic-config.yaml")
+        return _thaw(self.snapshot().dynamic)
     
     def update_dynamic_config(self, updates: Dict[str, Any]) -> None:
         """Update dynamic configuration file"""
-        file_path = "config/dynamic-config.yaml"
-        current = self._load_yaml(file_path)
+        current = self._load_yaml(DYNAMIC_CONFIG_PATH)
         updated = self._deep_merge(current, updates)
-        self._save_yaml(file_path, updated)
+        self._save_yaml(DYNAMIC_CONFIG_PATH, updated)
+        _snapshot_cache.invalidate(self.project_root)
     
     # Merged Configuration Methods
     def get_merged_config(self) -> Dict[str, Any]:
         """Get complete configuration (static + dynamic merged)"""
-        static = self.get_static_config()
-        dynamic = self.get_dynamic_config()
-        return self._deep_merge(static, dynamic)
+        return _thaw(self.snapshot().merged)
     
     # Convenience Methods for Backward Compatibility
     def get_model_settings(self) -> Dict[str, Any]:
         """Get model settings (backward compatibility)"""
-        config = self.get_merged_config()
-        aws_config = config.get("aws", {})
-        agents_config = config.get("agents", {})
+        snapshot = self.snapshot()
         
         return {
-            "region_name": aws_config.get("region", "us-east-1"),
-            "model_id": agents_config.get("modelid", "global.anthropic.claude-haiku-4-5-20251001-v1:0"),
+            "region_name": snapshot.region,
+            "model_id": snapshot.model_id,
             "temperature": 0.7,  # Default from current usage
             "max_tokens": 4096   # Default from current usage
         }
     
     def get_gateway_url(self) -> str:
         """Get gateway URL (backward compatibility)"""
-        config = self.get_merged_config()
-        return config.get("gateway", {}).get("url", "")
+        return self.snapshot().gateway_url
     
     def get_oauth_settings(self) -> Dict[str, Any]:
         """Get OAuth settings (backward compatibility)"""
-        config = self.get_merged_config()
-        return config.get("okta", {})
+        return _thaw(self.snapshot().section("okta"))
     
     def get_tools_schema(self) -> List[Dict[str, Any]]:
         """Get Bedrock agent tools schema (for gateway target creation)"""
-        config = self.get_static_config()
-        return config.get("tools_schema", [])
+        return _thaw(self.snapshot().static.get("tools_schema", ()))
     
     def get_mcp_lambda_config(self) -> Dict[str, Any]:
         """Get MCP lambda configuration (for deployment and gateway operations)"""
-        config = self.get_merged_config()
-        return config.get("mcp_lambda", {})
+        return _thaw(self.snapshot().section("mcp_lambda"))
     
     def validate(self) -> bool:
         """Validate current configuration"""
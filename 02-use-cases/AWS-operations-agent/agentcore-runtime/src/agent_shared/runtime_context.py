@@ -0,0 +1,216 @@
+# ============================================================================
+# IMPORTS
+# ============================================================================
+
+import threading
+import time
+
+from . import mylogger
+from .auth import get_cached_m2m_token, invalidate_m2m_token, is_oauth_available
+from .config_manager import AgentCoreConfigManager
+from .mcp import create_persistent_mcp_client
+
+logger = mylogger.get_logger()
+
+# The gateway's tool catalog is listed again after this long
+TOOL_CATALOG_TTL_SECONDS = 300
+
+# ============================================================================
+# MCP SESSION
+# ============================================================================
+
+
+class McpSession:
+    """
+    A connected MCP client and its cached tool catalog.
+
+    Requests hold a session between acquire_mcp_session and
+    release_mcp_session; a replaced session is only closed once the last
+    request using it releases it.
+    """
+
+    def __init__(self, client, token):
+        self.client = client
+        self.token = token
+        self.tools = None
+        self.listed_at = 0.0
+        self.users = 0
+        self.retired = False
+        self.closed = False
+
+    def close(self):
+        """Stop the MCP client."""
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self.client.__exit__(None, None, None)
+            logger.info("🧹 MCP session closed")
+        except Exception as e:  # noqa: BLE001 - best-effort cleanup
+            logger.warning(f"⚠️ Error closing MCP session: {e}")
+
+
+# ============================================================================
+# RUNTIME CONTEXT
+# ============================================================================
+
+
+class AgentRuntimeContext:
+    """
+    Per-process state shared by all agent requests.
+
+    Loads the configuration once, keeps one MCP session to the gateway open
+    across requests and caches its tool catalog. The session is reconnected
+    when the M2M token is refreshed ahead of its expiry or after a request
+    reports it as failed.
+    """
+
+    def __init__(self):
+        # _lock guards the session and its user counts and is never held
+        # across network calls; _connect_lock lets one request connect at a
+        # time while the others wait for its session
+        self._lock = threading.Lock()
+        self._connect_lock = threading.Lock()
+        self._session = None
+        self.config_manager = AgentCoreConfigManager()
+        self.gateway_url = self.config_manager.get_gateway_url()
+
+    def is_mcp_available(self):
+        """
+        Check if the gateway can be used.
+
+        Returns:
+            bool: True if a gateway is configured and OAuth is available
+        """
+        return bool(self.gateway_url) and is_oauth_available()
+
+    def acquire_mcp_session(self):
+        """
+        Get the live MCP session with its tools, connecting if needed.
+
+        Blocks on the network when connecting or listing tools, so call it
+        from a worker thread in async code. Network calls run outside the
+        session lock, so other requests can still release their sessions.
+
+        Returns:
+            McpSession: Session to pass to release_mcp_session when done
+
+        Raises:
+            RuntimeError: If no token is available or the gateway can't be reached
+        """
+        token = get_cached_m2m_token()
+        if not token:
+            raise RuntimeError("No access token")
+
+        session = self._pin_session(token)
+        if session is None:
+            with self._connect_lock:
+                # Another request may have connected while this one waited
+                session = self._pin_session(token) or self._connect(token)
+
+        if (
+            session.tools is None
+            or time.time() - session.listed_at > TOOL_CATALOG_TTL_SECONDS
+        ):
+            try:
+                session.tools = session.client.list_tools_sync() or []
+            except Exception as e:
+                self.release_mcp_session(session, e)
+                raise
+            session.listed_at = time.time()
+            logger.info(f"🛠️ Cached {len(session.tools)} MCP tools")
+
+        return session
+
+    def _pin_session(self, token):
+        """Count a request as using the current session if it has this token."""
+        with self._lock:
+            session = self._session
+            if session is None or session.token != token or session.retired:
+                return None
+            session.users += 1
+            return session
+
+    def _connect(self, token):
+        """Connect a new session for one request and make it the current one."""
+        client = create_persistent_mcp_client(self.gateway_url, token)
+        if client is None:
+            raise RuntimeError("Failed to connect MCP client")
+        session = McpSession(client, token)
+        session.users = 1
+
+        with self._lock:
+            previous = self._session
+            self._session = session
+            if previous is not None:
+                logger.info("🔄 M2M token refreshed - reconnecting MCP session")
+                previous = previous if self._retire(previous) else None
+        if previous is not None:
+            previous.close()
+        return session
+
+    def release_mcp_session(self, session, error=None):
+        """
+        Release a session acquired with acquire_mcp_session.
+
+        Args:
+            session (McpSession): The acquired session
+            error (Exception, optional): Failure seen while using the session;
+                the session is dropped so the next request reconnects
+        """
+        with self._lock:
+            session.users -= 1
+            if error is not None and self._session is session:
+                logger.warning(f"⚠️ Dropping MCP session after error: {error}")
+                self._session = None
+                session.retired = True
+                error_text = str(error)
+                if "401" in error_text or "Unauthorized" in error_text:
+                    invalidate_m2m_token()
+            close = session.retired and session.users == 0
+        if close:
+            session.close()
+
+    def invalidate_tools(self):
+        """Make the next request list the gateway's tools again."""
+        with self._lock:
+            if self._session is not None:
+                self._session.tools = None
+
+    def close(self):
+        """Close the MCP session once no request is using it."""
+        with self._lock:
+            session = self._session
+            self._session = None
+            close = session is not None and self._retire(session)
+        if close:
+            session.close()
+
+    @staticmethod
+    def _retire(session):
+        """Mark a session as replaced; returns True if it should be closed now."""
+        session.retired = True
+        return session.users == 0
+
+
+# ============================================================================
+# PROCESS-WIDE INSTANCE
+# ============================================================================
+
+_runtime_context = None
+_runtime_context_lock = threading.Lock()
+
+
+def get_runtime_context():
+    """
+    Get the runtime context of this process, creating it on first use.
+
+    Returns:
+        AgentRuntimeContext: Shared runtime context
+    """
+    global _runtime_context
+
+    with _runtime_context_lock:
+        if _runtime_context is None:
+            _runtime_context = AgentRuntimeContext()
+        return _runtime_context
@@ -4,7 +4,6 @@ Simplified DIY Agent following EXACT AWS documentation MCP patterns
 Based on: https://docs.aws.amazon.com/bedrock-agentcore/latest/devguide/gateway-using-mcp-clients.html
 """
 
-import functools
 import logging
 import sys
 import os
@@ -19,15 +18,13 @@ project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(o
 sys.path.append(project_root)
 
 # AWS documented imports
-from mcp.client.streamable_http import streamablehttp_client
 from strands import Agent, tool
 from strands.models import BedrockModel
-from strands.tools.mcp.mcp_client import MCPClient
 from strands_tools import think
 
 # Shared utilities
-from agent_shared.config_manager import AgentCoreConfigManager
-from agent_shared.auth import setup_oauth, get_m2m_token, is_oauth_available
+from agent_shared.auth import setup_oauth
+from agent_shared.runtime_context import get_runtime_context
 from agent_shared.memory import setup_memory, get_conversation_context, save_conversation, is_memory_available
 from agent_shared.responses import format_diy_response, extract_text_from_event, format_error_response
 
@@ -41,13 +38,6 @@ logger = mylogger.get_logger()
 # EXACT AWS DOCUMENTATION PATTERNS
 # ============================================================================
 
-def _create_streamable_http_transport(url, headers=None):
-    """
-    EXACT function from AWS documentation
-    https://docs.aws.amazon.com/bedrock-agentcore/latest/devguide/gateway-using-mcp-clients.html
-    """
-    return streamablehttp_client(url, headers=headers)
-
 # def execute_agent(bedrock_model, prompt):
 #     """
 #     EXACT pattern from AWS documentation for Strands MCP Client
@@ -106,10 +96,6 @@ async def execute_agent_streaming(bedrock_model, prompt):
     """
     Streaming version of AWS documented pattern
     """
-    # Get configuration
-    config_manager = AgentCoreConfigManager()
-    gateway_url = config_manager.get_gateway_url()
-    
     # Define system prompt for the agent
     system_prompt = """You are an AWS Operations Assistant with read-only access to AWS resources through specialized tools.
 
@@ -220,7 +206,7 @@ Available AWS Services: EC2, S3, Lambda, CloudFormation, IAM, RDS, CloudWatch, C
 Remember: Progress updates with emojis are MANDATORY, not optional! Follow the exact pattern shown above.
 """
     # Fallback to local tools if gateway or oauth is not working
-    if not gateway_url or not is_oauth_available():
+    if not runtime_context.is_mcp_available():
         logger.info("🏠 No MCP available - using local streaming")
         local_tools = [get_current_time, echo_message, think]
         #agent = Agent(model=bedrock_model, tools=local_tools, system_prompt=system_prompt)
@@ -229,24 +215,14 @@ Remember: Progress updates with emojis are MANDATORY, not optional! Follow the e
             yield event
         return
     
+    tools = []
     try:
-        access_token = get_m2m_token()
-        if not access_token:
-            raise Exception("No access token")
-        
-        # Create headers for authentication
-        headers = {"Authorization": f"Bearer {access_token}"}
-        
-        # EXACT AWS pattern: Create MCP client with functools.partial
-        mcp_client = MCPClient(functools.partial(
-            _create_streamable_http_transport,
-            url=gateway_url,
-            headers=headers
-        ))
-        
-        # EXACT AWS pattern: Use context manager
-        with mcp_client:
-            tools = mcp_client.list_tools_sync()
+        # Reuse the process-wide token, MCP session and tool catalog; only
+        # connecting or listing tools blocks, so do it off the event loop
+        session = await asyncio.to_thread(runtime_context.acquire_mcp_session)
+        session_error = None
+        try:
+            tools = session.tools
             
             # Add local tools
             all_tools = [get_current_time, echo_message]
@@ -272,6 +248,12 @@ Remember: Progress updates with emojis are MANDATORY, not optional! Follow the e
                                 logger.info(delta['text'])
                     #logger.info("*" * 50)
                     yield event
+        except Exception as e:
+            # Drop the session so the next request reconnects
+            session_error = e
+            raise
+        finally:
+            runtime_context.release_mcp_session(session, error=session_error)
                 
     except Exception as e:
         logger.error(f"❌ MCP streaming failed: {e}")
@@ -304,8 +286,8 @@ def echo_message(message: str) -> str:
 # CONFIGURATION
 # ============================================================================
 
-config_manager = AgentCoreConfigManager()
-model_settings = config_manager.get_model_settings()
+runtime_context = get_runtime_context()
+model_settings = runtime_context.config_manager.get_model_settings()
 
 logger.info(f"🚀 Simple DIY Agent with model: {model_settings['model_id']}")
 
@@ -419,6 +401,11 @@ async def invoke_agent(request: InvocationRequest):
         logger.error(f"💥 Request failed: {e}")
         raise HTTPException(status_code=500, detail=f"Agent processing failed: {str(e)}")
 
+@app.on_event("shutdown")
+async def shutdown():
+    """Close the persistent MCP session"""
+    runtime_context.close()
+
 @app.get("/ping")
 async def ping():
     """Health check endpoint"""
@@ -199,6 +199,31 @@ lambda_target_config = {
                             },
                             "required": ["environment","action_type"]
                             }
+                        },
+                        {
+                        "name": "full_health_report",
+                        "description": "Runs several diagnostics concurrently and returns one merged report, instead of calling each analysis tool separately. By default runs system_health, connection_management_issues, index_analysis, autovacuum_analysis, io_analysis, replication_analysis, xid_analysis and bloat_analysis. Provide the environment (dev/prod) to analyze. Use action_type default value as full_health_report.",
+                        "inputSchema": {
+                            "type": "object",
+                            "properties": {
+                                "environment": {
+                                    "type": "string"
+                                },
+                                "action_type": {
+                                    "type": "string",
+                                    "description": "The type of action to perform. Use 'full_health_report' for this tool."
+                                },
+                                "diagnostics": {
+                                    "type": "string",
+                                    "description": "Optional comma-separated list of diagnostics to run, e.g. 'system_health,index_analysis,bloat_analysis'. Also accepts slow_query, vacuum_progress and long_running_transactions."
+                                },
+                                "diagnostic_timeout": {
+                                    "type": "number",
+                                    "description": "Optional timeout in seconds for each diagnostic (default 60)."
+                                }
+                            },
+                            "required": ["environment","action_type"]
+                            }
                         }
                 ]
             }
@@ -1,3 +1,4 @@
+import copy
 import json
 import boto3
 import psycopg2
@@ -5,6 +6,8 @@ import os
 import re
 import time
 import logging
+import threading
+from collections import OrderedDict, namedtuple
 from datetime import datetime
 from botocore.exceptions import ClientError
 
@@ -20,12 +23,167 @@ class QueryLimitError(Exception):
     """Custom exception for query limit violations"""
     pass
 
-def analyze_query_complexity(query):
+class SqlToken(namedtuple('SqlToken', ['type', 'value'])):
+    """
+    A lexical SQL token. type is one of 'whitespace', 'comment', 'string',
+    'dollar_string', 'identifier' (double-quoted), 'param', 'number', 'word'
+    (keyword or unquoted identifier) or 'punct'
+    """
+    __slots__ = ()
+
+    @property
+    def keyword(self):
+        """Lowercased value for word tokens, None for everything else"""
+        return self.value.lower() if self.type == 'word' else None
+
+
+_SQL_TOKEN_RE = re.compile(r"""
+    (?P<whitespace>\s+)
+  | (?P<comment>--[^\n]*)
+  | (?P<string>[Ee]'(?:''|\\.|[^'\\])*(?:'|\Z)
+      | (?:[BbXxNn]|[Uu]&)?'(?:''|[^'])*(?:'|\Z))
+  | (?P<dollar_string>\$(?P<tag>(?:[A-Za-z_][A-Za-z0-9_]*)?)\$.*?(?:\$(?P=tag)\$|\Z))
+  | (?P<identifier>(?:[Uu]&)?"(?:""|[^"])*(?:"|\Z))
+  | (?P<param>\$\d+)
+  | (?P<number>(?:\d+(?:\.\d*)?|\.\d+)(?:[Ee][+-]?\d+)?)
+  | (?P<word>[^\W\d][\w$]*)
+  | (?P<punct>::|<=|>=|<>|!=|\|\||\S)
+""", re.VERBOSE | re.DOTALL)
+
+# Tokens that carry no SQL meaning
+_SQL_TRIVIA = ('whitespace', 'comment')
+
+# Keywords that may not appear in a read-only SELECT
+_DANGEROUS_KEYWORDS = [
+    'insert', 'update', 'delete', 'drop', 'truncate', 'alter', 'create',
+    'grant', 'revoke', 'execute', 'copy'
+]
+
+
+def _scan_block_comment(text, pos):
+    """Return the end of a (possibly nested) block comment starting at pos"""
+    depth = 0
+    length = len(text)
+    while pos < length:
+        if text.startswith('/*', pos):
+            depth += 1
+            pos += 2
+        elif text.startswith('*/', pos):
+            depth -= 1
+            pos += 2
+            if depth == 0:
+                return pos
+        else:
+            pos += 1
+    return length
+
+
+def tokenize_sql(text):
+    """
+    Split SQL text into tokens in a single pass
+
+    Understands single-quoted and escape strings, dollar-quoted strings,
+    double-quoted identifiers, line comments and nested block comments, so
+    keywords and semicolons inside them are never mistaken for SQL.
+
+    Args:
+        text (str): SQL text
+
+    Returns:
+        list: SqlToken tuples covering the whole text
+    """
+    tokens = []
+    pos = 0
+    length = len(text)
+    while pos < length:
+        if text.startswith('/*', pos):
+            end = _scan_block_comment(text, pos)
+            tokens.append(SqlToken('comment', text[pos:end]))
+            pos = end
+            continue
+        match = _SQL_TOKEN_RE.match(text, pos)
+        token_type = match.lastgroup
+        if token_type == 'tag':
+            token_type = 'dollar_string'
+        tokens.append(SqlToken(token_type, match.group()))
+        pos = match.end()
+    return tokens
+
+
+def split_sql_statements(text, tokens=None):
+    """
+    Split SQL text into statements on top-level semicolons
+
+    Args:
+        text (str): SQL text
+        tokens (list, optional): Tokens of text from tokenize_sql
+
+    Returns:
+        list: (statement text without the trailing semicolon, statement tokens) tuples
+    """
+    if tokens is None:
+        tokens = tokenize_sql(text)
+
+    statements = []
+    current = []
+
+    def _finish():
+        # Drop surrounding whitespace, keep comments as part of the statement
+        while current and current[0].type == 'whitespace':
+            current.pop(0)
+        while current and current[-1].type == 'whitespace':
+            current.pop()
+        if current:
+            statements.append((''.join(token.value for token in current), list(current)))
+        current.clear()
+
+    for token in tokens:
+        if token.type == 'punct' and token.value == ';':
+            _finish()
+        else:
+            current.append(token)
+    _finish()
+    return statements
+
+
+def add_row_limit(stmt, tokens, limit):
+    """
+    Append a LIMIT to a statement that has no top-level LIMIT of its own
+
+    Trailing comments are dropped first, so the LIMIT can never end up
+    inside a line comment. A LIMIT inside a subquery, string or comment does
+    not count as the statement's own.
+
+    Args:
+        stmt (str): Statement text
+        tokens (list): Tokens of stmt from tokenize_sql
+        limit (int): Maximum number of rows to fetch
+
+    Returns:
+        str: Statement text to execute
+    """
+    depth = 0
+    for token in tokens:
+        if token.type == 'punct' and token.value == '(':
+            depth += 1
+        elif token.type == 'punct' and token.value == ')':
+            depth -= 1
+        elif depth == 0 and token.keyword in ('limit', 'fetch'):
+            return stmt
+
+    end = len(tokens)
+    while end and tokens[end - 1].type in _SQL_TRIVIA:
+        end -= 1
+    return f"{''.join(token.value for token in tokens[:end])}\nLIMIT {limit}"
+
+
+def analyze_query_complexity(query, tokens=None):
     """
     Analyze query complexity and potential resource impact
     
     Args:
         query (str): SQL query to analyze
+        tokens (list, optional): Tokens of query from tokenize_sql
     
     Returns:
         dict: Complexity metrics
@@ -33,42 +191,62 @@ def analyze_query_complexity(query):
     Raises:
         QueryComplexityError: If query is too complex
     """
-    query_lower = query.lower()
+    if tokens is None:
+        tokens = tokenize_sql(query)
+    # Comments, whitespace and quoted text never add complexity
+    significant = [token for token in tokens if token.type not in _SQL_TRIVIA]
+
     complexity_score = 0
     warnings = []
+    join_count = 0
+    subquery_count = 0
+    agg_count = 0
+    has_window = False
+    condition_count = 0
+    in_where = False
+
+    agg_functions = ('count', 'sum', 'avg', 'max', 'min')
+    for index, token in enumerate(significant):
+        keyword = token.keyword
+        next_token = significant[index + 1] if index + 1 < len(significant) else None
+        next_keyword = next_token.keyword if next_token else None
+
+        if keyword == 'join':
+            join_count += 1
+        elif keyword == 'select' and index > 0 and significant[index - 1].value == '(':
+            subquery_count += 1
+        elif keyword in agg_functions and next_token and next_token.value == '(':
+            agg_count += 1
+        elif (keyword == 'over' and next_token and next_token.value == '(') or (
+                keyword == 'partition' and next_keyword == 'by'):
+            has_window = True
+        elif keyword == 'where':
+            in_where = True
+        elif keyword in ('and', 'or') and in_where:
+            condition_count += 1
     
     # Check for joins
-    join_count = sum(1 for join_type in ['join', 'inner join', 'left join', 'right join', 'full join'] 
-                    if join_type in query_lower)
     complexity_score += join_count * 2
     if join_count > 3:
         warnings.append(f"Query contains {join_count} joins - consider simplifying")
     
     # Check for subqueries
-    subquery_count = query_lower.count('(select')
     complexity_score += subquery_count * 3
     if subquery_count > 2:
         warnings.append(f"Query contains {subquery_count} subqueries - consider restructuring")
     
     # Check for aggregations
-    agg_functions = ['count(', 'sum(', 'avg(', 'max(', 'min(']
-    agg_count = sum(query_lower.count(func) for func in agg_functions)
     complexity_score += agg_count
     
     # Check for window functions
-    if 'over(' in query_lower or 'partition by' in query_lower:
+    if has_window:
         complexity_score += 3
         warnings.append("Query uses window functions - monitor performance")
     
     # Check for complex WHERE conditions
-    where_pos = query_lower.find('where')
-    if where_pos != -1:
-        where_clause = query_lower[where_pos:]
-        and_count = where_clause.count(' and ')
-        or_count = where_clause.count(' or ')
-        complexity_score += (and_count + or_count)
-        if (and_count + or_count) > 5:
-            warnings.append(f"Complex WHERE clause with {and_count + or_count} conditions")
+    complexity_score += condition_count
+    if condition_count > 5:
+        warnings.append(f"Complex WHERE clause with {condition_count} conditions")
     
     return {
         'complexity_score': complexity_score,
@@ -97,7 +275,8 @@ def validate_and_execute_queries(secret_name, query, max_rows=20,
     
     try:
         # Validate and split queries
-        statements = validate_query(query)
+        validated = validate_statements(query)
+        statements = [stmt for stmt, _ in validated]
         
         # Check number of statements
         if len(statements) > max_statements:
@@ -115,9 +294,9 @@ def validate_and_execute_queries(secret_name, query, max_rows=20,
             cur.execute("SET idle_in_transaction_session_timeout = '60s'")
             
             # Execute each statement
-            for stmt_index, stmt in enumerate(statements, 1):
+            for stmt_index, (stmt, tokens) in enumerate(validated, 1):
                 # Analyze query complexity
-                complexity_metrics = analyze_query_complexity(stmt)
+                complexity_metrics = analyze_query_complexity(stmt, tokens)
                 if complexity_metrics['complexity_score'] > max_complexity:
                     raise QueryComplexityError(
                         f"Statement {stmt_index} is too complex (score: {complexity_metrics['complexity_score']})"
@@ -142,10 +321,10 @@ def validate_and_execute_queries(secret_name, query, max_rows=20,
                 stmt_lower = stmt.lower().strip()
                 
                 # Only add LIMIT for SELECT queries
-                if stmt_lower.startswith('select') and 'limit' not in stmt_lower:
+                if stmt_lower.startswith('select'):
                     remaining_rows = max_total_rows - total_rows
                     limit_rows = min(max_rows, remaining_rows)
-                    stmt = f"{stmt} LIMIT {limit_rows + 1}"
+                    stmt = add_row_limit(stmt, tokens, limit_rows + 1)
                 
                 # Execute with explain plan first for SELECT queries
                 if stmt_lower.startswith('select'):
@@ -237,39 +416,82 @@ def validate_and_execute_queries(secret_name, query, max_rows=20,
         if conn:
             conn.close()
 
+# Secrets Manager / Parameter Store lookups and database connections are kept at
+# module level so they survive warm Lambda invocations
+SECRET_CACHE_TTL_SECONDS = int(os.environ.get('SECRET_CACHE_TTL_SECONDS', '300'))
+DB_POOL_MAX_IDLE = int(os.environ.get('DB_POOL_MAX_IDLE', '2'))
+DB_HEALTH_CHECK_INTERVAL_SECONDS = int(os.environ.get('DB_HEALTH_CHECK_INTERVAL_SECONDS', '30'))
+
+_lookup_cache = {}
+_aws_clients = {}
+_idle_connections = {}
+_cache_lock = threading.Lock()
+
+
+def _get_aws_client(service_name):
+    """Get a boto3 client that is reused across invocations"""
+    with _cache_lock:
+        if service_name not in _aws_clients:
+            _aws_clients[service_name] = boto3.session.Session().client(
+                service_name=service_name,
+                region_name=os.environ['REGION']
+            )
+        return _aws_clients[service_name]
+
+
+def _cached_lookup(cache_key, loader):
+    """Return a cached lookup result, calling loader when missing or expired"""
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _lookup_cache.get(cache_key)
+        if cached and cached[1] > now:
+            return cached[0]
+
+    value = loader()
+    with _cache_lock:
+        _lookup_cache[cache_key] = (value, now + SECRET_CACHE_TTL_SECONDS)
+    return value
+
+
+def _invalidate_lookup(cache_key):
+    """Drop a cached lookup so the next call fetches it again"""
+    with _cache_lock:
+        _lookup_cache.pop(cache_key, None)
+
+
 def get_secret(secret_name):
-    """Get secret from AWS Secrets Manager """
-    secret_name = secret_name
-    region_name = os.environ['REGION']
-    session = boto3.session.Session()
-    client = session.client(
-        service_name='secretsmanager',
-        region_name=region_name
-    )
-    
-    try:
-        secret_value = client.get_secret_value(SecretId=secret_name)
-        secret = json.loads(secret_value['SecretString'])
-        return secret
-    except ClientError as e:
-        raise Exception(f"Failed to get secret: {str(e)}")
+    """Get secret from AWS Secrets Manager (cached for SECRET_CACHE_TTL_SECONDS)"""
+    def _load():
+        client = _get_aws_client('secretsmanager')
+        try:
+            secret_value = client.get_secret_value(SecretId=secret_name)
+            secret = json.loads(secret_value['SecretString'])
+            return secret
+        except ClientError as e:
+            raise Exception(f"Failed to get secret: {str(e)}")
+
+    return _cached_lookup(('secret', secret_name), _load)
 
 def get_env_secret(environment):
-    ssm_client = boto3.client('ssm')
-    """Retrieve the secret name for the specified environment"""
-    if environment == 'prod':
-        try:
-            # Get the secret name from Parameter Store
-            response = ssm_client.get_parameter(
-                Name=f'/AuroraOps/{environment}'
-            )
-            print(response['Parameter']['Value'])
-            return response['Parameter']['Value']
-        except ssm_client.exceptions.ParameterNotFound:
-            error_message = f"Parameter not found: /AuroraOps/{environment}"
-            print(error_message)
-            raise Exception(error_message)
-    elif environment == 'dev':
+    """Retrieve the secret name for the specified environment (cached for SECRET_CACHE_TTL_SECONDS)"""
+    if environment not in ('prod', 'dev'):
+        print("environement does not exist")
+        raise ValueError(f"Unknown environment: {environment}")
+
+    def _load():
+        ssm_client = _get_aws_client('ssm')
+        if environment == 'prod':
+            try:
+                # Get the secret name from Parameter Store
+                response = ssm_client.get_parameter(
+                    Name=f'/AuroraOps/{environment}'
+                )
+                print(response['Parameter']['Value'])
+                return response['Parameter']['Value']
+            except ssm_client.exceptions.ParameterNotFound:
+                error_message = f"Parameter not found: /AuroraOps/{environment}"
+                print(error_message)
+                raise Exception(error_message)
         try:
             # Get the secret name from Parameter Store
             response = ssm_client.get_parameter(
@@ -278,25 +500,111 @@ def get_env_secret(environment):
             return response['Parameter']['Value']
         except Exception as e:
             raise Exception(f"Failed to get dev secret name from Parameter Store: {str(e)}")
-    else:
-        print("environement does not exist")
-        raise ValueError(f"Unknown environment: {environment}")
+
+    return _cached_lookup(('parameter', environment), _load)
+
+
+class PooledConnection:
+    """
+    A database connection borrowed from the module-level pool.
+
+    Behaves like the underlying psycopg2 connection, except that close()
+    rolls back and resets the session and returns the connection to the
+    pool for the next invocation instead of closing it.
+    """
+
+    def __init__(self, secret_name, conn):
+        self._secret_name = secret_name
+        self._conn = conn
+        self._released = False
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def close(self):
+        """Return the connection to the pool"""
+        if self._released:
+            return
+        self._released = True
+        _release_connection(self._secret_name, self._conn)
+
+
+def _open_connection(secret):
+    """Open a new database connection"""
+    return psycopg2.connect(
+        host=secret['host'],
+        database=secret['dbname'],
+        user=secret['username'],
+        password=secret['password'],
+        port=secret['port']
+    )
+
+
+def _is_healthy(conn, last_used):
+    """Check an idle connection before reusing it"""
+    if conn.closed:
+        return False
+    if time.monotonic() - last_used < DB_HEALTH_CHECK_INTERVAL_SECONDS:
+        return True
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+        conn.rollback()
+        return True
+    except psycopg2.Error:
+        return False
+
+
+def _release_connection(secret_name, conn):
+    """Reset a connection's session and keep it for reuse, or close it"""
+    try:
+        if conn.closed:
+            return
+        # Undo session settings such as statement_timeout set by the caller
+        conn.rollback()
+        with conn.cursor() as cur:
+            cur.execute("RESET ALL")
+        conn.commit()
+    except psycopg2.Error as e:
+        logger.warning(f"Discarding database connection: {str(e)}")
+        conn.close()
+        return
+
+    with _cache_lock:
+        idle = _idle_connections.setdefault(secret_name, [])
+        if len(idle) < DB_POOL_MAX_IDLE:
+            idle.append((conn, time.monotonic()))
+            return
+    conn.close()
+
 
 def connect_to_db(secret_name):
-    """Establish database connection"""
-    cur_secret = secret_name
-    secret = get_secret(cur_secret)
+    """Get a database connection, reusing a healthy pooled one when available"""
+    while True:
+        with _cache_lock:
+            idle = _idle_connections.get(secret_name)
+            if not idle:
+                break
+            conn, last_used = idle.pop()
+        if _is_healthy(conn, last_used):
+            return PooledConnection(secret_name, conn)
+        logger.info("Reconnecting: pooled database connection failed health check")
+        conn.close()
+
+    secret = get_secret(secret_name)
     try:
-        conn = psycopg2.connect(
-            host=secret['host'],
-            database=secret['dbname'],
-            user=secret['username'],
-            password=secret['password'],
-            port=secret['port']
-        )
-        return conn
+        conn = _open_connection(secret)
+    except psycopg2.OperationalError:
+        # Credentials may have been rotated since they were cached
+        _invalidate_lookup(('secret', secret_name))
+        secret = get_secret(secret_name)
+        try:
+            conn = _open_connection(secret)
+        except Exception as e:
+            raise Exception(f"Failed to connect to the database: {str(e)}")
     except Exception as e:
         raise Exception(f"Failed to connect to the database: {str(e)}")
+    return PooledConnection(secret_name, conn)
 
 # Define the queries dictionary for different object types
 queries = {
@@ -754,6 +1062,79 @@ def clean_query_for_explain(query):
     
     return cleaned_query.strip()
 
+# Plans and their analysis are cached per query shape and database, and reused
+# until the TTL expires or planner statistics / schema change
+PLAN_CACHE_TTL_SECONDS = int(os.environ.get('PLAN_CACHE_TTL_SECONDS', '600'))
+PLAN_CACHE_MAX_ENTRIES = int(os.environ.get('PLAN_CACHE_MAX_ENTRIES', '128'))
+
+_plan_cache = OrderedDict()
+
+# Changes when tables are analyzed or relations are created or dropped
+STATS_VERSION_QUERY = """
+    SELECT
+        (SELECT max(greatest(last_analyze, last_autoanalyze)) FROM pg_stat_user_tables)::text,
+        (SELECT count(*) FROM pg_class),
+        (SELECT max(oid) FROM pg_class)::text
+"""
+
+# Tokens replaced by a placeholder when fingerprinting a query. $n parameters
+# are kept: parameterized queries get a generic plan instead of EXPLAIN ANALYZE
+_LITERAL_TOKENS = ('string', 'dollar_string', 'number')
+
+
+def fingerprint_query(query):
+    """
+    Normalize a query to its shape: literals become '?', comments are
+    dropped and keywords and whitespace are normalized
+    """
+    parts = []
+    for token in tokenize_sql(query):
+        if token.type in _SQL_TRIVIA:
+            continue
+        if token.type in _LITERAL_TOKENS:
+            parts.append('?')
+        elif token.type == 'word':
+            parts.append(token.keyword)
+        else:
+            parts.append(token.value)
+    return ' '.join(parts)
+
+
+def _database_identity(secret_name):
+    """Identify the database a secret points to"""
+    secret = get_secret(secret_name)
+    return (secret.get('host'), str(secret.get('port')), secret.get('dbname'))
+
+
+def _get_cached_plan(cache_key, stats_version):
+    """Return a cached plan entry if it is fresh and the statistics are unchanged"""
+    with _cache_lock:
+        entry = _plan_cache.get(cache_key)
+        if not entry:
+            return None
+        if entry['expires_at'] <= time.monotonic() or entry['stats_version'] != stats_version:
+            del _plan_cache[cache_key]
+            return None
+        _plan_cache.move_to_end(cache_key)
+        entry['hits'] += 1
+        return entry
+
+
+def _store_cached_plan(cache_key, stats_version, analysis):
+    """Cache a plan analysis, evicting the least recently used entries"""
+    with _cache_lock:
+        _plan_cache[cache_key] = {
+            'analysis': analysis,
+            'stats_version': stats_version,
+            'cached_at': time.monotonic(),
+            'expires_at': time.monotonic() + PLAN_CACHE_TTL_SECONDS,
+            'hits': 0
+        }
+        _plan_cache.move_to_end(cache_key)
+        while len(_plan_cache) > PLAN_CACHE_MAX_ENTRIES:
+            _plan_cache.popitem(last=False)
+
+
 def analyze_query_performance(secret_name, query_or_object_name, parameters=None, object_type=None):
     """
     Analyze query performance and provide optimization recommendations
@@ -779,6 +1160,26 @@ def analyze_query_performance(secret_name, query_or_object_name, parameters=None
             # Check if the query contains parameter placeholders
             has_parameters = any(f'${i}' in query_to_analyze for i in range(1, 21))
 
+            # Reuse the analysis of a query with the same shape if the
+            # planner statistics have not changed since it was cached. Generic
+            # and analyzed plans of the same shape are cached separately
+            cache_key = (
+                _database_identity(secret_name),
+                fingerprint_query(query_to_analyze),
+                has_parameters
+            )
+            cur.execute(STATS_VERSION_QUERY)
+            stats_version = tuple(cur.fetchone())
+            cached = _get_cached_plan(cache_key, stats_version)
+            if cached:
+                analysis = copy.deepcopy(cached['analysis'])
+                analysis['cache'] = {
+                    'hit': True,
+                    'age_seconds': round(time.monotonic() - cached['cached_at'], 1),
+                    'hits': cached['hits']
+                }
+                return analysis
+
             if has_parameters:
                 # Replace $n parameters with dummy placeholders
                 modified_query = query_to_analyze
@@ -808,6 +1209,7 @@ def analyze_query_performance(secret_name, query_or_object_name, parameters=None
                 # Pass False for is_generic_plan
                 analysis = analyze_execution_plan(plan[0], estimated_plan[0], False)
 
+            _store_cached_plan(cache_key, stats_version, copy.deepcopy(analysis))
             return analysis
 
     except Exception as e:
@@ -1027,6 +1429,10 @@ def format_analysis_output(analysis):
         output.append(f"- Actual Rows: {analysis['performance_stats'].get('actual_rows', 'N/A')}")
         output.append(f"- Estimated Rows: {analysis['performance_stats'].get('estimated_rows', 'N/A')}")
     
+    cache = analysis.get('cache')
+    if cache:
+        output.append(f"- Served from plan cache (plan captured {cache['age_seconds']}s ago for the same query shape)")
+    
     output.append("")
 
     # Issues
@@ -1096,15 +1502,15 @@ def monitor_query_performance(query, start_time, rows_returned):
     
     return metrics
 
-def validate_query(query):
+def validate_statements(query):
     """
-    Validate query for security concerns and split into statements
+    Validate query for security concerns and split into tokenized statements
     
     Args:
         query (str): SQL query to validate
     
     Returns:
-        list: List of validated statements
+        list: (statement, tokens) tuples for each validated statement
         
     Raises:
         ValueError: If query contains prohibited operations
@@ -1112,114 +1518,46 @@ def validate_query(query):
     if not query or not isinstance(query, str):
         raise ValueError("Query must be a non-empty string")
 
-    def is_within_quotes(text, position):
-        """Check if a position in text is within quotes"""
-        single_quotes = False
-        double_quotes = False
-        for i in range(position):
-            if text[i] == "'" and not double_quotes:
-                single_quotes = not single_quotes
-            elif text[i] == '"' and not single_quotes:
-                double_quotes = not double_quotes
-        return single_quotes or double_quotes
-
-    def split_statements(query_text):
-        """Split query into individual statements, respecting quotes and comments"""
-        statements = []
-        current_stmt = []
-        i = 0
-        comment_block = False
-        line_comment = False
-        
-        while i < len(query_text):
-            char = query_text[i]
-            
-            # Handle comment blocks
-            if query_text[i:i+2] == '/*' and not line_comment:
-                comment_block = True
-                current_stmt.append(char)
-                i += 1
-            elif query_text[i:i+2] == '*/' and comment_block:
-                comment_block = False
-                current_stmt.append(char)
-                i += 1
-            # Handle line comments
-            elif query_text[i:i+2] == '--' and not comment_block:
-                line_comment = True
-                current_stmt.append(char)
-                i += 1
-            elif char == '\n' and line_comment:
-                line_comment = False
-                current_stmt.append(char)
-            # Handle semicolons
-            elif char == ';' and not comment_block and not line_comment and not is_within_quotes(query_text, i):
-                current_stmt.append(char)
-                stmt = ''.join(current_stmt).strip()
-                if stmt:
-                    statements.append(stmt)
-                current_stmt = []
-            else:
-                current_stmt.append(char)
-            i += 1
-        
-        # Add the last statement if exists
-        last_stmt = ''.join(current_stmt).strip()
-        if last_stmt:
-            statements.append(last_stmt)
-        
-        return [stmt for stmt in statements if stmt]
-
-    # Split into statements
-    statements = split_statements(query)
     validated_statements = []
 
-    # Validate each statement
-    for stmt in statements:
-        stmt = stmt.strip()
-        if stmt.endswith(';'):
-            stmt = stmt[:-1]
-        
-        stmt_lower = stmt.lower().strip()
+    # Tokenize once, then split on semicolons outside quotes and comments
+    for stmt, tokens in split_sql_statements(query):
+        significant = [token for token in tokens if token.type not in _SQL_TRIVIA]
         
-        # Get the command type
-        first_word = stmt_lower.split()[0] if stmt_lower.split() else ''
+        # Get the command type (a leading comment is not a permitted command,
+        # since the statement must start with the keyword for LIMIT handling)
+        first_word = tokens[0].value.lower().split()[0] if tokens else ''
         
         if first_word not in ['select', 'show']:
             raise ValueError(f"Prohibited operation detected: {first_word}")
         
-        # For SELECT statements, check for dangerous operations
+        # For SELECT statements, check for dangerous operations outside of
+        # strings, quoted identifiers and comments
         if first_word == 'select':
-            dangerous_operations = [
-                r'\binsert\b', r'\bupdate\b', r'\bdelete\b', r'\bdrop\b', 
-                r'\btruncate\b', r'\balter\b', r'\bcreate\b', r'\bgrant\b', 
-                r'\brevoke\b', r'\bexecute\b', r'\bcopy\b'
-            ]
-            
-            # Remove content within quotes for checking
-            query_for_check = ''
-            in_quote = False
-            quote_char = None
-            
-            for char in stmt:
-                if char in ["'", '"'] and (not quote_char or char == quote_char):
-                    if not in_quote:
-                        quote_char = char
-                        in_quote = True
-                    else:
-                        quote_char = None
-                        in_quote = False
-                elif not in_quote:
-                    query_for_check += char
-            
-            # Check for dangerous operations
-            for operation in dangerous_operations:
-                if re.search(operation, query_for_check.lower()):
-                    raise ValueError(f"Statement contains prohibited operation: {operation}")
+            keywords = {token.keyword for token in significant if token.type == 'word'}
+            for keyword in _DANGEROUS_KEYWORDS:
+                if keyword in keywords:
+                    raise ValueError(f"Statement contains prohibited operation: \\b{keyword}\\b")
         
-        validated_statements.append(stmt)
+        validated_statements.append((stmt, tokens))
     
     return validated_statements
 
+def validate_query(query):
+    """
+    Validate query for security concerns and split into statements
+    
+    Args:
+        query (str): SQL query to validate
+    
+    Returns:
+        list: List of validated statements
+        
+    Raises:
+        ValueError: If query contains prohibited operations
+    """
+    return [stmt for stmt, _ in validate_statements(query)]
+
 def execute_read_query(secret_name, query, max_rows=20):
     """
     Execute read-only queries safely and return results with monitoring
@@ -1245,7 +1583,8 @@ def execute_read_query(secret_name, query, max_rows=20):
     
     try:
         # Validate and split queries
-        statements = validate_query(query)
+        validated = validate_statements(query)
+        statements = [stmt for stmt, _ in validated]
         
         # Connect to database
         conn = connect_to_db(secret_name)
@@ -1256,7 +1595,7 @@ def execute_read_query(secret_name, query, max_rows=20):
             cur.execute("SET statement_timeout = '30s'")
             
             # Execute each statement
-            for stmt_index, stmt in enumerate(statements, 1):
+            for stmt_index, (stmt, tokens) in enumerate(validated, 1):
                 stmt_response = {
                     'columns': [],
                     'rows': [],
@@ -1272,8 +1611,8 @@ def execute_read_query(secret_name, query, max_rows=20):
                 
                 # Prepare the final query
                 final_query = stmt
-                if is_select_query and 'limit' not in stmt_lower:
-                    final_query = f"{stmt} LIMIT {max_rows + 1}"
+                if is_select_query:
+                    final_query = add_row_limit(stmt, tokens, max_rows + 1)
                 
                 # Execute query
                 try:
@@ -1310,7 +1649,7 @@ def execute_read_query(secret_name, query, max_rows=20):
                 
                 # Add performance monitoring only for SELECT queries
                 if is_select_query:
-                    complexity_metrics = analyze_query_complexity(stmt)
+                    complexity_metrics = analyze_query_complexity(stmt, tokens)
                     stmt_response['complexity_metrics'] = complexity_metrics
                     
                     # Add complexity warnings if any
@@ -3,25 +3,69 @@ import json
 import boto3
 import psycopg2
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from botocore.exceptions import ClientError
 
+# Secrets Manager / Parameter Store lookups and database connections are kept at
+# module level so they survive warm Lambda invocations
+SECRET_CACHE_TTL_SECONDS = int(os.environ.get('SECRET_CACHE_TTL_SECONDS', '300'))
+DB_POOL_MAX_IDLE = int(os.environ.get('DB_POOL_MAX_IDLE', '4'))
+DB_HEALTH_CHECK_INTERVAL_SECONDS = int(os.environ.get('DB_HEALTH_CHECK_INTERVAL_SECONDS', '30'))
+
+_lookup_cache = {}
+_aws_clients = {}
+_idle_connections = {}
+_cache_lock = threading.Lock()
+
+# Per-thread session settings applied to connections handed out by connect_to_db
+_session_settings = threading.local()
+
+
+def _get_aws_client(service_name):
+    """Get a boto3 client that is reused across invocations"""
+    with _cache_lock:
+        if service_name not in _aws_clients:
+            _aws_clients[service_name] = boto3.session.Session().client(
+                service_name=service_name,
+                region_name=os.environ['REGION']
+            )
+        return _aws_clients[service_name]
+
+
+def _cached_lookup(cache_key, loader):
+    """Return a cached lookup result, calling loader when missing or expired"""
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _lookup_cache.get(cache_key)
+        if cached and cached[1] > now:
+            return cached[0]
+
+    value = loader()
+    with _cache_lock:
+        _lookup_cache[cache_key] = (value, now + SECRET_CACHE_TTL_SECONDS)
+    return value
+
+
+def _invalidate_lookup(cache_key):
+    """Drop a cached lookup so the next call fetches it again"""
+    with _cache_lock:
+        _lookup_cache.pop(cache_key, None)
+
+
 def get_secret(secret_name):
-    """Get secret from AWS Secrets Manager """
-    #secret_name = os.environ['SECRET_NAME']
-    region_name = os.environ['REGION']
-    
-    session = boto3.session.Session()
-    client = session.client(
-        service_name='secretsmanager',
-        region_name=region_name
-    )
-    
-    try:
-        secret_value = client.get_secret_value(SecretId=secret_name)
-        secret = json.loads(secret_value['SecretString'])
-        return secret
-    except ClientError as e:
-        raise Exception(f"Failed to get secret: {str(e)}")
+    """Get secret from AWS Secrets Manager (cached for SECRET_CACHE_TTL_SECONDS)"""
+    def _load():
+        client = _get_aws_client('secretsmanager')
+        try:
+            secret_value = client.get_secret_value(SecretId=secret_name)
+            secret = json.loads(secret_value['SecretString'])
+            return secret
+        except ClientError as e:
+            raise Exception(f"Failed to get secret: {str(e)}")
+
+    return _cached_lookup(('secret', secret_name), _load)
 
 def execute_slow_query(secret_name, min_exec_time):
     """Execute enhanced slow query analysis based on runbooks.py diagnostics"""
@@ -1255,42 +1299,142 @@ def format_results_for_system_health(results):
     
     return output
 
+class PooledConnection:
+    """
+    A database connection borrowed from the module-level pool.
+
+    Behaves like the underlying psycopg2 connection, except that close()
+    rolls back and resets the session and returns the connection to the
+    pool for the next invocation instead of closing it.
+    """
+
+    def __init__(self, secret_name, conn):
+        self._secret_name = secret_name
+        self._conn = conn
+        self._released = False
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def close(self):
+        """Return the connection to the pool"""
+        if self._released:
+            return
+        self._released = True
+        _release_connection(self._secret_name, self._conn)
+
+
+def _open_connection(secret):
+    """Open a new database connection"""
+    return psycopg2.connect(
+        host=secret['host'],
+        database=secret['dbname'],
+        user=secret['username'],
+        password=secret['password'],
+        port=secret['port']
+    )
+
+
+def _is_healthy(conn, last_used):
+    """Check an idle connection before reusing it"""
+    if conn.closed:
+        return False
+    if time.monotonic() - last_used < DB_HEALTH_CHECK_INTERVAL_SECONDS:
+        return True
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+        conn.rollback()
+        return True
+    except psycopg2.Error:
+        return False
+
+
+def _release_connection(secret_name, conn):
+    """Reset a connection's session and keep it for reuse, or close it"""
+    try:
+        if conn.closed:
+            return
+        # Undo session settings such as statement_timeout set by the caller
+        conn.rollback()
+        with conn.cursor() as cur:
+            cur.execute("RESET ALL")
+        conn.commit()
+    except psycopg2.Error as e:
+        print(f"Discarding database connection: {str(e)}")
+        conn.close()
+        return
+
+    with _cache_lock:
+        idle = _idle_connections.setdefault(secret_name, [])
+        if len(idle) < DB_POOL_MAX_IDLE:
+            idle.append((conn, time.monotonic()))
+            return
+    conn.close()
+
+
 def connect_to_db(secret_name):
-    """Establish database connection"""
-    cur_secret = secret_name
-    secret = get_secret(cur_secret)
+    """Get a database connection, reusing a healthy pooled one when available"""
+    while True:
+        with _cache_lock:
+            idle = _idle_connections.get(secret_name)
+            if not idle:
+                break
+            conn, last_used = idle.pop()
+        if _is_healthy(conn, last_used):
+            return _apply_session_settings(PooledConnection(secret_name, conn))
+        print("Reconnecting: pooled database connection failed health check")
+        conn.close()
+
+    secret = get_secret(secret_name)
     try:
         print("in connect_to_db")
-        conn = psycopg2.connect(
-            host=secret['host'],
-            database=secret['dbname'],
-            user=secret['username'],
-            password=secret['password'],
-            port=secret['port']
-        )
-        return conn
+        conn = _open_connection(secret)
+    except psycopg2.OperationalError:
+        # Credentials may have been rotated since they were cached
+        _invalidate_lookup(('secret', secret_name))
+        secret = get_secret(secret_name)
+        try:
+            conn = _open_connection(secret)
+        except Exception as e:
+            raise Exception(f"Failed to connect to the database: {str(e)}")
     except Exception as e:
         raise Exception(f"Failed to connect to the database: {str(e)}")
+    return _apply_session_settings(PooledConnection(secret_name, conn))
+
+
+def _apply_session_settings(conn):
+    """Apply this thread's statement timeout, if any, to a connection"""
+    statement_timeout_ms = getattr(_session_settings, 'statement_timeout_ms', None)
+    if statement_timeout_ms:
+        with conn.cursor() as cur:
+            cur.execute("SELECT set_config('statement_timeout', %s, false)", (str(statement_timeout_ms),))
+        conn.commit()
+    return conn
 
 def get_env_secret(environment):
-    ssm_client = boto3.client('ssm')
+    """Retrieve the secret name for the specified environment (cached for SECRET_CACHE_TTL_SECONDS)"""
     print("in get_env_secret")
-    """Retrieve the secret name for the specified environment"""
-    if environment == 'prod':
-        print("in get_env_secret1")
-        try:
-            # Get the secret name from Parameter Store
-            print("in get_env_secret-try")
-            response = ssm_client.get_parameter(
-                Name=f'/AuroraOps/{environment}'
-            )
-            print(response['Parameter']['Value'])
-            return response['Parameter']['Value']
-        except ssm_client.exceptions.ParameterNotFound:
-            error_message = f"Parameter not found: /AuroraOps/{environment}"
-            print(error_message)
-            raise Exception(error_message)
-    elif environment == 'dev':
+    if environment not in ('prod', 'dev'):
+        print("environement does not exist")
+        raise ValueError(f"Unknown environment: {environment}")
+
+    def _load():
+        ssm_client = _get_aws_client('ssm')
+        if environment == 'prod':
+            print("in get_env_secret1")
+            try:
+                # Get the secret name from Parameter Store
+                print("in get_env_secret-try")
+                response = ssm_client.get_parameter(
+                    Name=f'/AuroraOps/{environment}'
+                )
+                print(response['Parameter']['Value'])
+                return response['Parameter']['Value']
+            except ssm_client.exceptions.ParameterNotFound:
+                error_message = f"Parameter not found: /AuroraOps/{environment}"
+                print(error_message)
+                raise Exception(error_message)
         try:
             # Get the secret name from Parameter Store
             response = ssm_client.get_parameter(
@@ -1299,9 +1443,9 @@ def get_env_secret(environment):
             return response['Parameter']['Value']
         except Exception as e:
             raise Exception(f"Failed to get dev secret name from Parameter Store: {str(e)}")
-    else:
-        print("environement does not exist")
-        raise ValueError(f"Unknown environment: {environment}")
+
+    return _cached_lookup(('parameter', environment), _load)
+
 
 def execute_vacuum_progress_analysis(secret_name):
     """Execute current vacuum progress analysis based on runbooks.py"""
@@ -1596,6 +1740,133 @@ def format_results_for_long_running_transactions(results):
     
     return output
 
+# Diagnostics available to the full_health_report action: name -> (execute, format)
+HEALTH_REPORT_DIAGNOSTICS = {
+    'system_health': (execute_system_health, format_results_for_system_health),
+    'connection_management_issues': (execute_connect_issues, format_results_for_conn_issues),
+    'slow_query': (execute_slow_query, format_results_for_slow_query),
+    'index_analysis': (execute_index_analysis, format_results_for_index_analysis),
+    'autovacuum_analysis': (execute_autovacuum_analysis, format_results_for_autovacuum_analysis),
+    'io_analysis': (execute_io_analysis, format_results_for_io_analysis),
+    'replication_analysis': (execute_replication_analysis, format_results_for_replication_analysis),
+    'vacuum_progress': (execute_vacuum_progress_analysis, format_results_for_vacuum_progress),
+    'xid_analysis': (execute_xid_analysis, format_results_for_xid_analysis),
+    'bloat_analysis': (execute_bloat_analysis, format_results_for_bloat_analysis),
+    'long_running_transactions': (execute_long_running_transactions, format_results_for_long_running_transactions),
+}
+
+DEFAULT_HEALTH_REPORT_DIAGNOSTICS = [
+    'system_health',
+    'connection_management_issues',
+    'index_analysis',
+    'autovacuum_analysis',
+    'io_analysis',
+    'replication_analysis',
+    'xid_analysis',
+    'bloat_analysis',
+]
+
+# Diagnostics whose execute function also takes min_exec_time
+_MIN_EXEC_TIME_DIAGNOSTICS = ('slow_query', 'connection_management_issues')
+
+HEALTH_REPORT_MAX_WORKERS = int(os.environ.get('HEALTH_REPORT_MAX_WORKERS', '4'))
+DEFAULT_DIAGNOSTIC_TIMEOUT_SECONDS = 60
+
+
+def _run_health_diagnostic(name, secret_name, min_exec_time, timeout_seconds):
+    """Run and format one diagnostic with a statement timeout on its connection"""
+    execute, format_results = HEALTH_REPORT_DIAGNOSTICS[name]
+    started_at = time.monotonic()
+    _session_settings.statement_timeout_ms = int(timeout_seconds * 1000)
+    try:
+        if name in _MIN_EXEC_TIME_DIAGNOSTICS:
+            results = execute(secret_name, min_exec_time)
+        else:
+            results = execute(secret_name)
+        return {
+            'output': format_results(results),
+            'error': None,
+            'duration_sec': time.monotonic() - started_at
+        }
+    except Exception as e:
+        return {
+            'output': None,
+            'error': str(e),
+            'duration_sec': time.monotonic() - started_at
+        }
+    finally:
+        _session_settings.statement_timeout_ms = None
+
+
+def execute_full_health_report(secret_name, diagnostics=None, min_exec_time=1000,
+                               timeout_seconds=DEFAULT_DIAGNOSTIC_TIMEOUT_SECONDS):
+    """
+    Run several diagnostics concurrently over pooled connections
+
+    Args:
+        secret_name (str): Secret containing database credentials
+        diagnostics (list, optional): Diagnostic names to run, defaults to DEFAULT_HEALTH_REPORT_DIAGNOSTICS
+        min_exec_time (int): Minimum mean execution time (ms) for slow query diagnostics
+        timeout_seconds (float): Statement timeout and wait limit for each diagnostic
+
+    Returns:
+        dict: Diagnostic name -> output, error and duration, in the requested order
+    """
+    diagnostics = diagnostics or DEFAULT_HEALTH_REPORT_DIAGNOSTICS
+    unknown = [name for name in diagnostics if name not in HEALTH_REPORT_DIAGNOSTICS]
+    if unknown:
+        valid = ', '.join(HEALTH_REPORT_DIAGNOSTICS.keys())
+        raise ValueError(f"Unknown diagnostics: {', '.join(unknown)}. Valid diagnostics are: {valid}")
+
+    # Resolve the secret once so the workers don't all fetch it
+    get_secret(secret_name)
+
+    max_workers = min(HEALTH_REPORT_MAX_WORKERS, len(diagnostics))
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {
+            name: executor.submit(_run_health_diagnostic, name, secret_name, min_exec_time, timeout_seconds)
+            for name in diagnostics
+        }
+        # Queued diagnostics wait for a worker, so allow for every round of workers
+        rounds = -(-len(diagnostics) // max_workers)
+        deadline = time.monotonic() + timeout_seconds * rounds + 5
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result(timeout=max(deadline - time.monotonic(), 0))
+            except FutureTimeoutError:
+                future.cancel()
+                results[name] = {
+                    'output': None,
+                    'error': f"Timed out after {timeout_seconds}s",
+                    'duration_sec': timeout_seconds
+                }
+        return results
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def format_results_for_full_health_report(results):
+    """Merge the formatted output of each diagnostic into one report"""
+    total_time = sum(result['duration_sec'] for result in results.values())
+    failed = [name for name, result in results.items() if result['error']]
+
+    output = "Database Full Health Report\n\n"
+    output += f"Diagnostics run: {len(results)}"
+    if failed:
+        output += f" ({len(failed)} failed: {', '.join(failed)})"
+    output += f"\nCombined diagnostic time: {total_time:.2f}s\n"
+
+    for name, result in results.items():
+        output += f"\n{'=' * 60}\n{name.upper()} ({result['duration_sec']:.2f}s)\n{'=' * 60}\n"
+        if result['error']:
+            output += f"⚠️ Diagnostic failed: {result['error']}\n"
+        else:
+            output += f"{result['output']}\n"
+
+    return output
+
 def lambda_handler(event, context):
     try:
         print(f"Received event: {json.dumps(event)}")
@@ -1670,10 +1941,24 @@ def lambda_handler(event, context):
             print("Executing long-running transactions analysis")
             results = execute_long_running_transactions(secret_name)
             formatted_output = format_results_for_long_running_transactions(results)
+        elif action_type == 'full_health_report':
+            print("Executing full health report")
+            args = event['arguments'] if 'arguments' in event else event
+            diagnostics = args.get('diagnostics')
+            if isinstance(diagnostics, str):
+                diagnostics = [name.strip() for name in diagnostics.split(',') if name.strip()]
+            timeout_seconds = float(args.get('diagnostic_timeout') or DEFAULT_DIAGNOSTIC_TIMEOUT_SECONDS)
+            results = execute_full_health_report(
+                secret_name,
+                diagnostics=diagnostics,
+                min_exec_time=min_exec_time,
+                timeout_seconds=timeout_seconds
+            )
+            formatted_output = format_results_for_full_health_report(results)
         else:
             return {
                 "functionResponse": {
-                    "content": f"Error: Unknown action_type '{action_type}'. Available actions: slow_query, connection_management_issues, index_analysis, autovacuum_analysis, io_analysis, replication_analysis, system_health, vacuum_progress, xid_analysis, bloat_analysis, long_running_transactions"
+                    "content": f"Error: Unknown action_type '{action_type}'. Available actions: slow_query, connection_management_issues, index_analysis, autovacuum_analysis, io_analysis, replication_analysis, system_health, vacuum_progress, xid_analysis, bloat_analysis, long_running_transactions, full_health_report"
                 }
             }
 
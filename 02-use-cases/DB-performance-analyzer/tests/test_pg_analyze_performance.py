@@ -0,0 +1,60 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("boto3")
+pytest.importorskip("psycopg2")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from pg_analyze_performance import (
+    add_row_limit,
+    fingerprint_query,
+    split_sql_statements,
+    validate_statements,
+)
+
+
+def _limited(query, limit=21):
+    [(stmt, tokens)] = validate_statements(query)
+    return add_row_limit(stmt, tokens, limit)
+
+
+class TestAddRowLimit:
+    def test_appends_limit(self):
+        assert _limited("SELECT * FROM orders") == "SELECT * FROM orders\nLIMIT 21"
+
+    def test_trailing_line_comment_is_dropped(self):
+        limited = _limited("SELECT * FROM orders -- all orders\n;")
+        assert limited == "SELECT * FROM orders\nLIMIT 21"
+
+    def test_trailing_line_comment_without_newline(self):
+        [(stmt, tokens)] = split_sql_statements("SELECT * FROM orders -- all orders")
+        limited = add_row_limit(stmt, tokens, 21)
+        assert limited.endswith("\nLIMIT 21")
+        assert "--" not in limited
+
+    def test_existing_limit_is_kept(self):
+        assert (
+            _limited("SELECT * FROM orders LIMIT 5") == "SELECT * FROM orders LIMIT 5"
+        )
+
+    def test_limit_in_comment_or_string_is_ignored(self):
+        assert _limited("SELECT 'limit' FROM orders /* limit */").endswith("\nLIMIT 21")
+
+    def test_limit_in_subquery_is_ignored(self):
+        limited = _limited("SELECT * FROM (SELECT id FROM orders LIMIT 5) o")
+        assert limited.endswith(") o\nLIMIT 21")
+
+
+class TestFingerprintQuery:
+    def test_literals_are_normalized(self):
+        assert fingerprint_query("select * from t where id = 42") == fingerprint_query(
+            "SELECT *  FROM t WHERE id = 7 -- by id"
+        )
+
+    def test_parameters_are_not_literals(self):
+        assert fingerprint_query("SELECT * FROM t WHERE id = $1") != fingerprint_query(
+            "SELECT * FROM t WHERE id = 42"
+        )
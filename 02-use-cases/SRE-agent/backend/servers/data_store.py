@@ -0,0 +1,269 @@
+import json
+import logging
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+# Configure logging with basicConfig
+logging.basicConfig(
+    level=logging.INFO,  # Set the log level to INFO
+    # Define log message format
+    format="%(asctime)s,p%(process)s,{%(filename)s:%(lineno)d},%(levelname)s,%(message)s",
+)
+
+
+def parse_timestamp(timestamp_str: str) -> Optional[datetime]:
+    """Parse ISO timestamp string to a timezone-aware datetime, or None if invalid"""
+    try:
+        # Handle both with and without timezone
+        if timestamp_str.endswith("Z"):
+            parsed = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+        else:
+            parsed = datetime.fromisoformat(timestamp_str)
+    except (TypeError, ValueError):
+        return None
+
+    # Timestamps without an offset are treated as UTC
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _load_json(file_path: Path) -> Any:
+    """Load a JSON file"""
+    with open(file_path, "r") as f:
+        return json.load(f)
+
+
+class _Snapshot:
+    """Records and indexes built from one version of a data file"""
+
+    def __init__(self):
+        self.data: Any = None
+        self.records: List[Dict[str, Any]] = []
+        self.indexes: Dict[str, Dict[Any, List[int]]] = {}
+        self.time_keys: List[float] = []
+        self.time_positions: List[int] = []
+        self.unparsed_time_positions: List[int] = []
+        self.search_text: List[str] = []
+
+
+class Dataset:
+    """A data file loaded once, indexed, and reloaded when the file changes.
+
+    Records are taken from the top-level list (or the list under records_key)
+    and indexed by each of index_fields for exact-match lookups. If time_field
+    is set, record timestamps are parsed once and kept in a sorted index so
+    time range queries use bisect instead of scanning every record. If
+    search_fields are set, a lowercased search text is built per record for
+    case-insensitive substring search. Loaders that already have the search
+    text (e.g. raw log lines) can return it as a list under search_text_key.
+
+    Query results keep the original file order and share record objects with
+    the dataset, so callers must not modify returned records.
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        records_key: Optional[str] = None,
+        index_fields: Sequence[str] = (),
+        time_field: Optional[str] = None,
+        search_fields: Sequence[str] = (),
+        search_text_key: Optional[str] = None,
+        loader: Callable[[Path], Any] = _load_json,
+        reload_check_interval: float = 1.0,
+    ):
+        self.file_path = Path(file_path)
+        self.records_key = records_key
+        self.index_fields = tuple(index_fields)
+        self.time_field = time_field
+        self.search_fields = tuple(search_fields)
+        self.search_text_key = search_text_key
+        self.loader = loader
+        self.reload_check_interval = reload_check_interval
+
+        self._lock = threading.Lock()
+        self._file_signature = None
+        self._last_check = 0.0
+        self._snapshot = _Snapshot()
+
+    @property
+    def data(self) -> Any:
+        """The full parsed file contents"""
+        return self._refresh().data
+
+    @property
+    def records(self) -> List[Dict[str, Any]]:
+        """All records in file order"""
+        return self._refresh().records
+
+    def exists(self) -> bool:
+        """Whether the underlying file exists"""
+        return self.file_path.exists()
+
+    def get(self, field: str, value: Any) -> List[Dict[str, Any]]:
+        """Get records whose indexed field equals value"""
+        snapshot = self._refresh()
+        return [snapshot.records[p] for p in snapshot.indexes[field].get(value, [])]
+
+    def query(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        search: Optional[str] = None,
+        **filters: Any,
+    ) -> List[Dict[str, Any]]:
+        """Get records matching all filters, in file order.
+
+        Args:
+            start: Only include records with a timestamp at or after start
+            end: Only include records with a timestamp at or before end
+            search: Case-insensitive substring that must appear in a search field
+            **filters: Indexed field values that must match exactly (None is ignored)
+        """
+        snapshot = self._refresh()
+        positions = self._query_positions(snapshot, start, end, search, filters)
+        return [snapshot.records[p] for p in positions]
+
+    def _query_positions(
+        self,
+        snapshot: _Snapshot,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        search: Optional[str],
+        filters: Dict[str, Any],
+    ) -> List[int]:
+        """Positions of records matching all filters, in file order"""
+        candidates: Optional[set] = None
+        for field, value in filters.items():
+            if value is None:
+                continue
+            matches = snapshot.indexes[field].get(value, [])
+            candidates = (
+                set(matches) if candidates is None else candidates.intersection(matches)
+            )
+            if not candidates:
+                return []
+
+        if start is not None or end is not None:
+            in_range = set(self._positions_in_time_range(snapshot, start, end))
+            candidates = (
+                in_range if candidates is None else candidates.intersection(in_range)
+            )
+
+        positions: Iterable[int] = (
+            sorted(candidates)
+            if candidates is not None
+            else range(len(snapshot.records))
+        )
+
+        if search:
+            needle = search.lower()
+            positions = [p for p in positions if needle in snapshot.search_text[p]]
+
+        return list(positions)
+
+    @staticmethod
+    def _positions_in_time_range(
+        snapshot: _Snapshot, start: Optional[datetime], end: Optional[datetime]
+    ) -> List[int]:
+        """Positions of records whose timestamp falls within [start, end]"""
+        keys = snapshot.time_keys
+        lo = bisect_left(keys, start.timestamp()) if start else 0
+        hi = bisect_right(keys, end.timestamp()) if end else len(keys)
+        positions = snapshot.time_positions[lo:hi]
+
+        # Unparseable timestamps are treated as the current time
+        if snapshot.unparsed_time_positions:
+            now = datetime.now(timezone.utc)
+            if (start is None or now >= start) and (end is None or now <= end):
+                positions = positions + snapshot.unparsed_time_positions
+        return positions
+
+    def _refresh(self) -> _Snapshot:
+        """Load the file on first use, reload it if it has changed, and return
+        the current snapshot"""
+        now = time.monotonic()
+        if self._file_signature is not None and (
+            now - self._last_check < self.reload_check_interval
+        ):
+            return self._snapshot
+
+        with self._lock:
+            if self._file_signature is None or (
+                now - self._last_check >= self.reload_check_interval
+            ):
+                stat = self.file_path.stat()
+                signature = (stat.st_mtime_ns, stat.st_size)
+                if signature != self._file_signature:
+                    self._snapshot = self._build(self.loader(self.file_path))
+                    if self._file_signature is not None:
+                        logging.info(f"Reloaded changed data file {self.file_path}")
+                    self._file_signature = signature
+                self._last_check = now
+            return self._snapshot
+
+    def _build(self, data: Any) -> _Snapshot:
+        """Build records and indexes from freshly loaded data"""
+        if self.records_key is not None and isinstance(data, dict):
+            records = data.get(self.records_key, [])
+        elif isinstance(data, list):
+            records = data
+        else:
+            records = []
+
+        indexes: Dict[str, Dict[Any, List[int]]] = {f: {} for f in self.index_fields}
+        timed = []
+        unparsed = []
+        search_text = []
+
+        for position, record in enumerate(records):
+            if not isinstance(record, dict):
+                record = {}
+
+            for field in self.index_fields:
+                value = record.get(field)
+                if value is not None:
+                    indexes[field].setdefault(value, []).append(position)
+
+            if self.time_field:
+                timestamp = record.get(self.time_field)
+                # Records without a timestamp never match a time range
+                if timestamp:
+                    parsed = parse_timestamp(timestamp)
+                    if parsed is None:
+                        unparsed.append(position)
+                    else:
+                        timed.append((parsed.timestamp(), position))
+
+            if self.search_fields:
+                parts = []
+                for field in self.search_fields:
+                    value = record.get(field)
+                    if isinstance(value, list):
+                        parts.extend(str(v) for v in value)
+                    elif value is not None:
+                        parts.append(str(value))
+                # NUL separator so a search term can't match across fields
+                search_text.append("\x00".join(parts).lower())
+
+        timed.sort()
+
+        if self.search_text_key is not None and isinstance(data, dict):
+            search_text = [text.lower() for text in data.get(self.search_text_key, [])]
+
+        # Readers hold on to a whole snapshot, so a reload never mixes versions
+        snapshot = _Snapshot()
+        snapshot.data = data
+        snapshot.records = records
+        snapshot.indexes = indexes
+        snapshot.time_keys = [key for key, _ in timed]
+        snapshot.time_positions = [position for _, position in timed]
+        snapshot.unparsed_time_positions = unparsed
+        snapshot.search_text = search_text
+        logging.info(f"Loaded {len(records)} records from {self.file_path}")
+        return snapshot
@@ -1,10 +1,10 @@
-import json
 import logging
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 from typing import List, Optional
 
+from data_store import Dataset, parse_timestamp
 from fastapi import (
     Depends,
     FastAPI,
@@ -27,6 +27,24 @@ app = FastAPI(title="Kubernetes Analysis API", version="1.0.0")
 # Base path for fake data
 DATA_PATH = Path(__file__).parent.parent / "data" / "k8s_data"
 
+# Datasets are loaded once, indexed, and reloaded when the file changes
+PODS = Dataset(
+    DATA_PATH / "pods.json", records_key="pods", index_fields=("namespace", "name")
+)
+DEPLOYMENTS = Dataset(
+    DATA_PATH / "deployments.json",
+    records_key="deployments",
+    index_fields=("namespace", "name"),
+)
+EVENTS = Dataset(
+    DATA_PATH / "events.json",
+    records_key="events",
+    index_fields=("type",),
+    time_field="timestamp",
+)
+RESOURCE_USAGE = Dataset(DATA_PATH / "resource_usage.json")
+NODES = Dataset(DATA_PATH / "nodes.json", records_key="nodes", index_fields=("name",))
+
 # API Key for authentication
 CREDENTIAL_PROVIDER_NAME = "sre-agent-api-key-credential-provider"
 
@@ -52,42 +70,8 @@ def _validate_api_key(x_api_key: str = Header(None, alias="X-API-Key")):
 
 def _parse_timestamp(timestamp_str: str) -> datetime:
     """Parse ISO timestamp string to datetime object"""
-    try:
-        # Handle both with and without timezone
-        if timestamp_str.endswith("Z"):
-            return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-        elif "+" in timestamp_str or timestamp_str.endswith("0"):
-            return datetime.fromisoformat(timestamp_str)
-        else:
-            return datetime.fromisoformat(timestamp_str + "+00:00")
-    except:
-        # Fallback: assume current time if parsing fails
-        return datetime.now(timezone.utc)
-
-
-def _filter_events_by_time(events: list, since: Optional[str] = None) -> list:
-    """Filter events by since timestamp"""
-    if not since:
-        return events
-
-    filtered_events = []
-    since_dt = _parse_timestamp(since)
-
-    for event in events:
-        event_timestamp = event.get("timestamp")
-        if not event_timestamp:
-            continue
-
-        try:
-            event_dt = _parse_timestamp(event_timestamp)
-
-            if event_dt >= since_dt:
-                filtered_events.append(event)
-        except:
-            # Include events with unparseable timestamps
-            filtered_events.append(event)
-
-    return filtered_events
+    # Fallback: assume current time if parsing fails
+    return parse_timestamp(timestamp_str) or datetime.now(timezone.utc)
 
 
 # Pydantic Models
@@ -249,18 +233,8 @@ async def get_pod_status(
         HTTPException: 500 if data retrieval fails
     """
     try:
-        with open(DATA_PATH / "pods.json", "r") as f:
-            data = json.load(f)
-
-        pods = data.get("pods", [])
-
-        # Filter by namespace if provided
-        if namespace:
-            pods = [p for p in pods if p.get("namespace") == namespace]
-
-        # Filter by pod name if provided
-        if pod_name:
-            pods = [p for p in pods if p.get("name") == pod_name]
+        # Filter by namespace and pod name if provided
+        pods = PODS.query(namespace=namespace or None, name=pod_name or None)
 
         return PodStatusResponse(pods=pods)
     except Exception as e:
@@ -296,16 +270,9 @@ async def get_deployment_status(
         HTTPException: 500 if data retrieval fails
     """
     try:
-        with open(DATA_PATH / "deployments.json", "r") as f:
-            data = json.load(f)
-
-        deployments = data.get("deployments", [])
-
-        if namespace:
-            deployments = [d for d in deployments if d.get("namespace") == namespace]
-
-        if deployment_name:
-            deployments = [d for d in deployments if d.get("name") == deployment_name]
+        deployments = DEPLOYMENTS.query(
+            namespace=namespace or None, name=deployment_name or None
+        )
 
         return DeploymentStatusResponse(deployments=deployments)
     except Exception as e:
@@ -345,16 +312,10 @@ async def get_cluster_events(
         HTTPException: 500 if data retrieval fails
     """
     try:
-        with open(DATA_PATH / "events.json", "r") as f:
-            data = json.load(f)
-
-        events = data.get("events", [])
-
-        if severity:
-            events = [e for e in events if e.get("type") == severity]
-
-        # Filter by since timestamp
-        events = _filter_events_by_time(events, since)
+        # Filter by severity and since timestamp
+        events = EVENTS.query(
+            start=_parse_timestamp(since) if since else None, type=severity or None
+        )
 
         return EventsResponse(events=events)
     except Exception as e:
@@ -390,10 +351,7 @@ async def get_resource_usage(
         HTTPException: 500 if data retrieval fails
     """
     try:
-        with open(DATA_PATH / "resource_usage.json", "r") as f:
-            data = json.load(f)
-
-        resource_usage = data.get("resource_usage", {})
+        resource_usage = RESOURCE_USAGE.data.get("resource_usage", {})
 
         # Filter by namespace if provided
         if namespace and "namespace_usage" in resource_usage:
@@ -434,13 +392,7 @@ async def get_node_status(
         HTTPException: 500 if data retrieval fails
     """
     try:
-        with open(DATA_PATH / "nodes.json", "r") as f:
-            data = json.load(f)
-
-        nodes = data.get("nodes", [])
-
-        if node_name:
-            nodes = [n for n in nodes if n.get("name") == node_name]
+        nodes = NODES.query(name=node_name or None)
 
         return {"nodes": nodes}
     except Exception as e:
@@ -0,0 +1,353 @@
+import logging
+import math
+import re
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from data_store import parse_timestamp
+
+# Configure logging with basicConfig
+logging.basicConfig(
+    level=logging.INFO,  # Set the log level to INFO
+    # Define log message format
+    format="%(asctime)s,p%(process)s,{%(filename)s:%(lineno)d},%(levelname)s,%(message)s",
+)
+
+# Words that are indexed and looked up
+_TOKEN_RE = re.compile(r"\w+")
+
+# Supported ways of matching a search pattern against a log line
+MATCH_PHRASE = "phrase"
+MATCH_ALL_TERMS = "all_terms"
+MATCH_REGEX = "regex"
+MATCH_MODES = (MATCH_PHRASE, MATCH_ALL_TERMS, MATCH_REGEX)
+
+
+def _tokenize(text: str) -> List[str]:
+    """Split lowercased text into indexed words"""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _intersect(positions: Iterable[int], other: Iterable[int]) -> List[int]:
+    """Line numbers present in both sorted sequences, in order"""
+    keep = set(other)
+    return [p for p in positions if p in keep]
+
+
+class _IndexSnapshot:
+    """Line offsets and postings built from one version of a log file"""
+
+    def __init__(self):
+        # Byte offset of every line start, plus the end of the file
+        self.offsets = array("Q", [0])
+        self.postings: Dict[str, array] = {}
+        self.levels: Dict[str, array] = {}
+        # Epoch seconds per line, NaN when the line has no timestamp
+        self.times = array("d")
+        self.unparsed_times: Set[int] = set()
+
+    @property
+    def line_count(self) -> int:
+        return len(self.offsets) - 1
+
+
+class LogIndex:
+    """A tokenized inverted index over a text log file.
+
+    The file is scanned once (and again whenever its mtime or size changes)
+    to record the byte offset of every line and a posting list of line
+    numbers for every word, log level and timestamp. Searches narrow the
+    candidate lines with the index and then read only those lines from disk,
+    so the file is never held in memory as a whole.
+
+    Results are paged with a cursor: the line number to resume from, which
+    is returned as next_cursor while more matches remain.
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        parse_line: Callable[[str], Dict[str, Any]],
+        reload_check_interval: float = 1.0,
+    ):
+        self.file_path = Path(file_path)
+        self.parse_line = parse_line
+        self.reload_check_interval = reload_check_interval
+
+        self._lock = threading.Lock()
+        self._file_signature = None
+        self._last_check = 0.0
+        self._snapshot = _IndexSnapshot()
+
+    def exists(self) -> bool:
+        """Whether the underlying file exists"""
+        return self.file_path.exists()
+
+    def refresh(self) -> None:
+        """Build the index now instead of on the first search"""
+        self._refresh()
+
+    def search_page(
+        self,
+        pattern: str,
+        match: str = MATCH_PHRASE,
+        level: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        cursor: int = 0,
+        limit: int = 100,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Get one page of matching log records and the cursor of the next page"""
+        logs = []
+        for line_number, record in self.search(
+            pattern, match, level, start, end, cursor
+        ):
+            if len(logs) == limit:
+                return logs, line_number
+            logs.append(record)
+        return logs, None
+
+    def search(
+        self,
+        pattern: str,
+        match: str = MATCH_PHRASE,
+        level: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        cursor: int = 0,
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Get a lazy iterator of (line number, record) for matching lines in
+        file order.
+
+        Args:
+            pattern: Search pattern, interpreted according to match
+            match: "phrase" for a case-insensitive substring (the default),
+                "all_terms" for lines containing every whitespace-separated
+                term as words, or "regex" for a case-insensitive regex
+            level: Only include lines with this log level
+            start: Only include lines with a timestamp at or after start
+            end: Only include lines with a timestamp at or before end
+            cursor: Line number to start searching from
+
+        Raises:
+            ValueError: If match is unknown or the regex is invalid
+        """
+        if match not in MATCH_MODES:
+            raise ValueError(f"Unknown match mode: {match}")
+        if match == MATCH_REGEX:
+            try:
+                regex = re.compile(pattern, re.IGNORECASE)
+            except re.error as e:
+                raise ValueError(f"Invalid regex pattern: {e}") from e
+            matches_line = lambda line: regex.search(line) is not None  # noqa: E731
+        elif match == MATCH_ALL_TERMS:
+            terms = pattern.lower().split()
+            matches_line = lambda line: all(t in line.lower() for t in terms)  # noqa: E731
+        else:
+            needle = pattern.lower()
+            matches_line = lambda line: needle in line.lower()  # noqa: E731
+
+        # Validate eagerly, before the caller starts consuming results
+        snapshot = self._refresh()
+        return self._iter_matches(
+            snapshot, pattern, match, matches_line, level, start, end, cursor
+        )
+
+    def _iter_matches(
+        self,
+        snapshot: _IndexSnapshot,
+        pattern: str,
+        match: str,
+        matches_line: Callable[[str], bool],
+        level: Optional[str],
+        start: Optional[datetime],
+        end: Optional[datetime],
+        cursor: int,
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Yield (line number, record) for candidate lines that match"""
+        candidates = self._candidates(snapshot, pattern, match, level)
+        # Skip lines before the cursor without visiting them
+        if isinstance(candidates, range):
+            candidates = range(max(cursor, 0), snapshot.line_count)
+        else:
+            candidates = candidates[bisect_left(candidates, cursor) :]
+        start_ts = start.timestamp() if start else None
+        end_ts = end.timestamp() if end else None
+
+        with open(self.file_path, "rb") as f:
+            for line_number in candidates:
+                if (start_ts is not None or end_ts is not None) and not (
+                    self._in_time_range(snapshot, line_number, start_ts, end_ts)
+                ):
+                    continue
+                line = self._read_line(f, snapshot, line_number)
+                if matches_line(line):
+                    yield line_number, self.parse_line(line)
+
+    def recent(self, limit: int, service: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get the last limit records, most recent first, reading from the end"""
+        snapshot = self._refresh()
+        logs = []
+        with open(self.file_path, "rb") as f:
+            for line_number in range(snapshot.line_count - 1, -1, -1):
+                record = self.parse_line(self._read_line(f, snapshot, line_number))
+                if service and service not in record.get("service", ""):
+                    continue
+                logs.append(record)
+                if len(logs) == limit:
+                    break
+        return logs
+
+    def _candidates(
+        self,
+        snapshot: _IndexSnapshot,
+        pattern: str,
+        match: str,
+        level: Optional[str],
+    ) -> Iterable[int]:
+        """Line numbers that can match, narrowed by the index, in file order"""
+        candidates: Optional[List[int]] = None
+
+        if match == MATCH_ALL_TERMS:
+            # Every word of every term must be indexed for the line
+            for token in _tokenize(pattern):
+                postings = snapshot.postings.get(token, ())
+                candidates = (
+                    list(postings)
+                    if candidates is None
+                    else _intersect(candidates, postings)
+                )
+                if not candidates:
+                    return []
+        elif match == MATCH_PHRASE:
+            # A phrase may start or end mid-word, so each of its words can be
+            # part of a longer indexed word
+            for token in _tokenize(pattern):
+                lines: Set[int] = set()
+                for term, postings in snapshot.postings.items():
+                    if token in term:
+                        lines.update(postings)
+                candidates = (
+                    sorted(lines)
+                    if candidates is None
+                    else _intersect(candidates, lines)
+                )
+                if not candidates:
+                    return []
+
+        if level:
+            postings = snapshot.levels.get(level, ())
+            candidates = (
+                list(postings)
+                if candidates is None
+                else _intersect(candidates, postings)
+            )
+
+        return range(snapshot.line_count) if candidates is None else candidates
+
+    @staticmethod
+    def _in_time_range(
+        snapshot: _IndexSnapshot,
+        line_number: int,
+        start_ts: Optional[float],
+        end_ts: Optional[float],
+    ) -> bool:
+        """Whether a line's timestamp falls within [start, end]"""
+        if line_number in snapshot.unparsed_times:
+            # Unparseable timestamps are treated as the current time
+            line_ts = datetime.now(timezone.utc).timestamp()
+        else:
+            line_ts = snapshot.times[line_number]
+            # Lines without a timestamp never match a time range
+            if math.isnan(line_ts):
+                return False
+        if start_ts is not None and line_ts < start_ts:
+            return False
+        if end_ts is not None and line_ts > end_ts:
+            return False
+        return True
+
+    @staticmethod
+    def _read_line(f, snapshot: _IndexSnapshot, line_number: int) -> str:
+        """Read one line from an open log file using the offset index"""
+        offset = snapshot.offsets[line_number]
+        f.seek(offset)
+        data = f.read(snapshot.offsets[line_number + 1] - offset)
+        return data.decode("utf-8", errors="replace")
+
+    def _refresh(self) -> _IndexSnapshot:
+        """Build the index on first use, rebuild it if the file has changed,
+        and return the current snapshot"""
+        now = time.monotonic()
+        if self._file_signature is not None and (
+            now - self._last_check < self.reload_check_interval
+        ):
+            return self._snapshot
+
+        with self._lock:
+            if self._file_signature is None or (
+                now - self._last_check >= self.reload_check_interval
+            ):
+                stat = self.file_path.stat()
+                signature = (stat.st_mtime_ns, stat.st_size)
+                if signature != self._file_signature:
+                    self._snapshot = self._build()
+                    if self._file_signature is not None:
+                        logging.info(f"Rebuilt index for changed log {self.file_path}")
+                    self._file_signature = signature
+                self._last_check = now
+            return self._snapshot
+
+    def _build(self) -> _IndexSnapshot:
+        """Scan the log file once and build line offsets and postings"""
+        started_at = time.monotonic()
+        snapshot = _IndexSnapshot()
+        postings: Dict[str, array] = {}
+        levels: Dict[str, array] = {}
+
+        with open(self.file_path, "rb") as f:
+            offset = 0
+            for line_number, raw_line in enumerate(f):
+                offset += len(raw_line)
+                snapshot.offsets.append(offset)
+                line = raw_line.decode("utf-8", errors="replace")
+
+                for token in set(_tokenize(line)):
+                    postings.setdefault(token, array("I")).append(line_number)
+
+                record = self.parse_line(line)
+                level = record.get("level")
+                if level is not None:
+                    levels.setdefault(level, array("I")).append(line_number)
+
+                line_ts = math.nan
+                timestamp = record.get("timestamp")
+                if timestamp:
+                    parsed = parse_timestamp(timestamp)
+                    if parsed is None:
+                        snapshot.unparsed_times.add(line_number)
+                    else:
+                        line_ts = parsed.timestamp()
+                snapshot.times.append(line_ts)
+
+        snapshot.postings = postings
+        snapshot.levels = levels
+        logging.info(
+            f"Indexed {snapshot.line_count} lines and {len(postings)} terms from {self.file_path} in {time.monotonic() - started_at:.2f}s"
+        )
+        return snapshot
@@ -1,9 +1,11 @@
+import asyncio
 import json
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, Tuple
 
+from data_store import Dataset, parse_timestamp
 from fastapi import (
     Depends,
     FastAPI,
@@ -11,7 +13,8 @@ from fastapi import (
     HTTPException,
     Query,
 )
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from log_index import MATCH_MODES, MATCH_PHRASE, LogIndex
 from retrieve_api_key import retrieve_api_key
 
 # Configure logging with basicConfig
@@ -50,98 +53,52 @@ def _validate_api_key(x_api_key: str = Header(None, alias="X-API-Key")):
 
 def _parse_timestamp(timestamp_str: str) -> datetime:
     """Parse ISO timestamp string to datetime object"""
-    try:
-        # Handle both with and without timezone
-        if timestamp_str.endswith("Z"):
-            return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-        elif "+" in timestamp_str or timestamp_str.endswith("0"):
-            return datetime.fromisoformat(timestamp_str)
-        else:
-            return datetime.fromisoformat(timestamp_str + "+00:00")
-    except:
-        # Fallback: assume current time if parsing fails
-        return datetime.now(timezone.utc)
+    # Fallback: assume current time if parsing fails
+    return parse_timestamp(timestamp_str) or datetime.now(timezone.utc)
 
 
-def _filter_by_time(
-    logs: list, start_time: Optional[str] = None, end_time: Optional[str] = None
-) -> list:
-    """Filter logs by time range"""
-    if not start_time and not end_time:
-        return logs
+def _parse_log_line(line: str) -> dict:
+    """Parse a log line to extract timestamp, level, service and message"""
+    parts = line.strip().split(" ", 3)
+    if len(parts) < 4:
+        return {"message": line.strip()}
 
-    filtered_logs = []
-    start_dt = _parse_timestamp(start_time) if start_time else None
-    end_dt = _parse_timestamp(end_time) if end_time else None
+    timestamp = parts[0]
+    level_part = parts[1]
+    service = parts[2]
+    message = parts[3] if len(parts) > 3 else ""
 
-    for log in logs:
-        log_timestamp = log.get("timestamp")
-        if not log_timestamp:
-            continue
+    # Extract log level from [LEVEL] format
+    level = "INFO"
+    if "[" in level_part and "]" in level_part:
+        level = level_part.strip("[]")
 
-        try:
-            log_dt = _parse_timestamp(log_timestamp)
-
-            if start_dt and log_dt < start_dt:
-                continue
-            if end_dt and log_dt > end_dt:
-                continue
-
-            filtered_logs.append(log)
-        except:
-            # Include logs with unparseable timestamps
-            filtered_logs.append(log)
-
-    return filtered_logs
-
-
-def _parse_log_file(file_path: Path, pattern: Optional[str] = None):
-    """Parse log file and filter by pattern"""
-    logs = []
-
-    if file_path.suffix == ".json":
-        with open(file_path, "r") as f:
-            data = json.load(f)
-            # Handle both array and object with array
-            if isinstance(data, list):
-                logs = data
-            elif isinstance(data, dict):
-                # Get the first array value in the dict
-                for key, value in data.items():
-                    if isinstance(value, list):
-                        logs = value
-                        break
+    return {
+        "timestamp": timestamp,
+        "level": level,
+        "service": service,
+        "message": message,
+    }
+
+
+# Text logs are indexed by word and read line by line from disk on demand
+APPLICATION_LOG_INDEX = LogIndex(DATA_PATH / "application.log", _parse_log_line)
+
+# Datasets are loaded once, indexed, and reloaded when the file changes
+ERROR_LOGS = Dataset(
+    DATA_PATH / "error.log", index_fields=("service",), time_field="timestamp"
+)
+LOG_PATTERNS = Dataset(DATA_PATH / "log_patterns.json")
+LOG_COUNTS = Dataset(DATA_PATH / "log_counts.json")
+
+
+@app.on_event("startup")
+async def build_log_index():
+    """Build the log search index at startup instead of on the first search"""
+    if APPLICATION_LOG_INDEX.exists():
+        await asyncio.to_thread(APPLICATION_LOG_INDEX.refresh)
     else:
-        # Parse text log files
-        with open(file_path, "r") as f:
-            for line in f:
-                if pattern and pattern.lower() not in line.lower():
-                    continue
-                # Parse log line to extract timestamp, level, and message
-                parts = line.strip().split(" ", 3)
-                if len(parts) >= 4:
-                    timestamp = parts[0]
-                    level_part = parts[1]
-                    service = parts[2]
-                    message = parts[3] if len(parts) > 3 else ""
-
-                    # Extract log level from [LEVEL] format
-                    level = "INFO"
-                    if "[" in level_part and "]" in level_part:
-                        level = level_part.strip("[]")
-
-                    logs.append(
-                        {
-                            "timestamp": timestamp,
-                            "level": level,
-                            "service": service,
-                            "message": message,
-                        }
-                    )
-                else:
-                    logs.append({"message": line.strip()})
-
-    return logs
+        logging.warning(f"Log file {APPLICATION_LOG_INDEX.file_path} not found")
 
 
 @app.get("/logs/search")
@@ -152,27 +109,94 @@ async def search_logs(
     log_level: Optional[str] = Query(
         None, enum=["ERROR", "WARN", "INFO", "DEBUG"], description="Filter by log level"
     ),
+    match: str = Query(
+        MATCH_PHRASE,
+        enum=list(MATCH_MODES),
+        description="Match the pattern as a phrase, as all of its terms, or as a regex",
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor returned as next_cursor by the previous page"
+    ),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum logs per page"),
+    response_format: str = Query(
+        "json",
+        alias="format",
+        enum=["json", "ndjson"],
+        description="Return one JSON document or stream newline-delimited JSON",
+    ),
     api_key: str = Depends(_validate_api_key),
 ):
     """Search logs by pattern/timeframe"""
     try:
-        application_logs = _parse_log_file(DATA_PATH / "application.log", pattern)
-
-        # Filter by log level if provided
-        if log_level:
-            application_logs = [
-                log for log in application_logs if log.get("level") == log_level
-            ]
+        try:
+            start_line = int(cursor) if cursor else 0
+            if start_line < 0:
+                raise ValueError(cursor)
+        except ValueError:
+            return JSONResponse(
+                status_code=400, content={"error": f"Invalid cursor: {cursor}"}
+            )
+
+        # Filter by pattern, log level and time range
+        search_args = {
+            "pattern": pattern,
+            "match": match,
+            "level": log_level or None,
+            "start": _parse_timestamp(start_time) if start_time else None,
+            "end": _parse_timestamp(end_time) if end_time else None,
+        }
 
-        # Filter by time range
-        application_logs = _filter_by_time(application_logs, start_time, end_time)
+        if response_format == "ndjson":
+            try:
+                # search() may rebuild the index, so run it off the event loop;
+                # StreamingResponse then iterates the matches in a threadpool
+                matches = await asyncio.to_thread(
+                    APPLICATION_LOG_INDEX.search, cursor=start_line, **search_args
+                )
+            except ValueError as e:
+                return JSONResponse(status_code=400, content={"error": str(e)})
+            return StreamingResponse(
+                _stream_search_results(matches, limit),
+                media_type="application/x-ndjson",
+            )
 
-        return {"logs": application_logs[:100]}  # Limit results
+        try:
+            logs, next_cursor = await asyncio.to_thread(
+                APPLICATION_LOG_INDEX.search_page,
+                cursor=start_line,
+                limit=limit,
+                **search_args,
+            )
+        except ValueError as e:
+            return JSONResponse(status_code=400, content={"error": str(e)})
+
+        return {
+            "logs": logs,
+            "next_cursor": str(next_cursor) if next_cursor is not None else None,
+        }
     except Exception as e:
         logging.error(f"Error searching logs: {str(e)}")
         return JSONResponse(status_code=500, content={"error": str(e)})
 
 
+def _stream_search_results(matches: Iterator[Tuple[int, dict]], limit: int):
+    """Yield one JSON line per matching log, then a line with next_cursor"""
+    count = 0
+    next_cursor = None
+    try:
+        for line_number, log in matches:
+            if count == limit:
+                next_cursor = str(line_number)
+                break
+            yield json.dumps(log) + "\n"
+            count += 1
+    except Exception as e:
+        logging.error(f"Error streaming log search results: {str(e)}")
+        yield json.dumps({"error": str(e)}) + "\n"
+        return
+    yield json.dumps({"next_cursor": next_cursor}) + "\n"
+
+
 @app.get("/logs/errors")
 async def get_error_logs(
     since: Optional[str] = Query(None, description="Get errors since this timestamp"),
@@ -181,15 +205,10 @@ async def get_error_logs(
 ):
     """Retrieve error-specific entries"""
     try:
-        with open(DATA_PATH / "error.log", "r") as f:
-            error_logs = json.load(f)
-
-        if service:
-            error_logs = [log for log in error_logs if log.get("service") == service]
-
-        # Filter by since timestamp
-        if since:
-            error_logs = _filter_by_time(error_logs, start_time=since)
+        # Filter by service and since timestamp
+        error_logs = ERROR_LOGS.query(
+            start=_parse_timestamp(since) if since else None, service=service or None
+        )
 
         return {"errors": error_logs}
     except Exception as e:
@@ -212,14 +231,10 @@ async def analyze_log_patterns(
     """Identify recurring issues"""
     try:
         # Read patterns from actual data file
-        patterns_file = DATA_PATH / "log_patterns.json"
-        if not patterns_file.exists():
+        if not LOG_PATTERNS.exists():
             return {"patterns": []}
 
-        with open(patterns_file, "r") as f:
-            data = json.load(f)
-
-        patterns = data.get("patterns", [])
+        patterns = LOG_PATTERNS.data.get("patterns", [])
 
         # Filter by min_occurrences
         patterns = [p for p in patterns if p["count"] >= min_occurrences]
@@ -240,14 +255,10 @@ async def get_recent_logs(
 ):
     """Fetch latest log entries"""
     try:
-        all_logs = _parse_log_file(DATA_PATH / "application.log")
-
-        if service:
-            all_logs = [log for log in all_logs if service in log.get("service", "")]
-
-        # Return the most recent logs (last N entries)
-        recent_logs = all_logs[-limit:] if len(all_logs) > limit else all_logs
-        recent_logs.reverse()  # Most recent first
+        # Return the most recent logs (last N entries), most recent first
+        recent_logs = await asyncio.to_thread(
+            APPLICATION_LOG_INDEX.recent, limit, service
+        )
 
         return {"logs": recent_logs}
     except Exception as e:
@@ -271,12 +282,10 @@ async def count_log_events(
     """Count occurrences of specific events"""
     try:
         # Read counts from actual data file
-        counts_file = DATA_PATH / "log_counts.json"
-        if not counts_file.exists():
+        if not LOG_COUNTS.exists():
             return {"total_count": 0, "counts": []}
 
-        with open(counts_file, "r") as f:
-            data = json.load(f)
+        data = LOG_COUNTS.data
 
         if event_type.lower() == "error":
             error_data = data.get("error_counts", {})
@@ -1,9 +1,9 @@
-import json
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+from data_store import Dataset, parse_timestamp
 from fastapi import (
     Depends,
     FastAPI,
@@ -25,6 +25,37 @@ app = FastAPI(title="Application Metrics API", version="1.0.0")
 
 DATA_PATH = Path(__file__).parent.parent / "data" / "metrics_data"
 
+# Datasets are loaded once, indexed, and reloaded when the file changes
+RESPONSE_TIMES = Dataset(
+    DATA_PATH / "response_times.json",
+    records_key="metrics",
+    index_fields=("service",),
+    time_field="timestamp",
+)
+THROUGHPUT = Dataset(
+    DATA_PATH / "throughput.json",
+    records_key="metrics",
+    index_fields=("service",),
+    time_field="timestamp",
+)
+RESOURCE_USAGE = Dataset(
+    DATA_PATH / "resource_usage.json",
+    records_key="metrics",
+    index_fields=("service",),
+    time_field="timestamp",
+)
+ERROR_RATES = Dataset(
+    DATA_PATH / "error_rates.json",
+    records_key="error_rates",
+    index_fields=("service",),
+)
+AVAILABILITY = Dataset(
+    DATA_PATH / "availability.json",
+    records_key="availability_metrics",
+    index_fields=("service",),
+)
+TRENDS = Dataset(DATA_PATH / "trends.json")
+
 # API Key for authentication
 CREDENTIAL_PROVIDER_NAME = "sre-agent-api-key-credential-provider"
 
@@ -50,49 +81,8 @@ def _validate_api_key(x_api_key: str = Header(None, alias="X-API-Key")):
 
 def _parse_timestamp(timestamp_str: str) -> datetime:
     """Parse ISO timestamp string to datetime object"""
-    try:
-        # Handle both with and without timezone
-        if timestamp_str.endswith("Z"):
-            return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-        elif "+" in timestamp_str or timestamp_str.endswith("0"):
-            return datetime.fromisoformat(timestamp_str)
-        else:
-            return datetime.fromisoformat(timestamp_str + "+00:00")
-    except:
-        # Fallback: assume current time if parsing fails
-        return datetime.now(timezone.utc)
-
-
-def _filter_metrics_by_time(
-    metrics: list, start_time: Optional[str] = None, end_time: Optional[str] = None
-) -> list:
-    """Filter metrics by time range"""
-    if not start_time and not end_time:
-        return metrics
-
-    filtered_metrics = []
-    start_dt = _parse_timestamp(start_time) if start_time else None
-    end_dt = _parse_timestamp(end_time) if end_time else None
-
-    for metric in metrics:
-        metric_timestamp = metric.get("timestamp")
-        if not metric_timestamp:
-            continue
-
-        try:
-            metric_dt = _parse_timestamp(metric_timestamp)
-
-            if start_dt and metric_dt < start_dt:
-                continue
-            if end_dt and metric_dt > end_dt:
-                continue
-
-            filtered_metrics.append(metric)
-        except:
-            # Include metrics with unparseable timestamps
-            filtered_metrics.append(metric)
-
-    return filtered_metrics
+    # Fallback: assume current time if parsing fails
+    return parse_timestamp(timestamp_str) or datetime.now(timezone.utc)
 
 
 @app.get("/metrics/performance")
@@ -109,52 +99,43 @@ async def get_performance_metrics(
 ):
     """Retrieve performance data"""
     try:
-        metrics = []
+        # Filter by service and time range
+        filters = {
+            "start": _parse_timestamp(start_time) if start_time else None,
+            "end": _parse_timestamp(end_time) if end_time else None,
+            "service": service or None,
+        }
 
         if metric_type == "response_time":
-            with open(DATA_PATH / "response_times.json", "r") as f:
-                data = json.load(f)
-                metrics = data.get("metrics", [])
+            metrics = RESPONSE_TIMES.query(**filters)
         elif metric_type == "throughput":
-            with open(DATA_PATH / "throughput.json", "r") as f:
-                data = json.load(f)
-                metrics = data.get("metrics", [])
+            metrics = THROUGHPUT.query(**filters)
         elif metric_type in ["cpu_usage", "memory_usage"]:
-            with open(DATA_PATH / "resource_usage.json", "r") as f:
-                data = json.load(f)
-                raw_metrics = data.get("metrics", [])
-                # Transform resource metrics to match expected format
-                metrics = []
-                for m in raw_metrics:
-                    if metric_type == "cpu_usage":
-                        metrics.append(
-                            {
-                                "timestamp": m["timestamp"],
-                                "service": m["service"],
-                                "value": m["cpu_usage_percent"],
-                                "unit": "percent",
-                            }
-                        )
-                    else:  # memory_usage
-                        metrics.append(
-                            {
-                                "timestamp": m["timestamp"],
-                                "service": m["service"],
-                                "value": m["memory_usage_mb"],
-                                "unit": "MB",
-                            }
-                        )
+            raw_metrics = RESOURCE_USAGE.query(**filters)
+            # Transform resource metrics to match expected format
+            metrics = []
+            for m in raw_metrics:
+                if metric_type == "cpu_usage":
+                    metrics.append(
+                        {
+                            "timestamp": m["timestamp"],
+                            "service": m["service"],
+                            "value": m["cpu_usage_percent"],
+                            "unit": "percent",
+                        }
+                    )
+                else:  # memory_usage
+                    metrics.append(
+                        {
+                            "timestamp": m["timestamp"],
+                            "service": m["service"],
+                            "value": m["memory_usage_mb"],
+                            "unit": "MB",
+                        }
+                    )
         else:
             # Return combined metrics for demo
-            with open(DATA_PATH / "resource_usage.json", "r") as f:
-                data = json.load(f)
-                metrics = data.get("metrics", [])
-
-        if service:
-            metrics = [m for m in metrics if m.get("service") == service]
-
-        # Filter by time range
-        metrics = _filter_metrics_by_time(metrics, start_time, end_time)
+            metrics = RESOURCE_USAGE.query(**filters)
 
         return {"metrics": metrics}
     except Exception as e:
@@ -172,13 +153,7 @@ async def get_error_rates(
 ):
     """Fetch error rate statistics"""
     try:
-        with open(DATA_PATH / "error_rates.json", "r") as f:
-            data = json.load(f)
-
-        error_rates = data.get("error_rates", [])
-
-        if service:
-            error_rates = [e for e in error_rates if e.get("service") == service]
+        error_rates = ERROR_RATES.query(service=service or None)
 
         # TODO: In real implementation, would filter by time window
 
@@ -203,13 +178,7 @@ async def get_resource_metrics(
 ):
     """Monitor resource utilization"""
     try:
-        with open(DATA_PATH / "resource_usage.json", "r") as f:
-            data = json.load(f)
-
-        metrics = data.get("metrics", [])
-
-        if service:
-            metrics = [m for m in metrics if m.get("service") == service]
+        metrics = RESOURCE_USAGE.query(service=service or None)
 
         # Filter by resource type if specified
         if resource_type:
@@ -248,15 +217,7 @@ async def get_availability_metrics(
 ):
     """Check service availability"""
     try:
-        with open(DATA_PATH / "availability.json", "r") as f:
-            data = json.load(f)
-
-        availability_metrics = data.get("availability_metrics", [])
-
-        if service:
-            availability_metrics = [
-                a for a in availability_metrics if a.get("service") == service
-            ]
+        availability_metrics = AVAILABILITY.query(service=service or None)
 
         # TODO: In real implementation, would calculate based on time window
 
@@ -283,8 +244,7 @@ async def analyze_trends(
     """Identify metric trends and anomalies"""
     try:
         # Read trends from actual data file
-        trends_file = DATA_PATH / "trends.json"
-        if not trends_file.exists():
+        if not TRENDS.exists():
             return {
                 "trend": "no_data",
                 "average_value": 0,
@@ -292,8 +252,7 @@ async def analyze_trends(
                 "anomalies": [],
             }
 
-        with open(trends_file, "r") as f:
-            data = json.load(f)
+        data = TRENDS.data
 
         # Determine which trend data to use based on metric name
         if "response" in metric_name.lower():
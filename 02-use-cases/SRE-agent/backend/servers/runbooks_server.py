@@ -3,6 +3,7 @@ import logging
 from pathlib import Path
 from typing import Optional
 
+from data_store import Dataset
 from fastapi import (
     Depends,
     FastAPI,
@@ -27,6 +28,31 @@ app = FastAPI(title="DevOps Runbooks API", version="1.0.0")
 
 DATA_PATH = Path(__file__).parent.parent / "data" / "runbooks_data"
 
+# Datasets are loaded once, indexed, and reloaded when the file changes
+PLAYBOOKS = Dataset(
+    DATA_PATH / "incident_playbooks.json",
+    records_key="playbooks",
+    index_fields=("id", "incident_type", "severity"),
+    search_fields=("title", "description", "steps"),
+)
+GUIDES = Dataset(
+    DATA_PATH / "troubleshooting_guides.json",
+    records_key="guides",
+    index_fields=("category",),
+    search_fields=("title", "id"),
+)
+ESCALATION_PROCEDURES = Dataset(
+    DATA_PATH / "escalation_procedures.json",
+    records_key="escalation_procedures",
+    index_fields=("severity",),
+    search_fields=("title", "trigger_conditions"),
+)
+RESOLUTIONS = Dataset(
+    DATA_PATH / "common_resolutions.json",
+    records_key="resolutions",
+    search_fields=("issue", "id", "symptoms"),
+)
+
 # API Key for authentication
 CREDENTIAL_PROVIDER_NAME = "sre-agent-api-key-credential-provider"
 
@@ -73,34 +99,17 @@ async def search_runbooks(
             f"🔍 RUNBOOKS API: search_runbooks called - incident_type={incident_type}, keyword={keyword}, severity={severity}"
         )
 
-        with open(DATA_PATH / "incident_playbooks.json", "r") as f:
-            data = json.load(f)
-
-        runbooks = data.get("playbooks", [])
-        original_count = len(runbooks)
-
-        if incident_type:
-            runbooks = [r for r in runbooks if r.get("incident_type") == incident_type]
-            logging.info(
-                f"📋 RUNBOOKS API: Filtered by incident_type '{incident_type}': {len(runbooks)} runbooks"
-            )
+        original_count = len(PLAYBOOKS.records)
 
-        if severity:
-            runbooks = [r for r in runbooks if r.get("severity") == severity]
-            logging.info(
-                f"📋 RUNBOOKS API: Filtered by severity '{severity}': {len(runbooks)} runbooks"
-            )
-
-        if keyword:
-            runbooks = [
-                r
-                for r in runbooks
-                if keyword.lower() in r.get("title", "").lower()
-                or keyword.lower() in r.get("description", "").lower()
-                or any(keyword.lower() in step.lower() for step in r.get("steps", []))
-            ]
+        # Filter by incident type, severity and keyword
+        runbooks = PLAYBOOKS.query(
+            search=keyword,
+            incident_type=incident_type or None,
+            severity=severity or None,
+        )
+        if incident_type or severity or keyword:
             logging.info(
-                f"📋 RUNBOOKS API: Filtered by keyword '{keyword}': {len(runbooks)} runbooks"
+                f"📋 RUNBOOKS API: Filtered by incident_type '{incident_type}', severity '{severity}', keyword '{keyword}': {len(runbooks)} runbooks"
             )
 
         response_data = {"runbooks": runbooks}
@@ -140,25 +149,21 @@ async def get_incident_playbook(
             f"🔍 RUNBOOKS API: get_incident_playbook called for playbook_id='{playbook_id}'"
         )
 
-        with open(DATA_PATH / "incident_playbooks.json", "r") as f:
-            data = json.load(f)
-
-        playbooks = data.get("playbooks", [])
-
-        for playbook in playbooks:
-            if playbook.get("id") == playbook_id:
-                logging.info(
-                    f"📖 RUNBOOKS API: Found playbook '{playbook.get('title', 'No title')}'"
-                )
-                steps = playbook.get("steps", [])
-                logging.info(f"📝 RUNBOOKS API: Playbook has {len(steps)} steps:")
-                for i, step in enumerate(steps):
-                    logging.info(f"   Step {i + 1}: {step}")
+        playbooks = PLAYBOOKS.get("id", playbook_id)
+        if playbooks:
+            playbook = playbooks[0]
+            logging.info(
+                f"📖 RUNBOOKS API: Found playbook '{playbook.get('title', 'No title')}'"
+            )
+            steps = playbook.get("steps", [])
+            logging.info(f"📝 RUNBOOKS API: Playbook has {len(steps)} steps:")
+            for i, step in enumerate(steps):
+                logging.info(f"   Step {i + 1}: {step}")
 
-                logging.info(
-                    f"📤 RUNBOOKS API: Returning complete playbook data: {json.dumps(playbook, indent=2)}"
-                )
-                return playbook
+            logging.info(
+                f"📤 RUNBOOKS API: Returning complete playbook data: {json.dumps(playbook, indent=2)}"
+            )
+            return playbook
 
         logging.warning(f"❌ RUNBOOKS API: Playbook '{playbook_id}' not found")
         return JSONResponse(status_code=404, content={"error": "Playbook not found"})
@@ -183,27 +188,13 @@ async def get_troubleshooting_guide(
             f"🔍 RUNBOOKS API: get_troubleshooting_guide called - category={category}, issue_type={issue_type}"
         )
 
-        with open(DATA_PATH / "troubleshooting_guides.json", "r") as f:
-            data = json.load(f)
-
-        guides = data.get("guides", [])
-        original_count = len(guides)
-
-        if category:
-            guides = [g for g in guides if g.get("category") == category]
-            logging.info(
-                f"📋 RUNBOOKS API: Filtered by category '{category}': {len(guides)} guides"
-            )
+        original_count = len(GUIDES.records)
 
-        if issue_type:
-            guides = [
-                g
-                for g in guides
-                if issue_type.lower() in g.get("title", "").lower()
-                or issue_type.lower() in g.get("id", "").lower()
-            ]
+        # Filter by category and issue type
+        guides = GUIDES.query(search=issue_type, category=category or None)
+        if category or issue_type:
             logging.info(
-                f"📋 RUNBOOKS API: Filtered by issue_type '{issue_type}': {len(guides)} guides"
+                f"📋 RUNBOOKS API: Filtered by category '{category}', issue_type '{issue_type}': {len(guides)} guides"
             )
 
         response_data = {"guides": guides}
@@ -244,24 +235,10 @@ async def get_escalation_procedures(
 ):
     """Retrieve escalation procedures"""
     try:
-        with open(DATA_PATH / "escalation_procedures.json", "r") as f:
-            data = json.load(f)
-
-        procedures = data.get("escalation_procedures", [])
-
-        if severity:
-            procedures = [p for p in procedures if p.get("severity") == severity]
-
-        if incident_type:
-            procedures = [
-                p
-                for p in procedures
-                if incident_type.lower() in p.get("title", "").lower()
-                or any(
-                    incident_type.lower() in condition.lower()
-                    for condition in p.get("trigger_conditions", [])
-                )
-            ]
+        # Filter by severity and incident type
+        procedures = ESCALATION_PROCEDURES.query(
+            search=incident_type, severity=severity or None
+        )
 
         return {"escalation_procedures": procedures}
     except Exception as e:
@@ -281,24 +258,10 @@ async def get_common_resolutions(
             f"🔍 RUNBOOKS API: get_common_resolutions called - issue='{issue}', service={service}"
         )
 
-        with open(DATA_PATH / "common_resolutions.json", "r") as f:
-            data = json.load(f)
-
-        resolutions = data.get("resolutions", [])
-        original_count = len(resolutions)
+        original_count = len(RESOLUTIONS.records)
 
         # Filter by issue
-        matching_resolutions = []
-        for resolution in resolutions:
-            if (
-                issue.lower() in resolution.get("issue", "").lower()
-                or issue.lower() in resolution.get("id", "").lower()
-                or any(
-                    issue.lower() in symptom.lower()
-                    for symptom in resolution.get("symptoms", [])
-                )
-            ):
-                matching_resolutions.append(resolution)
+        matching_resolutions = RESOLUTIONS.query(search=issue)
 
         logging.info(
             f"📋 RUNBOOKS API: Found {len(matching_resolutions)} matching resolutions for issue '{issue}'"
@@ -14,7 +14,7 @@ from langgraph.prebuilt import create_react_agent
 from .agent_state import AgentState
 from .constants import AgentMetadata
 from .llm_utils import create_llm_with_error_handling
-from .memory import SREMemoryClient, create_conversation_memory_manager
+from .memory import create_conversation_memory_manager, get_memory_client
 from .prompt_loader import prompt_loader
 
 # Logging will be configured by the main entry point
@@ -179,7 +179,7 @@ class BaseAgentNode:
                 try:
                     # Get region from llm_kwargs if available
                     region = self.llm_kwargs.get("region_name", "us-east-1") if self.llm_provider == "bedrock" else "us-east-1"
-                    memory_client = SREMemoryClient(region=region)
+                    memory_client = get_memory_client(region=region)
                     conversation_manager = create_conversation_memory_manager(
                         memory_client
                     )
@@ -376,10 +376,10 @@ class BaseAgentNode:
                     # Check if memory hooks are available through the memory client
                     from .memory.hooks import MemoryHookProvider
 
-                    # Use the SREMemoryClient that's already imported at the top
+                    # Reuse the shared memory client for this region
                     # Get region from llm_kwargs if available
                     region = self.llm_kwargs.get("region_name", "us-east-1") if self.llm_provider == "bedrock" else "us-east-1"
-                    memory_client = SREMemoryClient(region=region)
+                    memory_client = get_memory_client(region=region)
                     memory_hooks = MemoryHookProvider(memory_client)
 
                     # Create response object for hooks
@@ -409,16 +409,14 @@ class BaseAgentNode:
                         f"{self.name} - Failed to process agent response for memory patterns: {e}"
                     )
 
-            # Update state with streaming info
+            # Update state with streaming info. Only this agent's contribution is
+            # returned; the AgentState reducers merge it so that agents running
+            # in parallel branches don't overwrite each other's results.
             return {
-                "agent_results": {
-                    **state.get("agent_results", {}),
-                    self.name: agent_response,
-                },
-                "agents_invoked": state.get("agents_invoked", []) + [self.name],
-                "messages": messages + all_messages,
+                "agent_results": {self.name: agent_response},
+                "agents_invoked": [self.name],
+                "messages": all_messages,
                 "metadata": {
-                    **state.get("metadata", {}),
                     f"{self.name.replace(' ', '_')}_trace": all_messages,
                 },
             }
@@ -426,11 +424,8 @@ class BaseAgentNode:
         except Exception as e:
             logger.error(f"Error in {self.name}: {e}")
             return {
-                "agent_results": {
-                    **state.get("agent_results", {}),
-                    self.name: f"Error: {str(e)}",
-                },
-                "agents_invoked": state.get("agents_invoked", []) + [self.name],
+                "agent_results": {self.name: f"Error: {str(e)}"},
+                "agents_invoked": [self.name],
             }
 
 
@@ -83,8 +83,18 @@ async def initialize_agent():
         logger.info(f"Using LLM provider: {provider}")
         logger.info(f"Calling create_multi_agent_system with provider: {provider}")
 
+        # Dispatch independent plan steps concurrently if enabled
+        parallel_execution = os.getenv("PARALLEL_EXECUTION", "false").lower() in (
+            "true",
+            "1",
+            "yes",
+        )
+        logger.info(f"Parallel execution: {parallel_execution}")
+
         # Create multi-agent system using the same function as CLI
-        agent_graph, tools = await create_multi_agent_system(provider)
+        agent_graph, tools = await create_multi_agent_system(
+            provider, parallel_execution=parallel_execution
+        )
 
         logger.info(
             f"SRE Agent system initialized successfully with {len(tools)} tools"
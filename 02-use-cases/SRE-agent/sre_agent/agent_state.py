@@ -16,6 +16,25 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Update value that clears a merged field instead of merging into it, so a
+# new query on a checkpointed thread starts without the previous results
+RESET = "__reset__"
+
+
+def _merge_dicts(left: Dict[str, Any], right: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge dictionary updates so parallel agent branches don't overwrite each other."""
+    if right == RESET:
+        return {}
+    return {**(left or {}), **(right or {})}
+
+
+def _extend_list(left: List[Any], right: List[Any]) -> List[Any]:
+    """Append list updates from parallel agent branches."""
+    if right == RESET:
+        return []
+    return (left or []) + (right or [])
+
+
 class AgentState(TypedDict):
     """State shared across all agents in the multi-agent system.
 
@@ -29,20 +48,23 @@ class AgentState(TypedDict):
     # Which agent should act next (set by supervisor)
     next: Literal["kubernetes", "logs", "metrics", "runbooks", "FINISH"]
 
-    # Intermediate results from each agent
-    agent_results: Dict[str, Any]
+    # Agents to dispatch concurrently in parallel execution mode (set by supervisor)
+    parallel_batch: Optional[List[str]]
+
+    # Intermediate results from each agent (merged across parallel branches)
+    agent_results: Annotated[Dict[str, Any], _merge_dicts]
 
     # Current query being processed
     current_query: Optional[str]
 
-    # Metadata about the conversation
-    metadata: Dict[str, Any]
+    # Metadata about the conversation (merged across parallel branches)
+    metadata: Annotated[Dict[str, Any], _merge_dicts]
 
     # Flag to indicate if we need multiple agents
     requires_collaboration: bool
 
-    # List of agents that have already responded
-    agents_invoked: List[str]
+    # List of agents that have already responded (appended by each agent)
+    agents_invoked: Annotated[List[str], _extend_list]
 
     # Final aggregated response (set by supervisor)
     final_response: Optional[str]
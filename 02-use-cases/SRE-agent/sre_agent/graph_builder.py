@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 
 import logging
-from typing import Any, Dict, List, Literal
+from typing import Any, Dict, List, Literal, Union
 
 from langchain_core.messages import HumanMessage
 from langchain_core.tools import BaseTool
 from langgraph.graph import END, StateGraph
+from langgraph.types import Send
 
 from .agent_nodes import (
     create_kubernetes_agent,
@@ -13,7 +14,7 @@ from .agent_nodes import (
     create_metrics_agent,
     create_runbooks_agent,
 )
-from .agent_state import AgentState
+from .agent_state import RESET, AgentState
 from .constants import SREConstants
 from .supervisor import SupervisorAgent
 
@@ -43,27 +44,48 @@ def _should_continue(state: AgentState) -> Literal["supervisor", "FINISH"]:
     return "supervisor"
 
 
-def _route_supervisor(state: AgentState) -> str:
-    """Route from supervisor to the appropriate agent or finish."""
+# Map to actual node names - handle both old short names and new full names
+_AGENT_NODE_MAP = {
+    "kubernetes": "kubernetes_agent",
+    "logs": "logs_agent",
+    "metrics": "metrics_agent",
+    "runbooks": "runbooks_agent",
+    # Also handle the new full names directly
+    "kubernetes_agent": "kubernetes_agent",
+    "logs_agent": "logs_agent",
+    "metrics_agent": "metrics_agent",
+    "runbooks_agent": "runbooks_agent",
+}
+
+
+def _route_supervisor(state: AgentState) -> Union[str, List[Send]]:
+    """Route from supervisor to the appropriate agent(s) or finish.
+
+    When the supervisor sets a parallel batch with more than one agent, each
+    agent is dispatched as its own branch via ``Send`` and the supervisor runs
+    again once all branches have finished.
+    """
     next_agent = state.get("next", "FINISH")
 
     if next_agent == "FINISH":
         return "aggregate"
 
-    # Map to actual node names - handle both old short names and new full names
-    agent_map = {
-        "kubernetes": "kubernetes_agent",
-        "logs": "logs_agent",
-        "metrics": "metrics_agent",
-        "runbooks": "runbooks_agent",
-        # Also handle the new full names directly
-        "kubernetes_agent": "kubernetes_agent",
-        "logs_agent": "logs_agent",
-        "metrics_agent": "metrics_agent",
-        "runbooks_agent": "runbooks_agent",
-    }
+    parallel_batch = state.get("parallel_batch") or []
+    if len(parallel_batch) > 1:
+        node_names = []
+        for agent in parallel_batch:
+            node_name = _AGENT_NODE_MAP.get(agent)
+            if node_name and node_name not in node_names:
+                node_names.append(node_name)
+            elif not node_name:
+                logger.warning(f"Skipping unknown agent in parallel batch: {agent}")
+
+        if node_names:
+            logger.info(f"Fanning out to agents in parallel: {node_names}")
+            return [Send(node_name, dict(state)) for node_name in node_names]
+        return "aggregate"
 
-    return agent_map.get(next_agent, "aggregate")
+    return _AGENT_NODE_MAP.get(next_agent, "aggregate")
 
 
 async def _prepare_initial_state(state: AgentState) -> Dict[str, Any]:
@@ -77,12 +99,14 @@ async def _prepare_initial_state(state: AgentState) -> Dict[str, Any]:
             current_query = msg.content
             break
 
+    # Merged fields are cleared explicitly; an empty update would merge into
+    # the previous query's checkpointed results
     return {
         "current_query": current_query,
-        "agent_results": {},
-        "agents_invoked": [],
+        "agent_results": RESET,
+        "agents_invoked": RESET,
         "requires_collaboration": False,
-        "metadata": {},
+        "metadata": RESET,
     }
 
 
@@ -92,6 +116,7 @@ def build_multi_agent_graph(
     force_delete_memory: bool = False,
     export_graph: bool = False,
     graph_output_path: str = "./docs/sre_agent_architecture.md",
+    parallel_execution: bool = False,
     **llm_kwargs,
 ) -> StateGraph:
     """Build the multi-agent collaboration graph.
@@ -102,6 +127,7 @@ def build_multi_agent_graph(
         force_delete_memory: Whether to force delete existing memory
         export_graph: Whether to export the graph as a Mermaid diagram
         graph_output_path: Path to save the exported Mermaid diagram (default: ./docs/sre_agent_architecture.md)
+        parallel_execution: Whether to dispatch independent plan steps concurrently
         **llm_kwargs: Additional arguments for LLM
 
     Returns:
@@ -114,7 +140,10 @@ def build_multi_agent_graph(
 
     # Create supervisor
     supervisor = SupervisorAgent(
-        llm_provider=llm_provider, force_delete_memory=force_delete_memory, **llm_kwargs
+        llm_provider=llm_provider,
+        force_delete_memory=force_delete_memory,
+        parallel_execution=parallel_execution,
+        **llm_kwargs,
     )
 
     # Create agent nodes with filtered tools and metadata from constants
@@ -171,7 +200,8 @@ def build_multi_agent_graph(
         },
     )
 
-    # Add edges from agents back to supervisor
+    # Add edges from agents back to supervisor (in parallel mode the supervisor
+    # runs once after all fanned-out agents of a wave have finished)
     workflow.add_edge("kubernetes_agent", "supervisor")
     workflow.add_edge("logs_agent", "supervisor")
     workflow.add_edge("metrics_agent", "supervisor")
@@ -188,21 +218,26 @@ def build_multi_agent_graph(
         try:
             # Create docs directory if it doesn't exist
             from pathlib import Path
+
             output_path = Path(graph_output_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            
+
             # Get the Mermaid representation of the graph
             mermaid_diagram = compiled_graph.get_graph().draw_mermaid()
-            
+
             # Save to file
             with open(graph_output_path, "w") as f:
                 f.write("# SRE Agent Architecture\n\n")
                 f.write("```mermaid\n")
                 f.write(mermaid_diagram)
                 f.write("\n```\n")
-            
-            logger.info(f"Graph architecture (Mermaid) exported to: {graph_output_path}")
-            print(f"✅ Graph architecture (Mermaid diagram) exported to: {graph_output_path}")
+
+            logger.info(
+                f"Graph architecture (Mermaid) exported to: {graph_output_path}"
+            )
+            print(
+                f"✅ Graph architecture (Mermaid diagram) exported to: {graph_output_path}"
+            )
         except Exception as e:
             logger.error(f"Failed to export graph: {e}")
             print(f"❌ Failed to export graph: {e}")
@@ -1,6 +1,6 @@
 """Memory module for SRE Agent long-term memory capabilities."""
 
-from .client import SREMemoryClient
+from .client import SREMemoryClient, clear_memory_clients, get_memory_client
 from .config import MemoryConfig
 from .conversation_manager import (
     ConversationMemoryManager,
@@ -18,9 +18,12 @@ from .tools import (
     SaveInvestigationTool,
     SavePreferenceTool,
 )
+from .write_behind import MemoryWriteBehindQueue
 
 __all__ = [
     "SREMemoryClient",
+    "get_memory_client",
+    "clear_memory_clients",
     "MemoryConfig",
     "UserPreference",
     "InfrastructureKnowledge",
@@ -32,4 +35,5 @@ __all__ = [
     "ConversationMemoryManager",
     "ConversationMessage",
     "create_conversation_memory_manager",
+    "MemoryWriteBehindQueue",
 ]
@@ -1,10 +1,13 @@
 import logging
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from bedrock_agentcore.memory import MemoryClient
 
 from .config import _load_memory_config
+from .write_behind import MemoryWriteBehindQueue
 
 # Configure logging with basicConfig
 logging.basicConfig(
@@ -15,6 +18,9 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Event id returned for messages handed to the write-behind queue
+EVENT_QUEUED = "queued"
+
 
 class SREMemoryClient:
     """Wrapper for AgentCore Memory client tailored for SRE operations."""
@@ -30,6 +36,16 @@ class SREMemoryClient:
         self.config = _load_memory_config()
         self.memory_ids = {}
         self.force_delete = force_delete
+        self.write_queue = (
+            MemoryWriteBehindQueue(
+                write_fn=self._write_event_messages,
+                max_batch_messages=self.config.write_behind_max_batch_messages,
+                flush_interval_seconds=self.config.write_behind_flush_interval_seconds,
+                max_pending_messages=self.config.write_behind_max_pending_messages,
+            )
+            if self.config.write_behind_enabled
+            else None
+        )
         self._initialize_memories()
 
     def _initialize_memories(self):
@@ -177,6 +193,10 @@ class SREMemoryClient:
 
         actor_id is always required. session_id is required for infrastructure
         and investigations memory types, but optional for preferences.
+
+        With write-behind enabled, True means the event was queued, not yet
+        written; a failed write is reported by flush_events() returning False
+        and in get_write_metrics().
         """
         if not self.memory_id:
             logger.warning("Memory system not initialized, skipping save")
@@ -214,19 +234,18 @@ class SREMemoryClient:
             # but the namespace doesn't use it
             actual_session_id = session_id if session_id else "preferences-default"
 
-            result = self.client.create_event(
-                memory_id=self.memory_id,
-                actor_id=actor_id,
-                session_id=actual_session_id,
-                messages=messages,
+            event_id = self.create_event_messages(
+                actor_id=actor_id, session_id=actual_session_id, messages=messages
             )
-
-            event_id = result.get("eventId", "unknown")
-            logger.info(f"create_event result: {result}")
             logger.info("=== SAVE_EVENT TRACE END ===")
-            logger.info(
-                f"Saved {memory_type} event for {actor_id} (event_id: {event_id})"
-            )
+            if event_id == EVENT_QUEUED:
+                logger.info(
+                    f"Queued {memory_type} event for {actor_id} to be written in the background"
+                )
+            else:
+                logger.info(
+                    f"Saved {memory_type} event for {actor_id} (event_id: {event_id})"
+                )
             logger.info(f"Event data size: {len(str(event_data))} characters")
             return True
 
@@ -236,6 +255,64 @@ class SREMemoryClient:
             )
             return False
 
+    def create_event_messages(
+        self, actor_id: str, session_id: str, messages: List[Tuple[str, str]]
+    ) -> str:
+        """Store (content, role) messages for an actor and session.
+
+        With write-behind enabled, messages are queued and coalesced with other
+        messages for the same actor and session, and EVENT_QUEUED is returned.
+        Otherwise create_event is called inline and the event id is returned.
+        """
+        if not self.memory_id:
+            raise ValueError("Memory system not initialized, cannot create event")
+
+        if self.write_queue is not None:
+            self.write_queue.enqueue(actor_id, session_id, messages)
+            return EVENT_QUEUED
+
+        return self._write_event_messages(actor_id, session_id, messages)
+
+    def flush_events(
+        self,
+        actor_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        timeout: Optional[float] = 30.0,
+    ) -> bool:
+        """Wait until queued events (for one actor and session, or all) are written.
+
+        Returns False on timeout or if any of the events failed to write.
+        """
+        if self.write_queue is None:
+            return True
+        return self.write_queue.flush(
+            actor_id=actor_id, session_id=session_id, timeout=timeout
+        )
+
+    def close(self, timeout: Optional[float] = 30.0) -> None:
+        """Write all queued events and stop the write-behind worker."""
+        if self.write_queue is not None:
+            self.write_queue.close(timeout=timeout)
+
+    def get_write_metrics(self) -> Dict[str, Any]:
+        """Get write-behind queue depth and flush latency metrics."""
+        if self.write_queue is None:
+            return {"write_behind_enabled": False}
+        return {"write_behind_enabled": True, **self.write_queue.get_metrics()}
+
+    def _write_event_messages(
+        self, actor_id: str, session_id: str, messages: List[Tuple[str, str]]
+    ) -> str:
+        """Call create_event for a batch of messages and return the event id."""
+        result = self.client.create_event(
+            memory_id=self.memory_id,
+            actor_id=actor_id,
+            session_id=session_id,
+            messages=messages,
+        )
+        logger.debug(f"create_event result: {result}")
+        return result.get("eventId", "unknown")
+
     def retrieve_memories(
         self,
         memory_type: str,
@@ -377,3 +454,94 @@ class SREMemoryClient:
 
         except Exception as e:
             logger.warning(f"Failed to write memory ID to file: {e}")
+
+
+# Process-wide registry of memory clients keyed by (memory_name, region), so the
+# memory id lookup and strategy check only run once per process
+_memory_clients: Dict[Tuple[str, str], SREMemoryClient] = {}
+_force_deleted_memories: Set[Tuple[str, str]] = set()
+_memory_clients_lock = threading.Lock()
+
+# Seconds an offline client waits after an initialization attempt before
+# retrying, so a memory backend outage doesn't slow down every agent step
+MEMORY_INIT_RETRY_SECONDS = 60.0
+_init_attempted_at: Dict[Tuple[str, str], float] = {}
+_init_retrying: Set[Tuple[str, str]] = set()
+
+
+def get_memory_client(
+    memory_name: Optional[str] = None,
+    region: Optional[str] = None,
+    force_delete: bool = False,
+) -> SREMemoryClient:
+    """Get the shared SREMemoryClient for a memory name and region.
+
+    The client is created lazily on first use and reused afterwards. A client
+    whose initialization failed (offline mode) retries initialization at most
+    once every MEMORY_INIT_RETRY_SECONDS, in the calling thread and outside
+    the registry lock; other callers get the offline client meanwhile.
+    force_delete recreates the memory and replaces the shared client, at most
+    once per process for a given memory.
+
+    Args:
+        memory_name: Base name of the memory (defaults to the memory config)
+        region: AWS region of the memory (defaults to the memory config)
+        force_delete: Whether to delete and recreate the existing memory
+    """
+    config = _load_memory_config()
+    key = (memory_name or config.memory_name, region or config.region)
+
+    retry = False
+    with _memory_clients_lock:
+        client = _memory_clients.get(key)
+
+        recreate = force_delete and key not in _force_deleted_memories
+        if client is None or recreate:
+            logger.info(
+                f"Creating shared memory client for memory_name={key[0]}, region={key[1]}"
+            )
+            client = SREMemoryClient(
+                memory_name=key[0], region=key[1], force_delete=recreate
+            )
+            # Retried initializations must never delete the memory again
+            client.force_delete = False
+            _memory_clients[key] = client
+            _init_attempted_at[key] = time.monotonic()
+            if recreate:
+                _force_deleted_memories.add(key)
+        elif (
+            not client.memory_id
+            and key not in _init_retrying
+            and time.monotonic() - _init_attempted_at.get(key, 0.0)
+            >= MEMORY_INIT_RETRY_SECONDS
+        ):
+            _init_retrying.add(key)
+            retry = True
+
+    if retry:
+        logger.info(
+            f"Retrying initialization of shared memory client for memory_name={key[0]}, region={key[1]}"
+        )
+        try:
+            client._initialize_memories()
+        finally:
+            with _memory_clients_lock:
+                _init_retrying.discard(key)
+                _init_attempted_at[key] = time.monotonic()
+
+    return client
+
+
+def clear_memory_clients() -> None:
+    """Drop all shared memory clients so the next lookup re-initializes them.
+
+    The dropped clients write their queued events before they are released.
+    """
+    with _memory_clients_lock:
+        clients = list(_memory_clients.values())
+        _memory_clients.clear()
+        _force_deleted_memories.clear()
+        _init_attempted_at.clear()
+        _init_retrying.clear()
+    for client in clients:
+        client.close()
@@ -45,6 +45,21 @@ class MemoryConfig(BaseModel):
         default=True, description="Automatically generate investigation summaries"
     )
 
+    # Write-behind settings for memory events
+    write_behind_enabled: bool = Field(
+        default=True,
+        description="Write memory events from a background queue instead of inline",
+    )
+    write_behind_max_batch_messages: int = Field(
+        default=20, description="Messages per actor/session that trigger a flush"
+    )
+    write_behind_flush_interval_seconds: float = Field(
+        default=2.0, description="Maximum seconds a message waits before being written"
+    )
+    write_behind_max_pending_messages: int = Field(
+        default=1000, description="Queued messages before enqueueing blocks"
+    )
+
 
 def _load_memory_config() -> MemoryConfig:
     """Load memory configuration with defaults."""
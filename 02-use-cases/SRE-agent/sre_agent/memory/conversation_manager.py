@@ -81,15 +81,14 @@ class ConversationMemoryManager:
             # Format message as tuple for AgentCore memory
             message_tuple = (content, role)
 
-            # Use AgentCore's create_event with user_id as actor_id
-            result = self.memory_client.client.create_event(
-                memory_id=self.memory_client.memory_id,
+            # Use AgentCore's create_event with user_id as actor_id (queued and
+            # coalesced with other messages of this session when write-behind is on)
+            event_id = self.memory_client.create_event_messages(
                 actor_id=user_id,  # Use user_id as actor_id as specified
                 session_id=session_id,  # Use provided session_id
                 messages=[message_tuple],  # AgentCore expects list of tuples
             )
 
-            event_id = result.get("eventId", "unknown")
             logger.info(
                 f"Successfully stored conversation message (event_id: {event_id})"
             )
@@ -153,15 +152,14 @@ class ConversationMemoryManager:
                 else:
                     truncated_messages.append((content, role))
 
-            # Use AgentCore's create_event with batch of messages
-            result = self.memory_client.client.create_event(
-                memory_id=self.memory_client.memory_id,
+            # Use AgentCore's create_event with batch of messages (queued and
+            # coalesced with other messages of this session when write-behind is on)
+            event_id = self.memory_client.create_event_messages(
                 actor_id=user_id,  # Use user_id as actor_id as specified
                 session_id=session_id,  # Use provided session_id
                 messages=truncated_messages,  # AgentCore expects list of tuples
             )
 
-            event_id = result.get("eventId", "unknown")
             logger.info(
                 f"Successfully stored conversation batch of {len(messages)} messages (event_id: {event_id})"
             )
@@ -171,6 +169,22 @@ class ConversationMemoryManager:
             logger.error(f"Failed to store conversation batch: {e}", exc_info=True)
             return False
 
+    def flush(self, user_id: str, session_id: str, timeout: float = 30.0) -> bool:
+        """
+        Wait until all queued conversation messages for a session are written.
+
+        Args:
+            user_id: User ID used as actor_id
+            session_id: Session identifier
+            timeout: Seconds to wait before giving up
+
+        Returns:
+            bool: True if all messages were written before the timeout
+        """
+        return self.memory_client.flush_events(
+            actor_id=user_id, session_id=session_id, timeout=timeout
+        )
+
 
 def create_conversation_memory_manager(
     memory_client: SREMemoryClient,
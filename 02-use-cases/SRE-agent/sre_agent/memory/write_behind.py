@@ -0,0 +1,319 @@
+import atexit
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+# Configure logging with basicConfig
+logging.basicConfig(
+    level=logging.INFO,  # Set the log level to INFO
+    # Define log message format
+    format="%(asctime)s,p%(process)s,{%(filename)s:%(lineno)d},%(levelname)s,%(message)s",
+)
+
+logger = logging.getLogger(__name__)
+
+# (actor_id, session_id) that a batch of messages is written for
+BatchKey = Tuple[str, str]
+
+# Writes a list of (content, role) messages for an actor and session as one event
+WriteFunction = Callable[[str, str, List[Tuple[str, str]]], None]
+
+# Called with (actor_id, session_id, messages, error) when a write fails
+WriteFailureCallback = Callable[[str, str, List[Tuple[str, str]], Exception], None]
+
+
+class _PendingBatch:
+    """Messages waiting to be written for one (actor_id, session_id)."""
+
+    def __init__(self):
+        self.messages: List[Tuple[str, str]] = []
+        self.created_at = time.monotonic()
+
+
+class MemoryWriteBehindQueue:
+    """Background write-behind queue for memory events.
+
+    Messages are coalesced per (actor_id, session_id) and written by a worker
+    thread as a single event once a batch reaches max_batch_messages, once it
+    is older than flush_interval_seconds, or when flush() is called. Batches
+    for the same key are written in the order they were enqueued.
+
+    Enqueued messages are not yet persisted. Failed writes are counted in the
+    metrics, passed to on_write_failure and make the next flush() covering
+    them return False. Pending messages are flushed by close(), which also
+    runs at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        write_fn: WriteFunction,
+        max_batch_messages: int = 20,
+        flush_interval_seconds: float = 2.0,
+        max_pending_messages: int = 1000,
+        on_write_failure: Optional[WriteFailureCallback] = None,
+    ):
+        self._write_fn = write_fn
+        self._on_write_failure = on_write_failure
+        self.max_batch_messages = max_batch_messages
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_pending_messages = max_pending_messages
+
+        self._pending: "OrderedDict[BatchKey, _PendingBatch]" = OrderedDict()
+        self._pending_messages = 0
+        self._in_flight: Set[BatchKey] = set()
+        self._flush_requested: Set[BatchKey] = set()
+        self._flush_all_requested = False
+        # Keys with a failed write since the last flush() covering them
+        self._failed_keys: Set[BatchKey] = set()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._exit_hook_registered = False
+
+        # Metrics
+        self._events_written = 0
+        self._messages_written = 0
+        self._events_failed = 0
+        self._messages_failed = 0
+        self._total_flush_latency = 0.0
+        self._max_flush_latency = 0.0
+        self._last_flush_latency = 0.0
+        self._max_queue_depth = 0
+        self._last_write_error: Optional[str] = None
+
+    def enqueue(
+        self, actor_id: str, session_id: str, messages: List[Tuple[str, str]]
+    ) -> None:
+        """Queue messages to be written for an actor and session."""
+        if not messages:
+            return
+
+        key = (actor_id, session_id)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Memory write-behind queue is closed")
+
+            # Apply backpressure instead of growing without bound
+            if self._pending_messages >= self.max_pending_messages:
+                logger.warning(
+                    f"Memory write-behind queue full ({self._pending_messages} messages), waiting for flush"
+                )
+                self._flush_all_requested = True
+                self._condition.notify_all()
+                self._condition.wait_for(
+                    lambda: self._pending_messages < self.max_pending_messages,
+                    timeout=self.flush_interval_seconds,
+                )
+
+            batch = self._pending.get(key)
+            if batch is None:
+                batch = _PendingBatch()
+                self._pending[key] = batch
+            batch.messages.extend(messages)
+            self._pending_messages += len(messages)
+            self._max_queue_depth = max(self._max_queue_depth, self._pending_messages)
+
+            self._ensure_worker()
+            self._condition.notify_all()
+
+    def flush(
+        self,
+        actor_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        timeout: Optional[float] = 30.0,
+    ) -> bool:
+        """Write pending messages now and wait until they are persisted.
+
+        Args:
+            actor_id: Only flush this actor's messages (requires session_id)
+            session_id: Only flush this session's messages (requires actor_id)
+            timeout: Seconds to wait for the flush to complete (None waits forever)
+
+        Returns:
+            bool: True if all requested messages were written before the
+                timeout, False on timeout or if any of their writes failed
+        """
+        key = (actor_id, session_id) if actor_id and session_id else None
+
+        def _done() -> bool:
+            if key is None:
+                return not self._pending and not self._in_flight
+            return key not in self._pending and key not in self._in_flight
+
+        def _take_failed() -> bool:
+            if key is None:
+                failed = bool(self._failed_keys)
+                self._failed_keys.clear()
+                return failed
+            failed = key in self._failed_keys
+            self._failed_keys.discard(key)
+            return failed
+
+        with self._condition:
+            if not _done():
+                if key is None:
+                    self._flush_all_requested = True
+                else:
+                    self._flush_requested.add(key)
+                self._ensure_worker()
+                self._condition.notify_all()
+                if not self._condition.wait_for(_done, timeout=timeout):
+                    logger.warning(
+                        f"Timed out after {timeout}s flushing memory events for {key or 'all sessions'}"
+                    )
+                    return False
+            failed = _take_failed()
+
+        if failed:
+            logger.warning(
+                f"Some memory events for {key or 'all sessions'} failed to write"
+            )
+        return not failed
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get queue depth and flush latency metrics."""
+        with self._condition:
+            flushes = self._events_written + self._events_failed
+            return {
+                "queue_depth": self._pending_messages,
+                "max_queue_depth": self._max_queue_depth,
+                "pending_batches": len(self._pending),
+                "in_flight_batches": len(self._in_flight),
+                "events_written": self._events_written,
+                "messages_written": self._messages_written,
+                "events_failed": self._events_failed,
+                "messages_failed": self._messages_failed,
+                "last_flush_latency_ms": round(self._last_flush_latency * 1000, 2),
+                "avg_flush_latency_ms": round(
+                    self._total_flush_latency / flushes * 1000, 2
+                )
+                if flushes
+                else 0.0,
+                "max_flush_latency_ms": round(self._max_flush_latency * 1000, 2),
+                "last_write_error": self._last_write_error,
+            }
+
+    def close(self, timeout: Optional[float] = 30.0) -> None:
+        """Flush all pending messages and stop the worker thread."""
+        self.flush(timeout=timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+
+    def _ensure_worker(self) -> None:
+        """Start the worker thread on first use. Caller must hold the lock."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="sre-memory-write-behind", daemon=True
+            )
+            self._thread.start()
+            if not self._exit_hook_registered:
+                # Write what is still queued when the process exits
+                atexit.register(self.close)
+                self._exit_hook_registered = True
+
+    def _next_due_batch(self) -> Tuple[Optional[BatchKey], Optional[float]]:
+        """Find a batch that is ready to write, or how long to wait for one.
+
+        Caller must hold the lock. Keys that are already being written are
+        skipped so batches for the same session stay in order.
+        """
+        now = time.monotonic()
+        wait_time = None
+        for key, batch in self._pending.items():
+            if key in self._in_flight:
+                continue
+            age = now - batch.created_at
+            if (
+                self._flush_all_requested
+                or key in self._flush_requested
+                or len(batch.messages) >= self.max_batch_messages
+                or age >= self.flush_interval_seconds
+            ):
+                return key, None
+            remaining = self.flush_interval_seconds - age
+            wait_time = remaining if wait_time is None else min(wait_time, remaining)
+        return None, wait_time
+
+    def _run(self) -> None:
+        """Worker loop writing due batches until the queue is closed."""
+        while True:
+            with self._condition:
+                key, wait_time = self._next_due_batch()
+                while key is None:
+                    if self._closed and not self._pending:
+                        return
+                    if not self._pending:
+                        self._flush_all_requested = False
+                    self._condition.wait(timeout=wait_time)
+                    key, wait_time = self._next_due_batch()
+
+                batch = self._pending.pop(key)
+                self._pending_messages -= len(batch.messages)
+                self._flush_requested.discard(key)
+                self._in_flight.add(key)
+                self._condition.notify_all()
+
+            self._write_batch(key, batch.messages)
+
+            with self._condition:
+                self._in_flight.discard(key)
+                if not self._pending:
+                    self._flush_all_requested = False
+                self._condition.notify_all()
+
+    def _write_batch(self, key: BatchKey, messages: List[Tuple[str, str]]) -> None:
+        """Write a batch as one or more events of at most max_batch_messages."""
+        actor_id, session_id = key
+        for start in range(0, len(messages), self.max_batch_messages):
+            chunk = messages[start : start + self.max_batch_messages]
+            started_at = time.monotonic()
+            try:
+                self._write_fn(actor_id, session_id, chunk)
+                error = None
+            except Exception as e:
+                logger.error(
+                    f"Failed to write {len(chunk)} memory messages for actor_id={actor_id}, session_id={session_id}: {e}",
+                    exc_info=True,
+                )
+                error = e
+            latency = time.monotonic() - started_at
+
+            with self._condition:
+                if error is None:
+                    self._events_written += 1
+                    self._messages_written += len(chunk)
+                else:
+                    self._events_failed += 1
+                    self._messages_failed += len(chunk)
+                    self._failed_keys.add(key)
+                    self._last_write_error = str(error)
+                self._total_flush_latency += latency
+                self._last_flush_latency = latency
+                self._max_flush_latency = max(self._max_flush_latency, latency)
+
+            if error is not None:
+                self._report_failure(actor_id, session_id, chunk, error)
+                continue
+            logger.info(
+                f"Wrote {len(chunk)} memory messages for actor_id={actor_id}, session_id={session_id} in {latency * 1000:.0f}ms"
+            )
+
+    def _report_failure(
+        self,
+        actor_id: str,
+        session_id: str,
+        messages: List[Tuple[str, str]],
+        error: Exception,
+    ) -> None:
+        """Pass a failed write to on_write_failure without stopping the worker."""
+        if self._on_write_failure is None:
+            return
+        try:
+            self._on_write_failure(actor_id, session_id, messages, error)
+        except Exception as e:
+            logger.error(f"Memory write failure callback raised: {e}", exc_info=True)
@@ -374,6 +374,7 @@ async def create_multi_agent_system(
     export_graph: bool = False,
     graph_output_path: str = "./docs/sre_agent_architecture.md",
     region_name: str = None,
+    parallel_execution: bool = False,
     **llm_kwargs,
 ):
     """Create multi-agent system with MCP tools."""
@@ -460,7 +461,7 @@ async def create_multi_agent_system(
     # Add memory tools if memory system is enabled
     memory_tools = []
     try:
-        from .memory.client import SREMemoryClient
+        from .memory.client import get_memory_client
         from .memory.config import _load_memory_config
         from .memory.tools import create_memory_tools
 
@@ -469,7 +470,7 @@ async def create_multi_agent_system(
             logger.debug("Adding memory tools to agent tool list")
             # Use the region from parameter if provided, otherwise use config default
             memory_region = region_name if region_name else memory_config.region
-            memory_client = SREMemoryClient(
+            memory_client = get_memory_client(
                 memory_name=memory_config.memory_name,
                 region=memory_region,
                 force_delete=force_delete_memory,
@@ -577,6 +578,7 @@ async def create_multi_agent_system(
         force_delete_memory=force_delete_memory,
         export_graph=export_graph,
         graph_output_path=graph_output_path,
+        parallel_execution=parallel_execution,
         **llm_kwargs,
     )
 
@@ -653,6 +655,7 @@ async def _run_interactive_session(
     save_markdown: bool = True,
     force_delete_memory: bool = False,
     region_name: str = "us-east-1",
+    parallel_execution: bool = False,
 ):
     """Run an interactive multi-turn conversation session."""
     # Buffer to store last query and response for /savereport command
@@ -690,6 +693,7 @@ async def _run_interactive_session(
         force_delete_memory=force_delete_memory,
         export_graph=False,  # Don't export in interactive mode each time
         region_name=region_name,
+        parallel_execution=parallel_execution,
     )
 
     # Initialize conversation state
@@ -1157,6 +1161,11 @@ async def main():
         default="./docs/sre_agent_architecture.md",
         help="Path to save the exported Mermaid diagram (default: ./docs/sre_agent_architecture.md)",
     )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run independent investigation plan steps concurrently instead of one agent at a time",
+    )
 
     args = parser.parse_args()
 
@@ -1222,6 +1231,7 @@ async def main():
                 save_markdown=not args.no_markdown,
                 force_delete_memory=args.force_delete_memory,
                 region_name=aws_region,
+                parallel_execution=args.parallel,
             )
         # Single prompt mode
         else:
@@ -1232,6 +1242,7 @@ async def main():
                     export_graph=args.export_graph,
                     graph_output_path=args.graph_output,
                     region_name=aws_region,
+                    parallel_execution=args.parallel,
                 )
                 logger.info("Multi-agent system created successfully")
             except Exception as e:
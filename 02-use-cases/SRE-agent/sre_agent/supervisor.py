@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import asyncio
 import json
 import logging
 import os
@@ -11,11 +12,12 @@ from langchain_core.messages import HumanMessage, SystemMessage
 from langgraph.prebuilt import create_react_agent
 from pydantic import BaseModel, Field, field_validator
 
+from .agent_nodes import _load_agent_config
 from .agent_state import AgentState
 from .constants import SREConstants
 from .llm_utils import create_llm_with_error_handling
 from .memory import create_conversation_memory_manager
-from .memory.client import SREMemoryClient
+from .memory.client import get_memory_client
 from .memory.config import _load_memory_config
 from .memory.hooks import MemoryHookProvider
 from .memory.tools import create_memory_tools
@@ -198,6 +200,42 @@ Create the plan in JSON format with these fields:
 - reasoning: Brief explanation of the investigation approach"""
 
 
+def _plan_execution_waves(
+    agents_sequence: List[str], dependencies: Dict[str, List[str]]
+) -> List[List[str]]:
+    """Group a plan's agent sequence into waves that can run concurrently.
+
+    Consecutive agents are placed in the same wave unless an agent depends on
+    an agent already in that wave, or the same agent appears twice. Plan order
+    is preserved both across and within waves.
+    """
+    waves: List[List[str]] = []
+    current_wave: List[str] = []
+    for agent in agents_sequence:
+        # Plans may use short agent names ("logs") or node names ("logs_agent")
+        agent_name = agent if agent.endswith("_agent") else f"{agent}_agent"
+        wave_names = {a if a.endswith("_agent") else f"{a}_agent" for a in current_wave}
+        agent_dependencies = set(dependencies.get(agent_name, []))
+        if agent_name in wave_names or agent_dependencies.intersection(wave_names):
+            waves.append(current_wave)
+            current_wave = []
+        current_wave.append(agent)
+
+    if current_wave:
+        waves.append(current_wave)
+    return waves
+
+
+def _load_agent_dependencies() -> Dict[str, List[str]]:
+    """Load agent data dependencies used for parallel execution from config."""
+    try:
+        parallel_config = _load_agent_config().get("parallel_execution") or {}
+        return parallel_config.get("dependencies") or {}
+    except Exception as e:
+        logger.warning(f"Could not load agent dependencies: {e}")
+        return {}
+
+
 class SupervisorAgent:
     """Supervisor agent that orchestrates other agents with memory capabilities."""
 
@@ -205,6 +243,7 @@ class SupervisorAgent:
         self,
         llm_provider: str = "bedrock",
         force_delete_memory: bool = False,
+        parallel_execution: bool = False,
         **llm_kwargs,
     ):
         self.llm_provider = llm_provider
@@ -212,12 +251,26 @@ class SupervisorAgent:
         self.system_prompt = _read_supervisor_prompt()
         self.formatter = create_formatter(llm_provider=llm_provider)
 
+        # Parallel execution dispatches independent plan steps concurrently
+        self.parallel_execution = parallel_execution
+        self.agent_dependencies = (
+            _load_agent_dependencies() if parallel_execution else {}
+        )
+        if parallel_execution:
+            logger.info(
+                f"Parallel execution enabled with agent dependencies: {self.agent_dependencies}"
+            )
+
         # Initialize memory system
         self.memory_config = _load_memory_config()
         if self.memory_config.enabled:
             # Use region from llm_kwargs if provided for bedrock
-            memory_region = llm_kwargs.get("region_name", self.memory_config.region) if llm_provider == "bedrock" else self.memory_config.region
-            self.memory_client = SREMemoryClient(
+            memory_region = (
+                llm_kwargs.get("region_name", self.memory_config.region)
+                if llm_provider == "bedrock"
+                else self.memory_config.region
+            )
+            self.memory_client = get_memory_client(
                 memory_name=self.memory_config.memory_name,
                 region=memory_region,
                 force_delete=force_delete_memory,
@@ -615,6 +668,9 @@ User's query: {current_query}
                     # Preserve memory context in state
                     "memory_context": state.get("memory_context", {}),
                 }
+            elif self.parallel_execution:
+                # Simple plan - start execution with the first wave of agents
+                return self._route_plan_wave(state, plan, wave=0)
             else:
                 # Simple plan - start execution
                 next_agent = (
@@ -634,6 +690,12 @@ User's query: {current_query}
                     # Preserve memory context in state
                     "memory_context": state.get("memory_context", {}),
                 }
+        elif self.parallel_execution:
+            # Continue executing existing plan with the next wave of agents
+            plan = InvestigationPlan(**existing_plan)
+            current_wave = state.get("metadata", {}).get("plan_wave", 0)
+            next_wave = current_wave + 1 if agents_invoked else current_wave
+            return self._route_plan_wave(state, plan, wave=next_wave)
         else:
             # Continue executing existing plan
             plan = InvestigationPlan(**existing_plan)
@@ -677,6 +739,56 @@ User's query: {current_query}
                     "memory_context": state.get("memory_context", {}),
                 }
 
+    def _route_plan_wave(
+        self, state: AgentState, plan: InvestigationPlan, wave: int
+    ) -> Dict[str, Any]:
+        """Route to all agents of a plan wave so they can be executed concurrently."""
+        waves = _plan_execution_waves(plan.agents_sequence, self.agent_dependencies)
+
+        if wave >= len(waves):
+            # Plan complete
+            return {
+                "next": "FINISH",
+                "parallel_batch": [],
+                "metadata": {
+                    **state.get("metadata", {}),
+                    "investigation_plan": plan.model_dump(),
+                    "routing_reasoning": "Investigation plan completed. Presenting results.",
+                    "plan_step": len(plan.agents_sequence),
+                    "plan_wave": wave,
+                },
+                # Preserve memory context in state
+                "memory_context": state.get("memory_context", {}),
+            }
+
+        batch = waves[wave]
+        first_step = sum(len(w) for w in waves[:wave])
+        step_descriptions = [
+            plan.steps[step] if step < len(plan.steps) else f"Execute {agent}"
+            for step, agent in enumerate(batch, start=first_step)
+        ]
+        logger.info(
+            f"Dispatching plan wave {wave + 1}/{len(waves)} in parallel: {batch}"
+        )
+
+        result = {
+            "next": batch[0],
+            "parallel_batch": batch,
+            "metadata": {
+                **state.get("metadata", {}),
+                "investigation_plan": plan.model_dump(),
+                "routing_reasoning": f"Executing plan steps {first_step + 1}-{first_step + len(batch)} in parallel: {'; '.join(step_descriptions)}",
+                "plan_step": first_step + len(batch) - 1,
+                "plan_wave": wave,
+            },
+            # Preserve memory context in state
+            "memory_context": state.get("memory_context", {}),
+        }
+        if wave == 0:
+            result["metadata"]["plan_text"] = self._format_plan_markdown(plan)
+            result["metadata"]["show_plan"] = True
+        return result
+
     async def aggregate_responses(self, state: AgentState) -> Dict[str, Any]:
         """Aggregate responses from multiple agents into a final response."""
         agent_results = state.get("agent_results", {})
@@ -894,4 +1006,25 @@ You can:
                     f"Failed to save investigation summary: {e}", exc_info=True
                 )
 
+        # Investigation is complete - make sure queued memory events for this
+        # session are persisted before returning the final response
+        if self.memory_client and user_id and session_id:
+            try:
+                flushed = await asyncio.to_thread(
+                    self.memory_client.flush_events, user_id, session_id
+                )
+                metrics = self.memory_client.get_write_metrics()
+                if flushed:
+                    logger.info(
+                        f"Supervisor: Flushed memory events for session {session_id}, metrics: {metrics}"
+                    )
+                else:
+                    logger.warning(
+                        f"Supervisor: Memory events for session {session_id} were not all written, metrics: {metrics}"
+                    )
+            except Exception as e:
+                logger.error(
+                    f"Supervisor: Error flushing memory events: {e}", exc_info=True
+                )
+
         return {"final_response": final_response, "next": "FINISH"}
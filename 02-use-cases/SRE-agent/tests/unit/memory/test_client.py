@@ -0,0 +1,97 @@
+from unittest.mock import patch
+
+import pytest
+
+from sre_agent.memory.client import clear_memory_clients, get_memory_client
+
+
+class TestGetMemoryClient:
+    """Tests for the shared memory client registry."""
+
+    @pytest.fixture(autouse=True)
+    def clear_registry(self):
+        """Start every test with an empty registry."""
+        clear_memory_clients()
+        yield
+        clear_memory_clients()
+
+    @pytest.fixture
+    def mock_memory_client_class(self):
+        """Patch MemoryClient and initialization to avoid AWS calls."""
+
+        def fake_initialize(client):
+            client.memory_id = f"{client.memory_name}-123"
+
+        with (
+            patch("sre_agent.memory.client.MemoryClient"),
+            patch(
+                "sre_agent.memory.client.SREMemoryClient._initialize_memories",
+                autospec=True,
+                side_effect=fake_initialize,
+            ) as mock_initialize,
+        ):
+            yield mock_initialize
+
+    def test_client_is_reused(self, mock_memory_client_class):
+        """Test that the same client is returned for the same name and region."""
+        first = get_memory_client(memory_name="test_memory", region="us-east-1")
+        second = get_memory_client(memory_name="test_memory", region="us-east-1")
+
+        assert first is second
+        assert first.memory_id == "test_memory-123"
+        assert mock_memory_client_class.call_count == 1
+
+    def test_clients_are_keyed_by_region(self, mock_memory_client_class):
+        """Test that different regions get different clients."""
+        east = get_memory_client(memory_name="test_memory", region="us-east-1")
+        west = get_memory_client(memory_name="test_memory", region="us-west-2")
+
+        assert east is not west
+        assert mock_memory_client_class.call_count == 2
+
+    def test_defaults_from_config(self, mock_memory_client_class):
+        """Test that memory name and region default to the memory config."""
+        client = get_memory_client()
+
+        assert client is get_memory_client(
+            memory_name="sre_agent_memory", region="us-east-1"
+        )
+
+    def test_failed_initialization_is_retried(self, mock_memory_client_class):
+        """Test that an offline client retries initialization after the backoff."""
+        mock_memory_client_class.side_effect = lambda client: setattr(
+            client, "memory_id", None
+        )
+        client = get_memory_client(memory_name="test_memory", region="us-east-1")
+        assert client.memory_id is None
+
+        # Within the backoff the offline client is returned without a retry
+        assert (
+            get_memory_client(memory_name="test_memory", region="us-east-1") is client
+        )
+        assert mock_memory_client_class.call_count == 1
+
+        mock_memory_client_class.side_effect = lambda client: setattr(
+            client, "memory_id", "test_memory-456"
+        )
+        with patch("sre_agent.memory.client.MEMORY_INIT_RETRY_SECONDS", 0.0):
+            retried = get_memory_client(memory_name="test_memory", region="us-east-1")
+
+        assert retried is client
+        assert retried.memory_id == "test_memory-456"
+        assert mock_memory_client_class.call_count == 2
+
+    def test_force_delete_recreates_once(self, mock_memory_client_class):
+        """Test that force_delete replaces the shared client only once."""
+        original = get_memory_client(memory_name="test_memory", region="us-east-1")
+        recreated = get_memory_client(
+            memory_name="test_memory", region="us-east-1", force_delete=True
+        )
+        again = get_memory_client(
+            memory_name="test_memory", region="us-east-1", force_delete=True
+        )
+
+        assert recreated is not original
+        assert again is recreated
+        assert recreated.force_delete is False
+        assert mock_memory_client_class.call_count == 2
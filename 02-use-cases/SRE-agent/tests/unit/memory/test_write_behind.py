@@ -0,0 +1,140 @@
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from sre_agent.memory.write_behind import MemoryWriteBehindQueue
+
+
+class TestMemoryWriteBehindQueue:
+    """Tests for MemoryWriteBehindQueue."""
+
+    @pytest.fixture
+    def write_fn(self):
+        """Create a mock write function."""
+        return Mock()
+
+    def test_messages_are_coalesced_per_session(self, write_fn):
+        """Test that messages for the same actor and session form one event."""
+        queue = MemoryWriteBehindQueue(write_fn, flush_interval_seconds=60)
+
+        queue.enqueue("alice", "session-1", [("query", "USER")])
+        queue.enqueue("alice", "session-1", [("answer", "ASSISTANT")])
+        queue.enqueue("bob", "session-2", [("other", "USER")])
+        assert queue.flush(timeout=5)
+
+        write_fn.assert_any_call(
+            "alice", "session-1", [("query", "USER"), ("answer", "ASSISTANT")]
+        )
+        write_fn.assert_any_call("bob", "session-2", [("other", "USER")])
+        assert write_fn.call_count == 2
+        queue.close()
+
+    def test_full_batch_is_written_without_flush(self, write_fn):
+        """Test that reaching max_batch_messages triggers a write."""
+        written = threading.Event()
+        write_fn.side_effect = lambda *args: written.set()
+        queue = MemoryWriteBehindQueue(
+            write_fn, max_batch_messages=2, flush_interval_seconds=60
+        )
+
+        queue.enqueue("alice", "session-1", [("a", "USER"), ("b", "ASSISTANT")])
+
+        assert written.wait(timeout=5)
+        queue.close()
+
+    def test_large_batch_is_split(self, write_fn):
+        """Test that batches are split into events of max_batch_messages."""
+        queue = MemoryWriteBehindQueue(
+            write_fn, max_batch_messages=2, flush_interval_seconds=60
+        )
+
+        queue.enqueue("alice", "session-1", [(str(i), "USER") for i in range(5)])
+        assert queue.flush("alice", "session-1", timeout=5)
+
+        assert [len(call.args[2]) for call in write_fn.call_args_list] == [2, 2, 1]
+        queue.close()
+
+    def test_flush_interval(self, write_fn):
+        """Test that messages are written once they exceed the flush interval."""
+        written = threading.Event()
+        write_fn.side_effect = lambda *args: written.set()
+        queue = MemoryWriteBehindQueue(write_fn, flush_interval_seconds=0.05)
+
+        queue.enqueue("alice", "session-1", [("query", "USER")])
+
+        assert written.wait(timeout=5)
+        queue.close()
+
+    def test_metrics(self, write_fn):
+        """Test that queue depth and write counts are reported."""
+        queue = MemoryWriteBehindQueue(write_fn, flush_interval_seconds=60)
+
+        queue.enqueue("alice", "session-1", [("a", "USER"), ("b", "ASSISTANT")])
+        assert queue.get_metrics()["queue_depth"] == 2
+
+        queue.flush(timeout=5)
+        metrics = queue.get_metrics()
+
+        assert metrics["queue_depth"] == 0
+        assert metrics["max_queue_depth"] == 2
+        assert metrics["events_written"] == 1
+        assert metrics["messages_written"] == 2
+        assert metrics["events_failed"] == 0
+        queue.close()
+
+    def test_failed_write_is_counted(self, write_fn):
+        """Test that write failures are counted and don't stop the worker."""
+        write_fn.side_effect = [Exception("throttled"), None]
+        queue = MemoryWriteBehindQueue(write_fn, flush_interval_seconds=60)
+
+        queue.enqueue("alice", "session-1", [("a", "USER")])
+        queue.flush(timeout=5)
+        queue.enqueue("alice", "session-1", [("b", "USER")])
+        queue.flush(timeout=5)
+
+        metrics = queue.get_metrics()
+        assert metrics["events_failed"] == 1
+        assert metrics["events_written"] == 1
+        queue.close()
+
+    def test_flush_reports_failed_write(self, write_fn):
+        """Test that a failed write makes flush return False and is reported."""
+        write_fn.side_effect = [Exception("throttled"), None]
+        on_write_failure = Mock()
+        queue = MemoryWriteBehindQueue(
+            write_fn, flush_interval_seconds=60, on_write_failure=on_write_failure
+        )
+
+        queue.enqueue("alice", "session-1", [("a", "USER")])
+        assert not queue.flush("alice", "session-1", timeout=5)
+
+        on_write_failure.assert_called_once()
+        assert on_write_failure.call_args.args[:3] == (
+            "alice",
+            "session-1",
+            [("a", "USER")],
+        )
+        assert queue.get_metrics()["last_write_error"] == "throttled"
+
+        # The failure is reported once; later flushes reflect later writes
+        queue.enqueue("alice", "session-1", [("b", "USER")])
+        assert queue.flush("alice", "session-1", timeout=5)
+        queue.close()
+
+    def test_close_writes_pending_messages(self, write_fn):
+        """Test that closing the queue writes the messages still queued."""
+        queue = MemoryWriteBehindQueue(write_fn, flush_interval_seconds=60)
+
+        queue.enqueue("alice", "session-1", [("a", "USER")])
+        queue.close(timeout=5)
+
+        write_fn.assert_called_once_with("alice", "session-1", [("a", "USER")])
+
+    def test_enqueue_after_close_fails(self, write_fn):
+        """Test that a closed queue rejects new messages."""
+        queue = MemoryWriteBehindQueue(write_fn)
+        queue.close()
+
+        with pytest.raises(RuntimeError):
+            queue.enqueue("alice", "session-1", [("a", "USER")])
@@ -0,0 +1,159 @@
+import asyncio
+
+from langchain_core.messages import HumanMessage
+from langgraph.types import Send
+
+from sre_agent.agent_state import RESET, _extend_list, _merge_dicts
+from sre_agent.graph_builder import _prepare_initial_state, _route_supervisor
+from sre_agent.supervisor import (
+    InvestigationPlan,
+    SupervisorAgent,
+    _plan_execution_waves,
+)
+
+DEPENDENCIES = {
+    "runbooks_agent": ["kubernetes_agent", "logs_agent", "metrics_agent"],
+}
+
+
+def _make_supervisor() -> SupervisorAgent:
+    """Create a supervisor without initializing LLM or memory clients."""
+    supervisor = object.__new__(SupervisorAgent)
+    supervisor.parallel_execution = True
+    supervisor.agent_dependencies = DEPENDENCIES
+    return supervisor
+
+
+def _make_plan(agents_sequence) -> InvestigationPlan:
+    return InvestigationPlan(
+        steps=[f"Step for {agent}" for agent in agents_sequence],
+        agents_sequence=agents_sequence,
+        complexity="simple",
+        auto_execute=True,
+        reasoning="Test plan",
+    )
+
+
+class TestPlanExecutionWaves:
+    """Tests for grouping plan steps into parallel waves."""
+
+    def test_independent_agents_share_a_wave(self):
+        """Test that agents without dependencies are grouped together."""
+        waves = _plan_execution_waves(
+            ["kubernetes_agent", "logs_agent", "metrics_agent"], DEPENDENCIES
+        )
+
+        assert waves == [["kubernetes_agent", "logs_agent", "metrics_agent"]]
+
+    def test_dependent_agent_starts_new_wave(self):
+        """Test that an agent depending on earlier agents runs after them."""
+        waves = _plan_execution_waves(
+            ["logs_agent", "metrics_agent", "runbooks_agent"], DEPENDENCIES
+        )
+
+        assert waves == [["logs_agent", "metrics_agent"], ["runbooks_agent"]]
+
+    def test_repeated_agent_starts_new_wave(self):
+        """Test that the same agent is never dispatched twice in one wave."""
+        waves = _plan_execution_waves(
+            ["logs_agent", "metrics_agent", "logs_agent"], DEPENDENCIES
+        )
+
+        assert waves == [["logs_agent", "metrics_agent"], ["logs_agent"]]
+
+    def test_short_agent_names(self):
+        """Test that short agent names are matched against dependencies."""
+        waves = _plan_execution_waves(["logs", "runbooks"], DEPENDENCIES)
+
+        assert waves == [["logs"], ["runbooks"]]
+
+    def test_empty_sequence(self):
+        """Test that an empty plan produces no waves."""
+        assert _plan_execution_waves([], DEPENDENCIES) == []
+
+
+class TestParallelRouting:
+    """Tests for supervisor wave routing and graph fan-out."""
+
+    def test_route_plan_wave_dispatches_batch(self):
+        """Test that the first wave is routed as a parallel batch."""
+        supervisor = _make_supervisor()
+        plan = _make_plan(
+            ["kubernetes_agent", "logs_agent", "metrics_agent", "runbooks_agent"]
+        )
+
+        result = supervisor._route_plan_wave({"metadata": {}}, plan, wave=0)
+
+        assert result["next"] == "kubernetes_agent"
+        assert result["parallel_batch"] == [
+            "kubernetes_agent",
+            "logs_agent",
+            "metrics_agent",
+        ]
+        assert result["metadata"]["plan_wave"] == 0
+        assert result["metadata"]["plan_step"] == 2
+        assert result["metadata"]["show_plan"] is True
+
+    def test_route_plan_wave_finishes_after_last_wave(self):
+        """Test that routing past the last wave finishes the plan."""
+        supervisor = _make_supervisor()
+        plan = _make_plan(["logs_agent", "runbooks_agent"])
+
+        result = supervisor._route_plan_wave({"metadata": {}}, plan, wave=2)
+
+        assert result["next"] == "FINISH"
+        assert result["parallel_batch"] == []
+
+    def test_route_supervisor_fans_out(self):
+        """Test that a parallel batch is dispatched with one Send per agent."""
+        state = {"next": "logs_agent", "parallel_batch": ["logs_agent", "metrics"]}
+
+        routes = _route_supervisor(state)
+
+        assert routes == [
+            Send("logs_agent", state),
+            Send("metrics_agent", state),
+        ]
+
+    def test_route_supervisor_single_agent(self):
+        """Test that a single-agent batch uses the regular route."""
+        state = {"next": "logs_agent", "parallel_batch": ["logs_agent"]}
+
+        assert _route_supervisor(state) == "logs_agent"
+
+    def test_route_supervisor_finish(self):
+        """Test that FINISH routes to aggregation."""
+        state = {"next": "FINISH", "parallel_batch": ["logs_agent", "metrics_agent"]}
+
+        assert _route_supervisor(state) == "aggregate"
+
+    def test_merge_dicts_combines_branch_results(self):
+        """Test that results from parallel branches are merged."""
+        merged = _merge_dicts({"Logs Agent": "a"}, {"Metrics Agent": "b"})
+
+        assert merged == {"Logs Agent": "a", "Metrics Agent": "b"}
+
+    def test_reset_clears_merged_fields(self):
+        """Test that the reset sentinel clears results instead of merging."""
+        assert _merge_dicts({"Logs Agent": "a"}, RESET) == {}
+        assert _extend_list(["logs_agent"], RESET) == []
+        assert _extend_list(["logs_agent"], ["metrics_agent"]) == [
+            "logs_agent",
+            "metrics_agent",
+        ]
+
+    def test_prepare_initial_state_resets_previous_query(self):
+        """Test that a follow-up query doesn't carry the previous results."""
+        previous = {
+            "messages": [HumanMessage(content="What about the database?")],
+            "agent_results": {"Logs Agent": "old findings"},
+            "agents_invoked": ["logs_agent"],
+            "metadata": {"plan_step": 2},
+        }
+
+        update = asyncio.run(_prepare_initial_state(previous))
+
+        assert update["current_query"] == "What about the database?"
+        assert _merge_dicts(previous["agent_results"], update["agent_results"]) == {}
+        assert _extend_list(previous["agents_invoked"], update["agents_invoked"]) == []
+        assert _merge_dicts(previous["metadata"], update["metadata"]) == {}
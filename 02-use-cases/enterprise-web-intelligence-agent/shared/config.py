@@ -44,6 +44,17 @@ class AgentConfig:
     # Browser Configuration
     browser_timeout: int = 60000  # 60 seconds
     browser_session_timeout: int = 3600  # 1 hour
+    # Browser sessions used at once when analyzing competitors in parallel
+    max_parallel_browser_sessions: int = int(os.environ.get("MAX_PARALLEL_BROWSER_SESSIONS", "4"))
+    
+    # Page readiness after navigation and clicks: the longest wait (no more
+    # than the fixed sleep it replaced), how long network and DOM must stay
+    # quiet, requests allowed in flight when quiet, and the age after which
+    # a request counts as long-polling and is ignored
+    page_ready_timeout_ms: int = 3000
+    page_quiet_window_ms: int = 500
+    page_max_inflight_requests: int = 2
+    page_long_request_ms: int = 2000
     
     # Code Interpreter Configuration
     code_session_timeout: int = 1800  # 30 minutes
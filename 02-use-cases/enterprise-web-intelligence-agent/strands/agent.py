@@ -2,6 +2,8 @@
 
 import asyncio
 import json
+import time
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
@@ -24,7 +26,7 @@ from interactive_tools.browser_viewer import BrowserViewerServer
 
 # Import tools
 from config import AgentConfig
-from browser_tools import BrowserTools
+from browser_tools import BrowserTools, BrowserSessionPool
 from analysis_tools import AnalysisTools
 
 # Apply nest_asyncio to allow nested event loops
@@ -240,14 +242,29 @@ class CompetitiveIntelligenceAgent:
         
         return tools
     
-    async def _analyze_website_impl(self, competitor_name: str, competitor_url: str) -> str:
-        """Implementation of website analysis."""
+    async def _analyze_website_impl(self, competitor_name: str, competitor_url: str,
+                                    browser_tools: Optional[BrowserTools] = None,
+                                    progress: Optional[Progress] = None) -> str:
+        """Implementation of website analysis.
+        
+        Uses browser_tools (the main browser session by default) and adds a
+        task to progress when given, which lets parallel analyses share one
+        progress display.
+        """
+        browser_tools = browser_tools or self.browser_tools
         console.print(f"\n[bold blue]🔍 Analyzing: {competitor_name}[/bold blue]")
         console.print(f"[cyan]URL: {competitor_url}[/cyan]")
         
         competitor_data = {}
+        # Only count screenshots and APIs from this analysis, as sessions are reused
+        screenshots_before = len(browser_tools._screenshots_taken)
+        apis_before = len(browser_tools._discovered_apis)
+        waits_before = len(browser_tools._wait_metrics)
+        
+        # A shared progress display shows which competitor each step belongs to
+        label = f"{competitor_name}: " if progress else ""
         
-        with Progress(
+        with nullcontext(progress) if progress else Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
@@ -257,8 +274,8 @@ class CompetitiveIntelligenceAgent:
             
             try:
                 # Navigate to website
-                progress.update(task, description="Navigating to website...", advance=1)
-                nav_result = await self.browser_tools.navigate_to_url(competitor_url)
+                progress.update(task, description=f"{label}Navigating to website...", advance=1)
+                nav_result = await browser_tools.navigate_to_url(competitor_url)
                 competitor_data['navigation'] = nav_result
                 
                 if nav_result.get('status') != 'success':
@@ -266,66 +283,67 @@ class CompetitiveIntelligenceAgent:
                     # Continue anyway to try to get some data
                 
                 # Take screenshot
-                progress.update(task, description="Taking homepage screenshot...", advance=1)
-                await self.browser_tools.take_annotated_screenshot(f"{competitor_name} - Homepage")
+                progress.update(task, description=f"{label}Taking homepage screenshot...", advance=1)
+                await browser_tools.take_annotated_screenshot(f"{competitor_name} - Homepage")
                 
                 # Discover sections
-                progress.update(task, description="Discovering page sections...", advance=1)
-                discovered_sections = await self.browser_tools.intelligent_scroll_and_discover()
+                progress.update(task, description=f"{label}Discovering page sections...", advance=1)
+                discovered_sections = await browser_tools.intelligent_scroll_and_discover()
                 competitor_data['discovered_sections'] = discovered_sections
                 console.print(f"[green]Found {len(discovered_sections)} key sections[/green]")
                 
                 # Try to find pricing page
-                progress.update(task, description="Looking for pricing page...", advance=1)
-                found_pricing = await self.browser_tools.smart_navigation("pricing")
+                progress.update(task, description=f"{label}Looking for pricing page...", advance=1)
+                found_pricing = await browser_tools.smart_navigation("pricing")
                 if found_pricing:
-                    await asyncio.sleep(3)
-                    await self.browser_tools.take_annotated_screenshot(f"{competitor_name} - Pricing")
+                    await browser_tools.take_annotated_screenshot(f"{competitor_name} - Pricing")
                 
                 # Analyze forms
-                progress.update(task, description="Checking interactive elements...", advance=1)
-                form_data = await self.browser_tools.analyze_forms_and_inputs()
+                progress.update(task, description=f"{label}Checking interactive elements...", advance=1)
+                form_data = await browser_tools.analyze_forms_and_inputs()
                 competitor_data['interactive_elements'] = form_data
                 
                 # Extract pricing
-                progress.update(task, description="Extracting pricing...", advance=1)
-                pricing_result = await self.browser_tools.extract_pricing_info()
+                progress.update(task, description=f"{label}Extracting pricing...", advance=1)
+                pricing_result = await browser_tools.extract_pricing_info()
                 competitor_data['pricing'] = pricing_result
                 
                 # Extract features
-                progress.update(task, description="Extracting features...", advance=1)
-                features_result = await self.browser_tools.extract_product_features()
+                progress.update(task, description=f"{label}Extracting features...", advance=1)
+                features_result = await browser_tools.extract_product_features()
                 competitor_data['features'] = features_result
                 
                 # Explore additional pages
-                progress.update(task, description="Exploring additional pages...", advance=1)
-                additional_pages = await self.browser_tools.explore_multi_page_workflow(
+                progress.update(task, description=f"{label}Exploring additional pages...", advance=1)
+                additional_pages = await browser_tools.explore_multi_page_workflow(
                     ["features", "docs", "api", "about"]
                 )
                 competitor_data['additional_pages'] = additional_pages
                 
                 # Capture metrics
-                progress.update(task, description="Capturing metrics...", advance=1)
-                metrics = await self.browser_tools.capture_performance_metrics()
+                progress.update(task, description=f"{label}Capturing metrics...", advance=1)
+                metrics = await browser_tools.capture_performance_metrics()
                 competitor_data['performance_metrics'] = metrics
+                competitor_data['page_readiness'] = browser_tools.get_wait_metrics(since=waits_before)
                 
                 # Save to state
-                progress.update(task, description="Saving data...", advance=1)
+                progress.update(task, description=f"{label}Saving data...", advance=1)
                 all_competitor_data = self._safe_state_get("competitor_data", {})
                 all_competitor_data[competitor_name] = {
                     "url": competitor_url,
                     "timestamp": datetime.now().isoformat(),
                     **competitor_data,
+                    "browser_session_id": browser_tools.browser_client.session_id if browser_tools.browser_client else None,
                     "status": "success"
                 }
                 self.agent.state.set("competitor_data", all_competitor_data)
                 
                 # Update metrics in state
                 total_screenshots = self._safe_state_get("total_screenshots", 0)
-                self.agent.state.set("total_screenshots", total_screenshots + len(self.browser_tools._screenshots_taken))
+                self.agent.state.set("total_screenshots", total_screenshots + len(browser_tools._screenshots_taken) - screenshots_before)
                 
                 discovered_apis = self._safe_state_get("discovered_apis", [])
-                discovered_apis.extend(self.browser_tools._discovered_apis)
+                discovered_apis.extend(browser_tools._discovered_apis[apis_before:])
                 self.agent.state.set("discovered_apis", discovered_apis)
                 
             except Exception as e:
@@ -360,6 +378,85 @@ class CompetitiveIntelligenceAgent:
         return callback_handler
     
 
+    async def _analyze_competitors_sequential(self, competitors: List[Dict]):
+        """Analyze competitors one after another in the main browser session."""
+        # Analyze each competitor sequentially
+        for i, competitor in enumerate(competitors, 1):
+            console.print(f"\n[bold yellow]📊 Competitor {i}/{len(competitors)}: {competitor['name']}[/bold yellow]")
+            
+            try:
+                # Directly invoke the tool
+                result = self.agent.tool.analyze_website(
+                    competitor_name=competitor['name'],
+                    competitor_url=competitor['url']
+                )
+                console.print(f"[green]✓ {competitor['name']} analysis complete[/green]")
+                console.print(f"[dim]Result: {result[:200]}...[/dim]" if len(result) > 200 else f"[dim]Result: {result}[/dim]")
+                
+                # Add a small delay between competitors to avoid overwhelming
+                if i < len(competitors):
+                    console.print(f"[dim]Waiting 2 seconds before next competitor...[/dim]")
+                    await asyncio.sleep(2)
+                    
+            except Exception as comp_error:
+                console.print(f"[red]❌ Error analyzing {competitor['name']}: {comp_error}[/red]")
+                # Continue with next competitor even if one fails
+                continue
+    
+    async def _analyze_competitors_parallel(self, competitors: List[Dict]):
+        """Analyze competitors concurrently with a bounded pool of browser sessions.
+        
+        Competitors are taken from a shared work queue, so a session that
+        finishes a fast site moves on to the next one instead of waiting.
+        """
+        console.print("\n[bold cyan]⚡ Starting Parallel Analysis Mode[/bold cyan]")
+        self.agent.state.set("parallel_mode", True)
+        start_time = time.monotonic()
+        
+        pool = BrowserSessionPool(
+            self.config,
+            self.browser_tools,
+            min(self.config.max_parallel_browser_sessions, len(competitors))
+        )
+        session_count = await pool.start(self.browser_tools.llm)
+        # Tracked so cleanup() stops them if the run is interrupted
+        self.parallel_browser_sessions = pool.extra_sessions
+        console.print(f"[bold]Analyzing {len(competitors)} competitors with {session_count} browser sessions[/bold]")
+        
+        try:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                console=console
+            ) as progress:
+                results = await pool.run(
+                    competitors,
+                    lambda browser_tools, competitor: self._analyze_website_impl(
+                        competitor['name'], competitor['url'], browser_tools, progress
+                    )
+                )
+        finally:
+            await pool.cleanup()
+            self.parallel_browser_sessions = []
+        
+        for competitor, result in zip(competitors, results):
+            if isinstance(result, Exception):
+                console.print(f"[red]❌ Error analyzing {competitor['name']}: {result}[/red]")
+                all_competitor_data = self._safe_state_get("competitor_data", {})
+                all_competitor_data[competitor['name']] = {"status": "error", "error": str(result)}
+                self.agent.state.set("competitor_data", all_competitor_data)
+            else:
+                console.print(f"[green]✓ {competitor['name']}: {result[:200]}[/green]")
+        
+        duration = time.monotonic() - start_time
+        self.agent.state.set("execution_stats", {
+            "total_duration": duration,
+            "avg_duration_per_competitor": duration / len(competitors),
+            "concurrent_sessions": session_count
+        })
+        console.print(f"[green]✅ Parallel analysis finished in {duration:.2f} seconds[/green]")
+    
     async def run(self, competitors: List[Dict], parallel: bool = False) -> Dict:
         """Run the competitive intelligence analysis."""
         try:
@@ -369,28 +466,10 @@ class CompetitiveIntelligenceAgent:
             console.print("\n[cyan]🤖 Starting competitive analysis workflow...[/cyan]")
             console.print(f"[bold]Analyzing {len(competitors)} competitors[/bold]")
             
-            # Analyze each competitor sequentially
-            for i, competitor in enumerate(competitors, 1):
-                console.print(f"\n[bold yellow]📊 Competitor {i}/{len(competitors)}: {competitor['name']}[/bold yellow]")
-                
-                try:
-                    # Directly invoke the tool
-                    result = self.agent.tool.analyze_website(
-                        competitor_name=competitor['name'],
-                        competitor_url=competitor['url']
-                    )
-                    console.print(f"[green]✓ {competitor['name']} analysis complete[/green]")
-                    console.print(f"[dim]Result: {result[:200]}...[/dim]" if len(result) > 200 else f"[dim]Result: {result}[/dim]")
-                    
-                    # Add a small delay between competitors to avoid overwhelming
-                    if i < len(competitors):
-                        console.print(f"[dim]Waiting 2 seconds before next competitor...[/dim]")
-                        await asyncio.sleep(2)
-                        
-                except Exception as comp_error:
-                    console.print(f"[red]❌ Error analyzing {competitor['name']}: {comp_error}[/red]")
-                    # Continue with next competitor even if one fails
-                    continue
+            if parallel and len(competitors) > 1:
+                await self._analyze_competitors_parallel(competitors)
+            else:
+                await self._analyze_competitors_sequential(competitors)
             
             console.print("\n[bold cyan]All competitors analyzed, generating insights...[/bold cyan]")
             
@@ -447,7 +526,8 @@ class CompetitiveIntelligenceAgent:
                 "analysis_results": self._safe_state_get("analysis_results", {}),
                 "apis_discovered": self._safe_state_get("discovered_apis", []),
                 "session_id": datetime.now().strftime("%Y%m%d_%H%M%S"),
-                "parallel_mode": self._safe_state_get("parallel_mode", False)
+                "parallel_mode": self._safe_state_get("parallel_mode", False),
+                "execution_stats": self._safe_state_get("execution_stats")
             }
             
         except Exception as e:
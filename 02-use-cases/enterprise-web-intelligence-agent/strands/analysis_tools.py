@@ -1,6 +1,8 @@
 """Analysis tools using BedrockAgentCore SDK's CodeInterpreter."""
 
+import hashlib
 import json
+import re
 from typing import Dict, List, Any
 from rich.console import Console
 from datetime import datetime
@@ -18,6 +20,8 @@ class AnalysisTools:
         self.config = config
         self.code_interpreter = CodeInterpreter(config.region)
         self.session_active = False
+        # Content hash -> sandbox path of data files written in this session
+        self._staged_files = {}
 
     def _extract_output(self, result: Dict) -> str:
         """Extract output from CodeInterpreter result."""
@@ -52,6 +56,7 @@ class AnalysisTools:
         )
         
         self.session_active = True
+        self._staged_files = {}
         console.print(f"✅ CodeInterpreter session: {session_id}")
         
         # Set up the analysis environment
@@ -99,20 +104,45 @@ except Exception as e:
         
         return session_id
     
+    def stage_data(self, name: str, data: Any) -> str:
+        """Write data into the sandbox as a JSON file and return its path.
+        
+        Files are keyed by a hash of their content, so staging the same data
+        again in a later analysis step reuses the file already written.
+        Generated code loads the file instead of embedding the data in its
+        source.
+        """
+        payload = json.dumps(self._make_serializable(data))
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+        if digest in self._staged_files:
+            return self._staged_files[digest]
+        
+        path = f"data/{re.sub(r'[^A-Za-z0-9_-]+', '_', name)}_{digest}.json"
+        result = self.code_interpreter.invoke("writeFiles", {
+            "content": [{"path": path, "text": payload}]
+        })
+        for event in result.get("stream", []):
+            if event.get("result", {}).get("isError"):
+                raise RuntimeError(f"Failed to stage {name}: {self._extract_output(event['result'])}")
+        
+        self._staged_files[digest] = path
+        console.print(f"[dim]📦 Staged {name} ({len(payload)} bytes) at {path}[/dim]")
+        return path
+    
     def save_session_state(self, session_name: str, data: Dict) -> Dict:
         """NEW: Save session state for later resumption."""
         try:
             console.print(f"[cyan]💾 Saving session state: {session_name}[/cyan]")
 
-            # Create a JSON-serializable copy of the data
-            serializable_data = self._make_serializable(data)
+            data_path = self.stage_data(f"session_{session_name}", data)
             
             save_code = f"""
 import json
 import os
 from datetime import datetime
 
-session_data = {json.dumps(serializable_data)}
+with open({data_path!r}) as f:
+    session_data = json.load(f)
 session_name = "{session_name}"
 
 # Create session metadata
@@ -244,6 +274,7 @@ else:
         """NEW: Use AWS CLI within Code Interpreter to save data to S3."""
         try:
             console.print(f"[cyan]☁️ Saving to S3 using AWS CLI...[/cyan]")
+            data_path = self.stage_data("s3_export", data)
             
             aws_cli_code = f"""
 import json
@@ -252,7 +283,8 @@ import os
 from datetime import datetime
 
 # Prepare data
-data = {json.dumps(data)}
+with open({data_path!r}) as f:
+    data = json.load(f)
 bucket = "{bucket}"
 prefix = "{prefix}"
 
@@ -341,12 +373,14 @@ print(json.dumps(output))
         """NEW: Analyze pricing patterns across competitors."""
         try:
             console.print("[cyan]🔍 Analyzing pricing patterns...[/cyan]")
+            data_path = self.stage_data("competitor_data", competitor_data)
             
             analysis_code = f"""
 import json
 import pandas as pd
 
-competitor_data = {json.dumps(competitor_data)}
+with open({data_path!r}) as f:
+    competitor_data = json.load(f)
 
 # Analyze what data we have and what's missing
 analysis = {{
@@ -390,13 +424,17 @@ print(json.dumps(analysis, indent=2))
         """NEW: Generate insights by combining browser and analysis data."""
         try:
             console.print("[cyan]💡 Generating competitive insights...[/cyan]")
+            data_path = self.stage_data("competitor_data", competitor_data)
+            analysis_path = self.stage_data("pattern_analysis", pattern_analysis)
             
             insights_code = f"""
 import json
 from datetime import datetime
 
-competitor_data = {json.dumps(competitor_data)}
-pattern_analysis = {json.dumps(pattern_analysis)}
+with open({data_path!r}) as f:
+    competitor_data = json.load(f)
+with open({analysis_path!r}) as f:
+    pattern_analysis = json.load(f)
 
 insights = {{
     "generated_at": datetime.now().isoformat(),
@@ -443,6 +481,7 @@ print(json.dumps(insights, indent=2))
         """Analyze data for a specific competitor."""
         try:
             console.print(f"[cyan]📊 Analyzing {competitor_name}...[/cyan]")
+            data_path = self.stage_data(f"competitor_{competitor_name}", data)
             
             analysis_code = f"""
 import json
@@ -451,7 +490,8 @@ import os  # Make sure os is imported
 from datetime import datetime
 
 # Load competitor data
-competitor_data = {json.dumps(data)}
+with open({data_path!r}) as f:
+    competitor_data = json.load(f)
 competitor_name = "{competitor_name}"
 
 # Create analysis summary
@@ -544,6 +584,7 @@ for file in created_files:
         """Create comparison visualizations."""
         try:
             console.print("[cyan]📈 Creating visualizations...[/cyan]")
+            data_path = self.stage_data("competitor_data", all_competitors_data)
             
             viz_code = f"""
 import json
@@ -555,7 +596,8 @@ import glob
 from datetime import datetime
 
 # Load all competitor data
-all_data = {json.dumps(all_competitors_data)}
+with open({data_path!r}) as f:
+    all_data = json.load(f)
 
 # Create figure
 fig, axes = plt.subplots(2, 2, figsize=(15, 12))
@@ -755,6 +797,7 @@ else:
             console.print(f"[dim]Test output: {test_output}[/dim]")
             
             # Now create the full report
+            data_path = self.stage_data("competitor_data", all_data)
             report_code = f'''
 import json
 import os
@@ -763,6 +806,9 @@ from datetime import datetime
 # Create directories
 os.makedirs('reports', exist_ok=True)
 
+with open({data_path!r}) as f:
+    all_data = json.load(f)
+
 # Generate markdown report
 report_content = """# Competitive Intelligence Report
 
@@ -787,7 +833,7 @@ This report analyzes {len(all_data)} competitor websites, examining their pricin
 """
 
 # Add sections for each competitor
-for competitor, data in {json.dumps(all_data)}.items():
+for competitor, data in all_data.items():
     report_content += f"### {{competitor}}\\n\\n"
     report_content += f"**Website:** {{data.get('url', 'N/A')}}  \\n"
     report_content += f"**Status:** {{data.get('status', 'Unknown')}}  \\n"
@@ -940,6 +986,7 @@ for file in sorted(created_files):
             try:
                 self.code_interpreter.stop()
                 self.session_active = False
+                self._staged_files = {}
                 console.print("✅ CodeInterpreter cleaned up")
             except Exception as e:
                 console.print(f"[yellow]Warning: Error cleaning up CodeInterpreter: {e}[/yellow]")
\ No newline at end of file
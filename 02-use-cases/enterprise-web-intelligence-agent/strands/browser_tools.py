@@ -1,6 +1,8 @@
 """Browser automation tools using BedrockAgentCore SDK with Playwright and CDP enhancements."""
 
 import asyncio
+import re
+import time
 import uuid
 import json
 from typing import Dict, List, Optional, Any
@@ -17,6 +19,14 @@ from bedrock_agentcore._utils.endpoints import get_control_plane_endpoint
 
 console = Console()
 
+# Requests that never finish or fire on a timer, so they never keep a page from being ready
+BACKGROUND_RESOURCE_TYPES = {"websocket", "eventsource", "ping"}
+BACKGROUND_URL_RE = re.compile(
+    r"google-analytics\.com|googletagmanager\.com|doubleclick\.net|facebook\.com/tr|"
+    r"segment\.(?:io|com)|hotjar\.com|clarity\.ms|/collect\b|/beacon\b|/pixel\b",
+    re.IGNORECASE
+)
+
 
 class BrowserTools:
     """Enhanced browser automation tools with CDP capabilities."""
@@ -35,6 +45,12 @@ class BrowserTools:
         self._screenshots_taken = []
         self._discovered_apis = []
         self._performance_metrics = {}
+        # Keeps local files of sessions running side by side apart
+        self._session_tag = uuid.uuid4().hex[:8]
+        # Network activity used to detect when a page has finished loading
+        self._inflight_requests = {}
+        self._last_network_activity = time.monotonic()
+        self._wait_metrics = []
     
     def create_browser_with_recording(self) -> str:
         """Create a browser with recording configuration using Control Plane API."""
@@ -92,10 +108,11 @@ class BrowserTools:
         self.browser_client = BrowserClient(region=self.config.region)
         self.browser_client.identifier = self.browser_id
         
-        # Start a session
-        session_id = self.browser_client.start(
+        # Start a session (in a thread, so several sessions can start at once)
+        session_id = await asyncio.to_thread(
+            self.browser_client.start,
             identifier=self.browser_id,
-            name=f"competitive_intel_session_{datetime.now().strftime('%Y%m%d-%H%M%S')}",
+            name=f"competitive_intel_session_{datetime.now().strftime('%Y%m%d-%H%M%S')}_{self._session_tag}",
             session_timeout_seconds=self.config.browser_session_timeout
         )
         
@@ -185,8 +202,146 @@ class BrowserTools:
             except:
                 pass
         
+        def track_request_start(request):
+            try:
+                if (request.resource_type in BACKGROUND_RESOURCE_TYPES
+                        or BACKGROUND_URL_RE.search(request.url)):
+                    return
+            except Exception:
+                pass
+            now = time.monotonic()
+            self._inflight_requests[request] = now
+            self._last_network_activity = now
+        
+        def track_request_end(request):
+            started_at = self._inflight_requests.pop(request, None)
+            if started_at is None:
+                return
+            now = time.monotonic()
+            # A long-poll finishing is not page activity
+            if now - started_at < self.config.page_long_request_ms / 1000:
+                self._last_network_activity = now
+        
         # Set up response handler
         self.page.on("response", handle_response)
+        
+        # Track requests in flight for page readiness
+        self.page.on("request", track_request_start)
+        self.page.on("requestfinished", track_request_end)
+        self.page.on("requestfailed", track_request_end)
+    
+    async def wait_for_page_ready(self, label: str = "", selector: Optional[str] = None,
+                                  timeout_ms: Optional[int] = None) -> Dict:
+        """Wait until the page is ready instead of sleeping for a fixed time.
+        
+        The page is ready once at most page_max_inflight_requests requests
+        have been in flight for page_quiet_window_ms, the DOM tree and text
+        have not changed for page_quiet_window_ms and, if given, selector is
+        visible. Websockets, event streams, analytics beacons and requests
+        running longer than page_long_request_ms are not counted, and
+        attribute changes (animations, carousels) are ignored. Gives up after
+        timeout_ms (page_ready_timeout_ms by default). The wait is recorded in
+        the page readiness metrics.
+        """
+        timeout = (timeout_ms or self.config.page_ready_timeout_ms) / 1000
+        quiet_window = self.config.page_quiet_window_ms / 1000
+        started_at = time.monotonic()
+        deadline = started_at + timeout
+        
+        selector_found = None
+        if selector:
+            try:
+                await self.page.wait_for_selector(selector, state="visible", timeout=timeout * 1000)
+                selector_found = True
+            except Exception:
+                selector_found = False
+        
+        network_idle, dom_settled = await asyncio.gather(
+            self._wait_for_network_quiet(quiet_window, deadline),
+            self._wait_for_dom_settled(quiet_window, deadline)
+        )
+        
+        waited_ms = round((time.monotonic() - started_at) * 1000)
+        wait_info = {
+            "label": label,
+            "url": self.page.url,
+            "waited_ms": waited_ms,
+            "network_idle": network_idle,
+            "dom_settled": dom_settled,
+            "selector": selector,
+            "selector_found": selector_found,
+            "timed_out": not (network_idle and dom_settled and selector_found is not False)
+        }
+        self._wait_metrics.append(wait_info)
+        console.print(f"[dim]⏱️ Page ready after {waited_ms}ms{' (timed out)' if wait_info['timed_out'] else ''}: {label}[/dim]")
+        return wait_info
+    
+    async def _wait_for_network_quiet(self, quiet_window: float, deadline: float) -> bool:
+        """Wait until few requests are in flight and none started or ended for quiet_window"""
+        long_request = self.config.page_long_request_ms / 1000
+        while True:
+            now = time.monotonic()
+            # Long requests are not counted; drop them so ones that never finish
+            # (long-polls left open by a navigation) don't stay tracked forever
+            for request, started_at in list(self._inflight_requests.items()):
+                if now - started_at >= long_request:
+                    del self._inflight_requests[request]
+            inflight = len(self._inflight_requests)
+            if inflight <= self.config.page_max_inflight_requests:
+                idle_for = now - self._last_network_activity
+                if idle_for >= quiet_window:
+                    return True
+                # Sleep until the quiet window would end, unless activity resets it
+                wait = quiet_window - idle_for
+            else:
+                wait = 0.05
+            if now >= deadline:
+                return False
+            await asyncio.sleep(min(wait, deadline - now))
+    
+    async def _wait_for_dom_settled(self, quiet_window: float, deadline: float) -> bool:
+        """Wait until the DOM has not changed for quiet_window, using a MutationObserver"""
+        remaining_ms = int((deadline - time.monotonic()) * 1000)
+        if remaining_ms <= 0:
+            return False
+        try:
+            return await self.page.evaluate("""
+                ([quietMs, maxMs]) => new Promise(resolve => {
+                    let quietTimer = null;
+                    let ceilingTimer = null;
+                    const observer = new MutationObserver(() => {
+                        clearTimeout(quietTimer);
+                        quietTimer = setTimeout(() => done(true), quietMs);
+                    });
+                    const done = (settled) => {
+                        observer.disconnect();
+                        clearTimeout(quietTimer);
+                        clearTimeout(ceilingTimer);
+                        resolve(settled);
+                    };
+                    observer.observe(document.documentElement || document, {
+                        childList: true, subtree: true, characterData: true
+                    });
+                    quietTimer = setTimeout(() => done(true), quietMs);
+                    ceilingTimer = setTimeout(() => done(false), maxMs);
+                })
+            """, [int(quiet_window * 1000), remaining_ms])
+        except Exception:
+            # The page navigated away while waiting
+            return False
+    
+    def get_wait_metrics(self, since: int = 0) -> Dict:
+        """Summarize page readiness waits, starting from wait number since."""
+        waits = self._wait_metrics[since:]
+        total_ms = sum(w["waited_ms"] for w in waits)
+        return {
+            "waits": len(waits),
+            "total_wait_ms": total_ms,
+            "avg_wait_ms": round(total_ms / len(waits)) if waits else 0,
+            "max_wait_ms": max((w["waited_ms"] for w in waits), default=0),
+            "timeouts": sum(1 for w in waits if w["timed_out"]),
+            "pages": waits
+        }
     
     async def navigate_to_url(self, url: str) -> Dict:
         """Navigate to URL with enhanced visual feedback."""
@@ -197,7 +352,7 @@ class BrowserTools:
             await self.page.goto(url, wait_until="domcontentloaded", timeout=60000)
             
             # Wait for dynamic content
-            await self.page.wait_for_timeout(3000)
+            await self.wait_for_page_ready(f"navigate {url}")
             
             # Get page metrics if CDP is available
             if self.cdp_session:
@@ -302,7 +457,7 @@ class BrowserTools:
             await self.page.click('button[type="submit"], input[type="submit"]')
             
             # Wait for navigation or response
-            await self.page.wait_for_timeout(3000)
+            await self.wait_for_page_ready("authentication")
             
             # Check if login was successful (simple heuristic)
             current_url = self.page.url
@@ -331,7 +486,7 @@ class BrowserTools:
             await file_input.set_input_files(file_path)
             
             # Wait for any upload progress
-            await self.page.wait_for_timeout(2000)
+            await self.wait_for_page_ready("file upload")
             
             return {
                 "status": "success",
@@ -369,7 +524,7 @@ class BrowserTools:
                         if link:
                             await link.click()
                             await self.page.wait_for_load_state("domcontentloaded")
-                            await self.page.wait_for_timeout(2000)
+                            await self.wait_for_page_ready(f"explore {target}")
                             
                             # Capture information about this page
                             page_info = {
@@ -389,6 +544,7 @@ class BrowserTools:
                             
                             # Go back to base URL for next exploration
                             await self.page.goto(base_url, wait_until="domcontentloaded")
+                            await self.wait_for_page_ready("return to base page")
                             break
                     except:
                         continue
@@ -481,7 +637,8 @@ class BrowserTools:
                 
                 # Smooth scroll
                 await self.page.evaluate(f"window.scrollTo({{top: {current_position}, behavior: 'smooth'}})")
-                await asyncio.sleep(1)  # Pause to load content
+                # Pause until lazily loaded content has arrived
+                await self.wait_for_page_ready(f"scroll {int(position * 100)}%", timeout_ms=1000)
                 
                 # Look for important sections at this position
                 important_selectors = [
@@ -511,7 +668,7 @@ class BrowserTools:
             
             # Scroll back to top
             await self.page.evaluate("window.scrollTo({top: 0, behavior: 'smooth'})")
-            await asyncio.sleep(1)
+            await self.wait_for_page_ready("scroll to top", timeout_ms=1000)
             
         except Exception as e:
             console.print(f"[yellow]⚠️ Discovery error: {e}[/yellow]")
@@ -546,6 +703,7 @@ class BrowserTools:
                         if element:
                             await element.click()
                             await self.page.wait_for_load_state("domcontentloaded")
+                            await self.wait_for_page_ready(f"open {target}")
                             console.print(f"[green]✅ Found and clicked {target} link[/green]")
                             return True
                     except:
@@ -628,12 +786,15 @@ class BrowserTools:
             }
             
             try:
-                response = bedrock_client.invoke_model(
+                # Run the blocking call off the event loop so parallel
+                # competitor analyses extract at the same time
+                response = await asyncio.to_thread(
+                    bedrock_client.invoke_model,
                     modelId=self.config.llm_model_id,
                     body=json.dumps(native_request)
                 )
                 
-                model_response = json.loads(response["body"].read())
+                model_response = json.loads(await asyncio.to_thread(response["body"].read))
                 response_text = model_response["content"][0]["text"]
                 
                 return {
@@ -708,12 +869,15 @@ class BrowserTools:
             }
             
             try:
-                response = bedrock_client.invoke_model(
+                # Run the blocking call off the event loop so parallel
+                # competitor analyses extract at the same time
+                response = await asyncio.to_thread(
+                    bedrock_client.invoke_model,
                     modelId=self.config.llm_model_id,
                     body=json.dumps(native_request)
                 )
                 
-                model_response = json.loads(response["body"].read())
+                model_response = json.loads(await asyncio.to_thread(response["body"].read))
                 response_text = model_response["content"][0]["text"]
                 
                 return {
@@ -757,7 +921,7 @@ class BrowserTools:
             
             # Take screenshot
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            screenshot_path = f"screenshot_{timestamp}.png"
+            screenshot_path = f"screenshot_{self._session_tag}_{timestamp}.png"
             
             await self.page.screenshot(path=screenshot_path, full_page=False)
             
@@ -837,4 +1001,90 @@ class BrowserTools:
         if self.browser_client:
             console.print("[yellow]🛑 Stopping session...[/yellow]")
             self.browser_client.stop()
-            console.print("✅ Cleanup complete")
\ No newline at end of file
+            console.print("✅ Cleanup complete")
+
+class BrowserSessionPool:
+    """A bounded pool of browser sessions for analyzing several sites at once.
+    
+    Extra sessions are started on the primary session's browser, so every
+    session is recorded to the same S3 location. Each session has its own
+    page, screenshots and discovered APIs. The primary session stays owned
+    by its creator and is not cleaned up by the pool.
+    """
+    
+    def __init__(self, config, primary: BrowserTools, size: int):
+        self.config = config
+        self.primary = primary
+        self.size = max(1, size)
+        self.sessions: List[BrowserTools] = [primary]
+    
+    @property
+    def extra_sessions(self) -> List[BrowserTools]:
+        return self.sessions[1:]
+    
+    async def start(self, llm) -> int:
+        """Start the extra sessions concurrently and return the pool size.
+        
+        Sessions that fail to start are skipped, so the pool may be smaller
+        than requested.
+        """
+        extra = []
+        for _ in range(self.size - 1):
+            tools = BrowserTools(self.config)
+            tools.browser_id = self.primary.browser_id
+            tools.recording_config = getattr(self.primary, "recording_config", {})
+            extra.append(tools)
+        
+        if extra:
+            console.print(f"[cyan]⚡ Starting {len(extra)} additional browser sessions...[/cyan]")
+        results = await asyncio.gather(
+            *(tools.initialize_browser_session(llm) for tools in extra),
+            return_exceptions=True
+        )
+        for tools, result in zip(extra, results):
+            if isinstance(result, Exception):
+                console.print(f"[yellow]⚠️ Browser session failed to start: {result}[/yellow]")
+                try:
+                    await tools.cleanup()
+                except Exception as e:
+                    console.print(f"[yellow]⚠️ Browser session cleanup error: {e}[/yellow]")
+            else:
+                self.sessions.append(tools)
+        
+        console.print(f"[green]✅ Browser session pool ready: {len(self.sessions)} sessions[/green]")
+        return len(self.sessions)
+    
+    async def run(self, items: List[Any], handler) -> List[Any]:
+        """Process items with handler(browser_tools, item) from a shared work queue.
+        
+        Each session takes the next item as soon as it is free. Results are
+        returned in item order, with the exception in place of the result
+        for items whose handler raised.
+        """
+        queue = asyncio.Queue()
+        for index, item in enumerate(items):
+            queue.put_nowait((index, item))
+        results = [None] * len(items)
+        
+        async def worker(tools: BrowserTools):
+            while True:
+                try:
+                    index, item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    results[index] = await handler(tools, item)
+                except Exception as e:
+                    results[index] = e
+        
+        await asyncio.gather(*(worker(tools) for tools in self.sessions))
+        return results
+    
+    async def cleanup(self):
+        """Stop the extra sessions started by the pool."""
+        for tools in self.extra_sessions:
+            try:
+                await tools.cleanup()
+            except Exception as e:
+                console.print(f"[yellow]⚠️ Browser session cleanup error: {e}[/yellow]")
+        self.sessions = [self.primary]
@@ -1,7 +1,8 @@
 import json
 import os
 from typing import Dict, Any, Optional, List
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import asyncio
@@ -10,8 +11,12 @@ from dotenv import load_dotenv
 import boto3
 from botocore.exceptions import NoCredentialsError, ProfileNotFound
 from botocore.config import Config
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager
 import time
+import hashlib
+import shutil
+import threading
+from collections import OrderedDict
 from functools import lru_cache
 
 # Load environment variables
@@ -120,7 +125,7 @@ except ImportError:
         raise
 
 # Import AgentCore for code interpreter
-from bedrock_agentcore.tools.code_interpreter_client import code_session
+from bedrock_agentcore.tools.code_interpreter_client import code_session, CodeInterpreter
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -128,9 +133,15 @@ async def lifespan(app: FastAPI):
     global aws_session, aws_region
     aws_session, aws_region = setup_aws_credentials()
     initialize_agents()
+    reapers = [
+        asyncio.create_task(reap_idle_sandboxes()),
+        asyncio.create_task(reap_idle_sessions()),
+    ]
     yield
-    # Shutdown (if needed)
-    pass
+    # Shutdown: stop warm sandboxes so they don't run until their timeout
+    for reaper in reapers:
+        reaper.cancel()
+    await asyncio.to_thread(sandbox_pool.close_all)
 
 app = FastAPI(
     title="AgentCore Code Interpreter", 
@@ -168,21 +179,585 @@ class FileUploadRequest(BaseModel):
     content: str
     session_id: Optional[str] = None
 
+# Session store settings
+SESSION_MAX_COUNT = int(os.getenv('SESSION_MAX_COUNT', '200'))
+SESSION_IDLE_TTL = int(os.getenv('SESSION_IDLE_TTL', '3600'))
+SESSION_MAX_RESIDENT_MB = int(os.getenv('SESSION_MAX_RESIDENT_MB', '512'))
+SESSION_HISTORY_LIMIT = int(os.getenv('SESSION_HISTORY_LIMIT', '50'))
+# Large CSVs, results and images are written here instead of kept in memory
+SESSION_SPILL_DIR = os.getenv('SESSION_SPILL_DIR', '')
+SESSION_SPILL_THRESHOLD_KB = int(os.getenv('SESSION_SPILL_THRESHOLD_KB', '256'))
+
+class SpilledArtifact:
+    """Text moved out of memory into a file under SESSION_SPILL_DIR"""
+
+    def __init__(self, path: str, size: int):
+        self.path = path
+        self.size = size
+
+    def load(self) -> str:
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+def estimate_size(value) -> int:
+    """Approximate bytes held in memory by a session value"""
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(len(str(k)) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_size(v) for v in value)
+    if isinstance(value, SpilledArtifact):
+        return 0
+    return 16
+
+def load_spilled(value):
+    """Copy of a session value with spilled artifacts read back from disk"""
+    if isinstance(value, SpilledArtifact):
+        try:
+            return value.load()
+        except OSError as e:
+            print(f"⚠️  Spilled artifact {value.path} unavailable: {e}")
+            return ""
+    if isinstance(value, dict):
+        return {k: load_spilled(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [load_spilled(v) for v in value]
+    return value
+
 # Session management
 class CodeInterpreterSession:
+    """History and uploaded data of one IDE session.
+
+    Histories are capped at SESSION_HISTORY_LIMIT entries and resident_bytes
+    tracks their approximate size. With SESSION_SPILL_DIR set, CSV content,
+    execution results and image data larger than SESSION_SPILL_THRESHOLD_KB
+    are kept on disk and only read back when needed.
+    """
+
     def __init__(self, session_id: str):
         self.session_id = session_id
         self.conversation_history = []
         self.code_history = []
         self.execution_results = []
         self.interactive_sessions = {}  # Track interactive execution sessions
-        self.uploaded_csv = None  # Store uploaded CSV file data
+        self._uploaded_csv = None  # Store uploaded CSV file data
+        self.resident_bytes = 0
+        self.spilled_bytes = 0
+        self.last_access = time.monotonic()
+        self._spill_dir = None
+
+    @property
+    def uploaded_csv(self) -> Optional[dict]:
+        if self._uploaded_csv is None:
+            return None
+        return load_spilled(self._uploaded_csv)
+
+    @property
+    def uploaded_csv_filename(self) -> Optional[str]:
+        return self._uploaded_csv['filename'] if self._uploaded_csv else None
+
+    def set_uploaded_csv(self, csv_data: Optional[dict]):
+        if self._uploaded_csv is not None:
+            self._forget(self._uploaded_csv)
+        self._uploaded_csv = self._keep(csv_data) if csv_data is not None else None
+        self.resident_bytes += estimate_size(self._uploaded_csv)
+
+    def add_conversation(self, entry: dict):
+        self._append(self.conversation_history, self._keep(entry))
+
+    def add_execution(self, code: str, entry: dict):
+        self._append(self.code_history, code)
+        self._append(self.execution_results, self._keep(entry))
+
+    def export_history(self) -> dict:
+        return {
+            "conversation_history": load_spilled(self.conversation_history),
+            "execution_results": load_spilled(self.execution_results),
+        }
+
+    def delete_spilled(self):
+        if self._spill_dir:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+        self.spilled_bytes = 0
+
+    def _append(self, history: list, entry):
+        history.append(entry)
+        self.resident_bytes += estimate_size(entry)
+        while len(history) > SESSION_HISTORY_LIMIT:
+            self._forget(history.pop(0))
+
+    def _keep(self, value):
+        """Spill large strings in a value to disk"""
+        if isinstance(value, dict):
+            return {k: self._keep(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self._keep(v) for v in value]
+        if isinstance(value, str) and self._should_spill(value):
+            return self._spill(value)
+        return value
+
+    def _should_spill(self, text: str) -> bool:
+        return bool(SESSION_SPILL_DIR) and len(text) >= SESSION_SPILL_THRESHOLD_KB * 1024
+
+    def _spill(self, text: str):
+        if self._spill_dir is None:
+            # Session ids come from clients, so they are never used as paths
+            digest = hashlib.sha256(self.session_id.encode('utf-8')).hexdigest()[:32]
+            self._spill_dir = os.path.join(SESSION_SPILL_DIR, digest)
+        try:
+            os.makedirs(self._spill_dir, exist_ok=True)
+            path = os.path.join(self._spill_dir, f"{uuid.uuid4().hex}.txt")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+        except OSError as e:
+            print(f"⚠️  Failed to spill {len(text)} chars to disk, keeping in memory: {e}")
+            return text
+        self.spilled_bytes += len(text)
+        return SpilledArtifact(path, len(text))
+
+    def _forget(self, value):
+        """Release the accounting and spilled files of a value dropped from the session"""
+        self.resident_bytes -= estimate_size(value)
+        self._delete_spilled(value)
+
+    def _delete_spilled(self, value):
+        if isinstance(value, SpilledArtifact):
+            self.spilled_bytes -= value.size
+            try:
+                os.remove(value.path)
+            except OSError:
+                pass
+        elif isinstance(value, dict):
+            for v in value.values():
+                self._delete_spilled(v)
+        elif isinstance(value, list):
+            for v in value:
+                self._delete_spilled(v)
 
 # Global variables for agents
 code_generator_agent = None
 code_executor_agent = None
 executor_type = "unknown"  # Track which executor type we're using
-active_sessions = {}
+
+# Warm Code Interpreter sandbox settings
+SANDBOX_POOL_MAX_SIZE = int(os.getenv('SANDBOX_POOL_MAX_SIZE', '10'))
+SANDBOX_IDLE_TIMEOUT = int(os.getenv('SANDBOX_IDLE_TIMEOUT', '600'))
+AGENTCORE_SESSION_TIMEOUT = int(os.getenv('AGENTCORE_SESSION_TIMEOUT', '1800'))
+# Restart a sandbox this long before AgentCore would end its session
+SANDBOX_EXPIRY_MARGIN = 60
+
+class WarmSandbox:
+    """A long-lived Code Interpreter session bound to one CodeInterpreterSession"""
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self.client = None
+        self.lock = threading.Lock()  # One execution at a time per sandbox
+        self.files = {}  # Sandbox path -> sha256 of the content written there
+        self.started_at = 0.0
+        self.last_used = time.monotonic()
+        self.runs = 0
+        self.closed = False
+        self.broken = False
+
+    @property
+    def expired(self) -> bool:
+        age = time.monotonic() - self.started_at
+        return age > AGENTCORE_SESSION_TIMEOUT - SANDBOX_EXPIRY_MARGIN
+
+    def start(self):
+        """Start a new sandbox session, dropping any interpreter state and files"""
+        self.stop()
+        client = CodeInterpreter(aws_region)
+        client.start(
+            name=f"ide-{self.session_id[:40]}",
+            session_timeout_seconds=AGENTCORE_SESSION_TIMEOUT
+        )
+        self.client = client
+        self.files = {}
+        self.started_at = time.monotonic()
+        self.broken = False
+        print(f"🔥 Started warm sandbox for session {self.session_id}")
+
+    def stop(self):
+        """Stop the sandbox session if one is running"""
+        if self.client is None:
+            return
+        try:
+            self.client.stop()
+            print(f"🛑 Stopped sandbox for session {self.session_id}")
+        except Exception as e:
+            print(f"⚠️  Failed to stop sandbox for session {self.session_id}: {e}")
+        self.client = None
+        self.files = {}
+
+    def invoke(self, method: str, params: dict):
+        """Invoke a sandbox tool, marking the sandbox broken if the call fails"""
+        try:
+            return self.client.invoke(method, params)
+        except Exception:
+            self.broken = True
+            raise
+
+    def sync_files(self, files_data: list) -> Optional[str]:
+        """Write files whose content isn't already in the sandbox.
+
+        Returns:
+            The error text if the upload failed, otherwise None
+        """
+        hashes = {
+            f["path"]: hashlib.sha256(f["text"].encode("utf-8")).hexdigest()
+            for f in files_data
+        }
+        changed = [f for f in files_data if self.files.get(f["path"]) != hashes[f["path"]]]
+        if not changed:
+            if files_data:
+                print(f"📁 {len(files_data)} files already in sandbox, skipping upload")
+            return None
+
+        print(f"📁 Uploading {len(changed)} of {len(files_data)} files to sandbox...")
+        upload_response = self.invoke("writeFiles", {"content": changed})
+        for event in upload_response["stream"]:
+            result = event.get("result", {})
+            if result.get("isError", False):
+                error_content = result.get("content", [{}])
+                error_text = error_content[0].get("text", "Unknown error") if error_content else "Unknown error"
+                print(f"❌ File upload error: {error_text}")
+                return error_text
+            for item in result.get("content", []):
+                if item.get("type") == "text":
+                    print(f"✅ File upload: {item.get('text', '')}")
+
+        for f in changed:
+            self.files[f["path"]] = hashes[f["path"]]
+        return None
+
+    def remove_files(self, paths: list):
+        """Delete files from the sandbox and forget their hashes"""
+        paths = [path for path in paths if path in self.files]
+        if not paths:
+            return
+        response = self.invoke("removeFiles", {"paths": paths})
+        for _ in response["stream"]:
+            pass
+        for path in paths:
+            self.files.pop(path, None)
+
+class SandboxPool:
+    """Warm Code Interpreter sandboxes keyed by IDE session id.
+
+    Each session keeps one sandbox so interpreter state and uploaded files
+    survive between runs. Sandboxes idle for longer than idle_timeout, or
+    least recently used beyond max_size, are stopped; a sandbox close to
+    the AgentCore session timeout is restarted on its next use.
+    """
+
+    def __init__(self, max_size: int, idle_timeout: float):
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._sandboxes = OrderedDict()
+        self._lock = threading.Lock()
+        self.cold_starts = 0
+        self.warm_hits = 0
+
+    @contextmanager
+    def acquire(self, session_id: str):
+        """Use the session's sandbox exclusively, starting it if needed"""
+        while True:
+            sandbox, evicted = self._checkout(session_id)
+            self._stop_all(evicted)
+            with sandbox.lock:
+                # Evicted or released while we were waiting for it
+                if sandbox.closed:
+                    sandbox.stop()
+                    continue
+                if sandbox.client is None or sandbox.expired:
+                    try:
+                        sandbox.start()
+                    except Exception:
+                        self.discard(session_id, sandbox)
+                        raise
+                    self.cold_starts += 1
+                else:
+                    self.warm_hits += 1
+                try:
+                    yield sandbox
+                finally:
+                    sandbox.runs += 1
+                    sandbox.last_used = time.monotonic()
+                    if sandbox.broken:
+                        self.discard(session_id, sandbox)
+                    elif sandbox.closed:
+                        # Released while this run was using it
+                        sandbox.stop()
+                return
+
+    def remove_files(self, session_id: str, paths: list):
+        """Delete files from the session's sandbox if it is running"""
+        with self._lock:
+            sandbox = self._sandboxes.get(session_id)
+        if sandbox is None:
+            return
+        with sandbox.lock:
+            if sandbox.closed or sandbox.client is None:
+                return
+            try:
+                sandbox.remove_files(paths)
+            finally:
+                if sandbox.broken:
+                    self.discard(session_id, sandbox)
+
+    def release(self, session_id: str):
+        """Stop the session's sandbox, if it has one.
+
+        Never waits for a running execution: a sandbox in use is only marked
+        closed and is stopped by its user when the run ends.
+        """
+        with self._lock:
+            sandbox = self._sandboxes.pop(session_id, None)
+        if sandbox is None:
+            return
+        sandbox.closed = True
+        if sandbox.lock.acquire(blocking=False):
+            try:
+                sandbox.stop()
+            finally:
+                sandbox.lock.release()
+
+    def discard(self, session_id: str, sandbox: WarmSandbox):
+        """Drop a sandbox that can't be reused. Caller must hold sandbox.lock."""
+        with self._lock:
+            if self._sandboxes.get(session_id) is sandbox:
+                del self._sandboxes[session_id]
+        sandbox.closed = True
+        sandbox.stop()
+
+    def evict_idle(self) -> int:
+        """Stop sandboxes that have been idle longer than idle_timeout"""
+        now = time.monotonic()
+        with self._lock:
+            evicted = self._take(
+                lambda sandbox: now - sandbox.last_used > self.idle_timeout,
+                len(self._sandboxes)
+            )
+        self._stop_all(evicted)
+        return len(evicted)
+
+    def close_all(self):
+        """Stop every sandbox"""
+        with self._lock:
+            sandboxes = list(self._sandboxes.items())
+            self._sandboxes.clear()
+        for _, sandbox in sandboxes:
+            sandbox.closed = True
+            sandbox.stop()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "warm_sandboxes": len(self._sandboxes),
+                "max_size": self.max_size,
+                "idle_timeout": self.idle_timeout,
+                "cold_starts": self.cold_starts,
+                "warm_hits": self.warm_hits,
+            }
+
+    def _checkout(self, session_id: str):
+        """Get or create the session's sandbox entry and pick LRU sandboxes to evict"""
+        with self._lock:
+            sandbox = self._sandboxes.get(session_id)
+            if sandbox is None:
+                sandbox = WarmSandbox(session_id)
+                self._sandboxes[session_id] = sandbox
+            self._sandboxes.move_to_end(session_id)
+
+            evicted = []
+            overflow = len(self._sandboxes) - self.max_size
+            if overflow > 0:
+                evicted = self._take(lambda s: s is not sandbox, overflow)
+            return sandbox, evicted
+
+    def _take(self, should_evict, limit: int) -> list:
+        """Remove up to limit idle sandboxes, least recently used first.
+
+        Caller must hold the pool lock. Sandboxes in use are skipped.
+        """
+        evicted = []
+        for session_id, sandbox in list(self._sandboxes.items()):
+            if len(evicted) >= limit:
+                break
+            if not should_evict(sandbox) or not sandbox.lock.acquire(blocking=False):
+                continue
+            sandbox.closed = True
+            sandbox.lock.release()
+            del self._sandboxes[session_id]
+            evicted.append(sandbox)
+        return evicted
+
+    @staticmethod
+    def _stop_all(sandboxes: list):
+        for sandbox in sandboxes:
+            print(f"♻️  Evicting sandbox for session {sandbox.session_id}")
+            sandbox.stop()
+
+sandbox_pool = SandboxPool(SANDBOX_POOL_MAX_SIZE, SANDBOX_IDLE_TIMEOUT)
+
+@contextmanager
+def session_sandbox(session_id: Optional[str]):
+    """The session's warm sandbox, or a one-off sandbox when there is no session"""
+    if session_id:
+        with sandbox_pool.acquire(session_id) as sandbox:
+            yield sandbox
+        return
+
+    sandbox = WarmSandbox(str(uuid.uuid4()))
+    sandbox.start()
+    try:
+        yield sandbox
+    finally:
+        sandbox.stop()
+
+class SessionStore:
+    """Bounded store of CodeInterpreterSession objects.
+
+    Sessions idle for longer than idle_ttl are evicted, and least recently
+    used sessions are evicted while there are more than max_sessions or
+    their resident bytes exceed max_bytes. Evicting a session stops its warm
+    sandbox and deletes its spilled files.
+    """
+
+    def __init__(self, max_sessions: int, idle_ttl: float, max_bytes: int):
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self.max_bytes = max_bytes
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = {"idle": 0, "count": 0, "memory": 0}
+
+    def __contains__(self, session_id: str) -> bool:
+        with self._lock:
+            return session_id in self._sessions
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(self, session_id: str) -> Optional[CodeInterpreterSession]:
+        """Get a session and mark it as recently used"""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                self._touch(session)
+            return session
+
+    def get_or_create(self, session_id: str) -> CodeInterpreterSession:
+        """Get a session, creating it if needed, and enforce the store limits"""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                session = CodeInterpreterSession(session_id)
+                self._sessions[session_id] = session
+            self._touch(session)
+            evicted = self._take_over_limits(keep=session)
+        self._dispose(evicted)
+        return session
+
+    def evict_idle(self) -> int:
+        """Evict idle sessions and any sessions over the count or memory limits"""
+        now = time.monotonic()
+        with self._lock:
+            evicted = [
+                session for session in self._sessions.values()
+                if now - session.last_access > self.idle_ttl
+            ]
+            for session in evicted:
+                del self._sessions[session.session_id]
+            self.evictions["idle"] += len(evicted)
+            evicted += self._take_over_limits()
+        self._dispose(evicted)
+        return len(evicted)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "resident_sessions": len(self._sessions),
+                "resident_bytes": sum(s.resident_bytes for s in self._sessions.values()),
+                "spilled_bytes": sum(s.spilled_bytes for s in self._sessions.values()),
+                "max_sessions": self.max_sessions,
+                "max_bytes": self.max_bytes,
+                "idle_ttl": self.idle_ttl,
+                "evictions": dict(self.evictions),
+            }
+
+    def _touch(self, session: CodeInterpreterSession):
+        session.last_access = time.monotonic()
+        self._sessions.move_to_end(session.session_id)
+
+    def _take_over_limits(self, keep: CodeInterpreterSession = None) -> list:
+        """Remove least recently used sessions until the store is within its
+        limits. Caller must hold the lock."""
+        evicted = []
+        resident = sum(s.resident_bytes for s in self._sessions.values())
+        for session in list(self._sessions.values()):
+            over_count = len(self._sessions) > self.max_sessions
+            over_memory = resident > self.max_bytes
+            if not (over_count or over_memory):
+                break
+            if session is keep:
+                continue
+            del self._sessions[session.session_id]
+            resident -= session.resident_bytes
+            self.evictions["count" if over_count else "memory"] += 1
+            evicted.append(session)
+        return evicted
+
+    @staticmethod
+    def _dispose(sessions: list):
+        for session in sessions:
+            print(f"♻️  Evicting session {session.session_id} ({session.resident_bytes} bytes)")
+            sandbox_pool.release(session.session_id)
+            session.delete_spilled()
+
+active_sessions = SessionStore(
+    SESSION_MAX_COUNT, SESSION_IDLE_TTL, SESSION_MAX_RESIDENT_MB * 1024 * 1024
+)
+
+async def reap_idle_sessions():
+    """Periodically evict sessions that have been idle too long"""
+    while True:
+        await asyncio.sleep(max(SESSION_IDLE_TTL / 4, 15))
+        try:
+            evicted = await asyncio.to_thread(active_sessions.evict_idle)
+            if evicted:
+                print(f"♻️  Evicted {evicted} sessions")
+        except Exception as e:
+            print(f"⚠️  Session reaper error: {e}")
+
+async def reap_idle_sandboxes():
+    """Periodically stop sandboxes that have been idle too long"""
+    while True:
+        await asyncio.sleep(max(SANDBOX_IDLE_TIMEOUT / 4, 15))
+        try:
+            evicted = await asyncio.to_thread(sandbox_pool.evict_idle)
+            if evicted:
+                print(f"♻️  Stopped {evicted} idle sandboxes")
+        except Exception as e:
+            print(f"⚠️  Sandbox reaper error: {e}")
+
+# The executor agent is shared, so its tool calls run in the sandbox of the
+# session whose request is currently driving the agent
+_executor_agent_lock = threading.Lock()
+_executor_agent_session_id = None
+
+def run_executor_agent(session_id: str, prompt: str):
+    """Run the code executor agent with its tool calls bound to a session's sandbox"""
+    global _executor_agent_session_id
+    with _executor_agent_lock:
+        _executor_agent_session_id = session_id
+        try:
+            return code_executor_agent(prompt)
+        finally:
+            _executor_agent_session_id = None
 
 def clean_output_for_display(output: str) -> str:
     """Clean output for display by removing image binary data while preserving analysis text"""
@@ -217,8 +792,158 @@ def clean_output_for_display(output: str) -> str:
     
     return output
 
+# Chart artifact settings
+ARTIFACT_CACHE_MAX_MB = int(os.getenv('ARTIFACT_CACHE_MAX_MB', '256'))
+ARTIFACT_CHUNK_SIZE = 64 * 1024
+# Sandbox directory charts are saved to after each run
+SANDBOX_CHART_DIR = '_ide_charts'
+
+IMAGE_MEDIA_TYPES = {'png': 'image/png', 'jpeg': 'image/jpeg'}
+
+# Streaming execution over the websocket: output messages the client may fall
+# behind by before the sandbox stream stops being read, and the largest
+# output chunk sent in one message
+STREAM_MAX_PENDING_MESSAGES = int(os.getenv('STREAM_MAX_PENDING_MESSAGES', '32'))
+STREAM_CHUNK_CHARS = 16 * 1024
+
+class ArtifactCache:
+    """Content-addressed LRU cache of binary artifacts such as chart images.
+
+    Artifacts are keyed by the sha256 of their bytes, so the same chart
+    produced twice is stored once and its id doubles as an ETag.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._artifacts = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def put(self, data: bytes, media_type: str) -> str:
+        artifact_id = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            if artifact_id in self._artifacts:
+                self._artifacts.move_to_end(artifact_id)
+                return artifact_id
+            self._artifacts[artifact_id] = (data, media_type)
+            self._bytes += len(data)
+            # Evict least recently used artifacts, but always keep the new one
+            while self._bytes > self.max_bytes and len(self._artifacts) > 1:
+                _, (old_data, _) = self._artifacts.popitem(last=False)
+                self._bytes -= len(old_data)
+        return artifact_id
+
+    def get(self, artifact_id: str) -> Optional[tuple]:
+        """Get (data, media_type) for an artifact, or None if it was evicted"""
+        with self._lock:
+            artifact = self._artifacts.get(artifact_id)
+            if artifact is None:
+                self.misses += 1
+                return None
+            self._artifacts.move_to_end(artifact_id)
+            self.hits += 1
+            return artifact
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "artifacts": len(self._artifacts),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+artifact_cache = ArtifactCache(ARTIFACT_CACHE_MAX_MB * 1024 * 1024)
+
+def detect_image_format(data: bytes) -> Optional[str]:
+    """Image format from the file signature, or None if not a PNG or JPEG"""
+    if data.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'png'
+    if data.startswith(b'\xff\xd8\xff'):
+        return 'jpeg'
+    return None
+
+def store_image_artifact(data: bytes, source: str) -> Optional[dict]:
+    """Cache image bytes and return the reference sent to the frontend"""
+    image_format = detect_image_format(data)
+    if image_format is None:
+        return None
+    artifact_id = artifact_cache.put(data, IMAGE_MEDIA_TYPES[image_format])
+    return {
+        'format': image_format,
+        'artifact_id': artifact_id,
+        'url': f'/api/artifacts/{artifact_id}',
+        'size': len(data),
+        'source': source
+    }
+
+# Saves open matplotlib figures into SANDBOX_CHART_DIR and prints the chart files there
+CHART_EXPORT_CODE = f"""
+import os as _ide_os, sys as _ide_sys
+_ide_os.makedirs({SANDBOX_CHART_DIR!r}, exist_ok=True)
+_ide_plt = _ide_sys.modules.get('matplotlib.pyplot')
+if _ide_plt is not None:
+    for _ide_num in _ide_plt.get_fignums():
+        _ide_plt.figure(_ide_num).savefig(
+            _ide_os.path.join({SANDBOX_CHART_DIR!r}, f'figure_{{_ide_num}}.png'),
+            format='png', dpi=150, bbox_inches='tight'
+        )
+    _ide_plt.close('all')
+for _ide_name in sorted(_ide_os.listdir({SANDBOX_CHART_DIR!r})):
+    if _ide_name.lower().endswith(('.png', '.jpg', '.jpeg')):
+        print(_ide_os.path.join({SANDBOX_CHART_DIR!r}, _ide_name))
+"""
+
+def collect_sandbox_charts(sandbox) -> list:
+    """Save the sandbox's charts as files, fetch their bytes and cache them"""
+    import base64
+    
+    response = sandbox.invoke("executeCode", {
+        "code": CHART_EXPORT_CODE,
+        "language": "python",
+        "clearContext": False
+    })
+    paths = []
+    for event in response["stream"]:
+        result = event.get("result", {})
+        if result.get("isError", False):
+            print(f"⚠️  Chart export failed: {result.get('content')}")
+            return []
+        stdout = result.get("structuredContent", {}).get("stdout", "")
+        paths.extend(line.strip() for line in stdout.splitlines() if line.strip())
+    
+    if not paths:
+        return []
+    
+    images = []
+    read_response = sandbox.invoke("readFiles", {"paths": paths})
+    for event in read_response["stream"]:
+        for item in event.get("result", {}).get("content", []):
+            if item.get("type") != "resource":
+                continue
+            data = item.get("resource", {}).get("blob")
+            if data is None:
+                continue
+            if isinstance(data, str):
+                data = base64.b64decode(data)
+            image = store_image_artifact(data, 'sandbox_file')
+            if image:
+                images.append(image)
+    
+    # Remove exported files so the next run only picks up its own charts
+    remove_response = sandbox.invoke("removeFiles", {"paths": paths})
+    for _ in remove_response["stream"]:
+        pass
+    
+    print(f"🖼️  Collected {len(images)} charts from sandbox files")
+    return images
+
 def extract_image_data(execution_result: str):
-    """Extract base64 image data from execution results - fixed for AgentCore format"""
+    """Extract base64 image data printed as IMAGE_DATA: markers, for code that
+    still prints charts instead of leaving them as figures or files"""
     try:
         import re
         import base64
@@ -250,22 +975,11 @@ def extract_image_data(execution_result: str):
                         decoded = base64.b64decode(clean_match)
                         print(f"🔍 Match {i+1} - Decoded length: {len(decoded)} bytes")
                         
-                        # Check if it looks like a PNG (starts with PNG signature)
-                        if decoded.startswith(b'\x89PNG\r\n\x1a\n'):
-                            images.append({
-                                'format': 'png',
-                                'data': clean_match,
-                                'source': 'agentcore_stdout'
-                            })
-                            print(f"✅ Match {i+1} - Valid PNG image extracted")
-                        # Also check for JPEG signatures
-                        elif decoded.startswith(b'\xff\xd8\xff'):
-                            images.append({
-                                'format': 'jpeg',
-                                'data': clean_match,
-                                'source': 'agentcore_stdout'
-                            })
-                            print(f"✅ Match {i+1} - Valid JPEG image extracted")
+                        # Only PNG and JPEG images are kept
+                        image = store_image_artifact(decoded, 'agentcore_stdout')
+                        if image:
+                            images.append(image)
+                            print(f"✅ Match {i+1} - Valid {image['format'].upper()} image extracted")
                         else:
                             print(f"⚠️  Match {i+1} - Invalid image signature")
                     else:
@@ -309,20 +1023,59 @@ def upload_files_to_agentcore_sandbox(files_data: list, aws_region: str) -> bool
         print(f"❌ File upload failed: {str(e)}")
         return False
 
-def execute_chart_code_direct(code: str, session_files: list = None) -> tuple[str, list]:
-    """Execute chart code directly with AgentCore to preserve full base64 output"""
-    try:
-        print(f"\n🎨 Direct AgentCore chart execution")
-        print(f"📝 Code length: {len(code)} characters")
-        
-        # Clean the code to remove any markdown formatting
-        clean_code = extract_python_code_from_prompt(code)
-        print(f"🔧 Clean code length: {len(clean_code)} characters")
-        
-        with code_session(aws_region) as code_client:
-            # Upload files to sandbox if provided
+class ExecutionCancellation:
+    """Cancels a streaming execution, stopping its sandbox if code is already running"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sandbox = None
+        self.cancelled = False
+
+    def attach(self, sandbox: WarmSandbox) -> bool:
+        """Register the sandbox running the code. False if already cancelled."""
+        with self._lock:
+            if self.cancelled:
+                return False
+            self._sandbox = sandbox
+            return True
+
+    def detach(self):
+        with self._lock:
+            self._sandbox = None
+
+    def cancel(self):
+        """Cancel the execution. Blocks while a running sandbox is stopped."""
+        with self._lock:
+            if self.cancelled:
+                return
+            self.cancelled = True
+            sandbox = self._sandbox
+        if sandbox is not None:
+            # Stopping the interpreter session is the only way to interrupt
+            # running code, and it ends the execution stream being read
+            sandbox.broken = True
+            sandbox.stop()
+
+def stream_sandbox_execution(code: str, session_files: list = None, session_id: str = None,
+                             cancellation: Optional[ExecutionCancellation] = None):
+    """Run code in the session's sandbox and yield (kind, payload) as the
+    Code Interpreter stream produces output.
+
+    kind is 'stdout' or 'stderr' with text, 'artifact' with a chart image
+    reference, or 'error' with the error message. A sandbox whose stream is
+    not read to the end is discarded, since its code may still be running.
+    """
+    # Clean the code to remove any markdown formatting
+    clean_code = extract_python_code_from_prompt(code)
+    print(f"🔧 Clean code length: {len(clean_code)} characters")
+    
+    with session_sandbox(session_id) as sandbox:
+        if cancellation is not None and not cancellation.attach(sandbox):
+            return
+        finished = False
+        try:
+            # Upload files the sandbox doesn't already have
             if session_files:
-                print(f"📁 Uploading {len(session_files)} files to sandbox...")
                 files_data = []
                 for file_info in session_files:
                     files_data.append({
@@ -330,59 +1083,89 @@ def execute_chart_code_direct(code: str, session_files: list = None) -> tuple[st
                         "text": file_info['content']
                     })
                 
-                # Upload files using writeFiles tool
-                upload_response = code_client.invoke("writeFiles", {"content": files_data})
-                for event in upload_response["stream"]:
-                    result = event.get("result", {})
-                    if result.get("isError", False):
-                        error_content = result.get("content", [{}])
-                        error_text = error_content[0].get("text", "Unknown error") if error_content else "Unknown error"
-                        print(f"❌ File upload error: {error_text}")
-                        return f"File upload failed: {error_text}", []
-                    else:
-                        content = result.get("content", [])
-                        for item in content:
-                            if item.get("type") == "text":
-                                print(f"✅ File upload: {item.get('text', '')}")
+                error_text = sandbox.sync_files(files_data)
+                if error_text is not None:
+                    finished = True
+                    yield 'error', f"File upload failed: {error_text}"
+                    return
             
             # Execute the cleaned code
-            response = code_client.invoke("executeCode", {
+            response = sandbox.invoke("executeCode", {
                 "code": clean_code,
                 "language": "python",
                 "clearContext": False
             })
+            
+            # The stream has to be read while the sandbox is held
+            for event in response["stream"]:
+                if cancellation is not None and cancellation.cancelled:
+                    return
+                result = event.get("result", {})
+                
+                if result.get("isError", False):
+                    error_content = result.get("content", [{}])
+                    error_text = error_content[0].get("text", "Unknown error") if error_content else "Unknown error"
+                    print(f"❌ Direct execution error: {error_text}")
+                    finished = True
+                    yield 'error', f"Error: {error_text}"
+                    return
+                
+                # Extract structured content
+                structured_content = result.get("structuredContent", {})
+                stdout = structured_content.get("stdout", "")
+                stderr = structured_content.get("stderr", "")
+                
+                if stdout:
+                    print(f"📤 Direct stdout captured: {len(stdout)} characters")
+                    yield 'stdout', stdout
+                if stderr:
+                    print(f"⚠️  Direct stderr: {stderr}")
+                    yield 'stderr', stderr
+            finished = True
+            
+            # Fetch charts as files instead of base64 in stdout
+            try:
+                images = collect_sandbox_charts(sandbox)
+            except Exception as e:
+                print(f"⚠️  Chart collection failed: {e}")
+                images = []
+            for image in images:
+                yield 'artifact', image
+        finally:
+            if cancellation is not None:
+                cancellation.detach()
+            if not finished:
+                sandbox.broken = True
+
+def execute_chart_code_direct(code: str, session_files: list = None, session_id: str = None) -> tuple[str, list]:
+    """Execute chart code directly with AgentCore to preserve full base64 output"""
+    try:
+        print(f"\n🎨 Direct AgentCore chart execution")
+        print(f"📝 Code length: {len(code)} characters")
         
         # Process response directly without Strands-Agents truncation
         output_parts = []
         full_stdout = ""
+        images = []
         
-        for event in response["stream"]:
-            result = event.get("result", {})
-            
-            if result.get("isError", False):
-                error_content = result.get("content", [{}])
-                error_text = error_content[0].get("text", "Unknown error") if error_content else "Unknown error"
-                print(f"❌ Direct execution error: {error_text}")
-                return f"Error: {error_text}", []
-            
-            # Extract structured content
-            structured_content = result.get("structuredContent", {})
-            stdout = structured_content.get("stdout", "")
-            stderr = structured_content.get("stderr", "")
-            
-            if stdout:
-                output_parts.append(stdout)
-                full_stdout += stdout
-                print(f"📤 Direct stdout captured: {len(stdout)} characters")
-            if stderr:
-                output_parts.append(f"Errors: {stderr}")
-                print(f"⚠️  Direct stderr: {stderr}")
+        for kind, payload in stream_sandbox_execution(code, session_files, session_id):
+            if kind == 'error':
+                return payload, []
+            if kind == 'stdout':
+                output_parts.append(payload)
+                full_stdout += payload
+            elif kind == 'stderr':
+                output_parts.append(f"Errors: {payload}")
+            elif kind == 'artifact':
+                images.append(payload)
         
         # Combine output
         final_output = "\n".join(output_parts) if output_parts else "Code executed successfully"
         
-        # Extract images directly from full stdout
-        images = extract_image_data(full_stdout)
+        # Older chart code prints images to stdout
+        if 'IMAGE_DATA:' in full_stdout:
+            seen = {image['artifact_id'] for image in images}
+            images += [image for image in extract_image_data(full_stdout) if image['artifact_id'] not in seen]
         
         # Clean the output for display (remove image binary but keep analysis text)
         display_output = clean_output_for_display(final_output)
@@ -667,10 +1450,12 @@ def execute_python_code(code: str, description: str = "", files: list = None) ->
     print(f"🔧 Clean code preview: {clean_code[:200]}...")
     
     try:
-        with code_session(aws_region) as code_client:
-            # Upload files to sandbox if provided
+        # Process the response stream to capture all output
+        output_parts = []
+        
+        with session_sandbox(_executor_agent_session_id) as sandbox:
+            # Upload files the sandbox doesn't already have
             if files:
-                print(f"📁 Uploading {len(files)} files to sandbox...")
                 files_data = []
                 for file_info in files:
                     files_data.append({
@@ -678,51 +1463,37 @@ def execute_python_code(code: str, description: str = "", files: list = None) ->
                         "text": file_info.get('content', '')
                     })
                 
-                # Upload files using writeFiles tool
-                upload_response = code_client.invoke("writeFiles", {"content": files_data})
-                for event in upload_response["stream"]:
-                    result = event.get("result", {})
-                    if result.get("isError", False):
-                        error_content = result.get("content", [{}])
-                        error_text = error_content[0].get("text", "Unknown error") if error_content else "Unknown error"
-                        print(f"❌ File upload error: {error_text}")
-                        return f"File upload failed: {error_text}"
-                    else:
-                        content = result.get("content", [])
-                        for item in content:
-                            if item.get("type") == "text":
-                                print(f"✅ File upload: {item.get('text', '')}")
+                error_text = sandbox.sync_files(files_data)
+                if error_text is not None:
+                    return f"File upload failed: {error_text}"
             
             # Execute the code
-            response = code_client.invoke("executeCode", {
+            response = sandbox.invoke("executeCode", {
                 "code": clean_code,
                 "language": "python",
                 "clearContext": False
             })
-        
-        # Process the response stream to capture all output
-        output_parts = []
-        
-        for event in response["stream"]:
-            result = event.get("result", {})
-            
-            if result.get("isError", False):
-                error_content = result.get("content", [{}])
-                error_text = error_content[0].get("text", "Unknown error") if error_content else "Unknown error"
-                print(f"❌ AgentCore execution error: {error_text}")
-                return f"Error: {error_text}"
             
-            # Extract structured content (stdout, stderr)
-            structured_content = result.get("structuredContent", {})
-            stdout = structured_content.get("stdout", "")
-            stderr = structured_content.get("stderr", "")
-            
-            if stdout:
-                output_parts.append(stdout)
-                print(f"📤 Stdout captured: {len(stdout)} characters")
-            if stderr:
-                output_parts.append(f"Errors: {stderr}")
-                print(f"⚠️  Stderr captured: {len(stderr)} characters")
+            for event in response["stream"]:
+                result = event.get("result", {})
+                
+                if result.get("isError", False):
+                    error_content = result.get("content", [{}])
+                    error_text = error_content[0].get("text", "Unknown error") if error_content else "Unknown error"
+                    print(f"❌ AgentCore execution error: {error_text}")
+                    return f"Error: {error_text}"
+                
+                # Extract structured content (stdout, stderr)
+                structured_content = result.get("structuredContent", {})
+                stdout = structured_content.get("stdout", "")
+                stderr = structured_content.get("stderr", "")
+                
+                if stdout:
+                    output_parts.append(stdout)
+                    print(f"📤 Stdout captured: {len(stdout)} characters")
+                if stderr:
+                    output_parts.append(f"Errors: {stderr}")
+                    print(f"⚠️  Stderr captured: {len(stderr)} characters")
         
         # Combine all output
         final_output = "\n".join(output_parts) if output_parts else "Code executed successfully (no output)"
@@ -929,10 +1700,7 @@ def get_or_create_session(session_id: Optional[str] = None) -> CodeInterpreterSe
     if session_id is None:
         session_id = str(uuid.uuid4())
     
-    if session_id not in active_sessions:
-        active_sessions[session_id] = CodeInterpreterSession(session_id)
-    
-    return active_sessions[session_id]
+    return active_sessions.get_or_create(session_id)
 
 # Utility functions for code analysis
 def detect_chart_code(code: str) -> bool:
@@ -982,12 +1750,13 @@ async def generate_code(request: CodeGenerationRequest):
     """Generate Python code using the strands-agents code generator agent"""
     try:
         session = get_or_create_session(request.session_id)
+        uploaded_csv = session.uploaded_csv
         
         # Check if prompt mentions files but no CSV is uploaded
         file_keywords = ['file', 'csv', 'data', 'dataset', 'load', 'read', 'import', 'upload']
         mentions_file = any(keyword in request.prompt.lower() for keyword in file_keywords)
         
-        if mentions_file and not session.uploaded_csv:
+        if mentions_file and not uploaded_csv:
             return {
                 "success": False,
                 "requires_file": True,
@@ -1002,16 +1771,16 @@ async def generate_code(request: CodeGenerationRequest):
         chart_keywords = ['plot', 'chart', 'graph', 'visualiz', 'histogram', 'scatter', 'bar chart', 'line chart', 'pie chart', 'heatmap', 'matplotlib', 'seaborn', 'plotly']
         needs_visualization = any(keyword in request.prompt.lower() for keyword in chart_keywords)
         
-        if session.uploaded_csv:
+        if uploaded_csv:
             csv_info = f"""
-You have access to a CSV file named '{session.uploaded_csv['filename']}' with the following content preview:
+You have access to a CSV file named '{uploaded_csv['filename']}' with the following content preview:
 
 ```csv
-{session.uploaded_csv['content'][:1000]}{'...' if len(session.uploaded_csv['content']) > 1000 else ''}
+{uploaded_csv['content'][:1000]}{'...' if len(uploaded_csv['content']) > 1000 else ''}
 ```
 
 When generating code, assume this CSV data is available and can be loaded using pandas.read_csv() or similar methods. 
-Use the filename '{session.uploaded_csv['filename']}' in your code.
+Use the filename '{uploaded_csv['filename']}' in your code.
 
 User request: {request.prompt}
 """
@@ -1026,8 +1795,6 @@ IMPORTANT: For reliable chart rendering in the web interface, use this approach:
 ```python
 import matplotlib.pyplot as plt
 import numpy as np
-import base64
-import io
 
 # Create your plot
 x = np.linspace(0, 10, 100)
@@ -1039,19 +1806,11 @@ plt.xlabel('X')
 plt.ylabel('Y')
 plt.grid(True)
 
-# Save and capture the plot for web display
-buffer = io.BytesIO()
-plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
-buffer.seek(0)
-image_base64 = base64.b64encode(buffer.read()).decode('utf-8')
-plt.close()  # Close to free memory
-
-# Output the image data for web interface
-print(f"IMAGE_DATA:{image_base64}")
+# Leave the figure open - every open figure is saved and displayed after the code runs
 print("Chart generated successfully!")
 ```
 
-This ensures your charts are properly displayed in the web interface.
+Do not call plt.close() or print base64 image data. This ensures your charts are properly displayed in the web interface.
 """
             enhanced_prompt += chart_instructions
         
@@ -1062,13 +1821,13 @@ This ensures your charts are properly displayed in the web interface.
         generated_code = str(agent_result) if agent_result is not None else ""
         
         # Store generation in session history
-        session.conversation_history.append({
+        session.add_conversation({
             "type": "generation",
             "prompt": request.prompt,
-            "enhanced_prompt": enhanced_prompt if session.uploaded_csv else None,
+            "enhanced_prompt": enhanced_prompt if uploaded_csv else None,
             "generated_code": generated_code,
             "agent": "strands_code_generator",
-            "csv_used": session.uploaded_csv['filename'] if session.uploaded_csv else None,
+            "csv_used": uploaded_csv['filename'] if uploaded_csv else None,
             "timestamp": time.time()
         })
         
@@ -1077,7 +1836,7 @@ This ensures your charts are properly displayed in the web interface.
             "code": generated_code,
             "session_id": session.session_id,
             "agent_used": "strands_code_generator",
-            "csv_file_used": session.uploaded_csv['filename'] if session.uploaded_csv else None
+            "csv_file_used": uploaded_csv['filename'] if uploaded_csv else None
         }
         
     except Exception as e:
@@ -1140,13 +1899,16 @@ async def execute_code(request: CodeExecutionRequest):
         if session.conversation_history:
             # Look for the most recent generation entry with a prompt
             for entry in reversed(session.conversation_history):
-                if entry.get('prompt'):  # Direct prompt field
-                    user_prompt = entry['prompt']
+                # Large prompts and code may have been spilled to disk
+                prompt = load_spilled(entry.get('prompt'))
+                generated_code = load_spilled(entry.get('generated_code'))
+                if prompt:  # Direct prompt field
+                    user_prompt = prompt
                     break
-                elif entry.get('type') == 'generation' and entry.get('generated_code'):
+                elif entry.get('type') == 'generation' and generated_code:
                     # Check if this generated code matches the current code being executed
-                    if entry.get('generated_code') and request.code.strip() in entry.get('generated_code', ''):
-                        user_prompt = entry.get('prompt')
+                    if request.code.strip() in generated_code:
+                        user_prompt = prompt
                         break
         
         # If no prompt found, check if this is a direct code execution
@@ -1176,10 +1938,11 @@ async def execute_code(request: CodeExecutionRequest):
         
         # Get session files for sandbox upload
         session_files = []
-        if session.uploaded_csv:
+        uploaded_csv = session.uploaded_csv
+        if uploaded_csv:
             session_files.append({
-                'filename': session.uploaded_csv['filename'],
-                'content': session.uploaded_csv['content']
+                'filename': uploaded_csv['filename'],
+                'content': uploaded_csv['content']
             })
         
         # REVERTED: Use original logic - only force direct AgentCore for charts and files, NOT for interactive
@@ -1187,7 +1950,10 @@ async def execute_code(request: CodeExecutionRequest):
             print(f"🎨 Chart code detected - using direct AgentCore execution")
             
             # Use direct AgentCore execution to preserve full base64 output
-            execution_result_str, images = execute_chart_code_direct(prepared_code, session_files)
+            # Sandbox runs block, so keep them off the event loop that streams other runs
+            execution_result_str, images = await asyncio.to_thread(
+                execute_chart_code_direct, prepared_code, session_files, session.session_id
+            )
             agent_used = "direct_agentcore_charts"
             
         else:
@@ -1197,7 +1963,9 @@ async def execute_code(request: CodeExecutionRequest):
             # since Strands-Agents tools can't easily access session files
             if session_files:
                 print(f"📁 Files detected - switching to direct AgentCore for file access")
-                execution_result_str, images = execute_chart_code_direct(prepared_code, session_files)
+                execution_result_str, images = await asyncio.to_thread(
+                    execute_chart_code_direct, prepared_code, session_files, session.session_id
+                )
                 agent_used = "direct_agentcore_with_files"
             else:
                 # Use strands-agents with AgentCore tool for regular code without files
@@ -1209,7 +1977,9 @@ async def execute_code(request: CodeExecutionRequest):
 
 Use the tool to run the code and return the complete output."""
                 
-                execution_result = code_executor_agent(execution_prompt)
+                execution_result = await asyncio.to_thread(
+                    run_executor_agent, session.session_id, execution_prompt
+                )
                 
                 # Debug the AgentResult structure
                 print(f"🔍 AgentResult type: {type(execution_result)}")
@@ -1227,8 +1997,7 @@ Use the tool to run the code and return the complete output."""
         execution_duration = execution_end_time - execution_start_time
         
         # Store execution in session history
-        session.code_history.append(request.code)
-        session.execution_results.append({
+        session.add_execution(request.code, {
             "code": request.code,
             "result": execution_result_str,
             "agent": agent_used,
@@ -1268,14 +2037,20 @@ async def clear_csv_from_session(session_id: str):
     try:
         session = get_or_create_session(session_id)
         
-        if session.uploaded_csv:
-            filename = session.uploaded_csv['filename']
+        filename = session.uploaded_csv_filename
+        if filename:
             
             # Clear CSV from session
-            session.uploaded_csv = None
+            session.set_uploaded_csv(None)
+            
+            # Remove it from the session's warm sandbox too
+            try:
+                await asyncio.to_thread(sandbox_pool.remove_files, session_id, [filename])
+            except Exception as e:
+                print(f"⚠️  Could not remove '{filename}' from sandbox: {e}")
             
             # Add to conversation history
-            session.conversation_history.append({
+            session.add_conversation({
                 "type": "csv_removal",
                 "filename": filename,
                 "timestamp": time.time()
@@ -1310,7 +2085,7 @@ async def upload_csv_file(request: FileUploadRequest):
             raise HTTPException(status_code=400, detail="Only CSV files are allowed")
         
         # Store CSV file in session
-        session.conversation_history.append({
+        session.add_conversation({
             "type": "csv_upload",
             "filename": request.filename,
             "content": request.content,
@@ -1318,11 +2093,11 @@ async def upload_csv_file(request: FileUploadRequest):
         })
         
         # Store CSV data for code generation
-        session.uploaded_csv = {
+        session.set_uploaded_csv({
             "filename": request.filename,
             "content": request.content,
             "timestamp": asyncio.get_event_loop().time()
-        }
+        })
         
         return {
             "success": True,
@@ -1342,7 +2117,7 @@ async def upload_file(request: FileUploadRequest):
         session = get_or_create_session(request.session_id)
         
         # Store file in session
-        session.conversation_history.append({
+        session.add_conversation({
             "type": "file_upload",
             "filename": request.filename,
             "content": request.content,
@@ -1363,16 +2138,14 @@ async def upload_file(request: FileUploadRequest):
 async def get_session_history(session_id: str):
     """Get session history"""
     try:
-        if session_id not in active_sessions:
+        session = active_sessions.get(session_id)
+        if session is None:
             raise HTTPException(status_code=404, detail="Session not found")
         
-        session = active_sessions[session_id]
-        
         return {
             "success": True,
             "session_id": session_id,
-            "conversation_history": session.conversation_history,
-            "execution_results": session.execution_results
+            **session.export_history()
         }
         
     except Exception as e:
@@ -1418,17 +2191,185 @@ async def get_agents_status():
         raise HTTPException(status_code=500, detail=f"Failed to get agents status: {str(e)}")
 
 # WebSocket endpoint for real-time communication
+async def stream_execution(websocket: WebSocket, session_id: str, execution_id: str,
+                           code: str, cancellation: ExecutionCancellation,
+                           inputs: Optional[list] = None):
+    """Run code in the session's sandbox and send its output to the websocket as it arrives.
+
+    The sandbox stream is read on a worker thread that waits whenever
+    STREAM_MAX_PENDING_MESSAGES messages are not yet sent, so a slow client
+    slows down reading instead of growing a buffer.
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    pending = threading.Semaphore(STREAM_MAX_PENDING_MESSAGES)
+    done = object()
+    
+    session = get_or_create_session(session_id)
+    prepared_code = prepare_interactive_code(code, inputs) if inputs else code
+    session_files = []
+    uploaded_csv = session.uploaded_csv
+    if uploaded_csv:
+        session_files.append({
+            'filename': uploaded_csv['filename'],
+            'content': uploaded_csv['content']
+        })
+    
+    def publish(kind, payload) -> bool:
+        # Wait for the client to catch up, giving up if the execution is cancelled
+        while not pending.acquire(timeout=0.5):
+            if cancellation.cancelled:
+                return False
+        loop.call_soon_threadsafe(queue.put_nowait, (kind, payload))
+        return True
+    
+    def produce():
+        try:
+            for kind, payload in stream_sandbox_execution(prepared_code, session_files, session_id, cancellation):
+                if kind in ('stdout', 'stderr'):
+                    for start in range(0, len(payload), STREAM_CHUNK_CHARS):
+                        if not publish(kind, payload[start:start + STREAM_CHUNK_CHARS]):
+                            return
+                elif not publish(kind, payload):
+                    return
+        except Exception as e:
+            if not cancellation.cancelled:
+                print(f"❌ Streaming execution failed: {e}")
+                loop.call_soon_threadsafe(queue.put_nowait, ('error', f"Direct execution failed: {e}"))
+        finally:
+            loop.call_soon_threadsafe(queue.put_nowait, (done, None))
+    
+    execution_start_time = time.time()
+    producer = loop.run_in_executor(None, produce)
+    await websocket.send_text(json.dumps({
+        "type": "execution_started",
+        "execution_id": execution_id,
+        "session_id": session_id
+    }))
+    
+    output_parts = []
+    full_stdout = ""
+    images = []
+    error = None
+    try:
+        while True:
+            kind, payload = await queue.get()
+            if kind is done:
+                break
+            if kind == 'error':
+                error = payload
+                continue
+            if kind == 'artifact':
+                images.append(payload)
+                message = {"type": "execution_artifact", "image": payload}
+            else:
+                if kind == 'stdout':
+                    output_parts.append(payload)
+                    full_stdout += payload
+                else:
+                    output_parts.append(f"Errors: {payload}")
+                # Legacy IMAGE_DATA payloads are sent as artifacts at the end
+                message = {"type": "execution_output", "stream": kind, "data": clean_output_for_display(payload)}
+            await websocket.send_text(json.dumps({**message, "execution_id": execution_id}))
+            pending.release()
+    except BaseException:
+        # The client went away or the task was cancelled: stop the sandbox so the worker finishes
+        await asyncio.shield(asyncio.to_thread(cancellation.cancel))
+        raise
+    await producer
+    
+    if cancellation.cancelled:
+        await websocket.send_text(json.dumps({
+            "type": "execution_cancelled",
+            "execution_id": execution_id,
+            "session_id": session_id
+        }))
+        return
+    
+    if 'IMAGE_DATA:' in full_stdout:
+        seen = {image['artifact_id'] for image in images}
+        for image in extract_image_data(full_stdout):
+            if image['artifact_id'] not in seen:
+                images.append(image)
+                await websocket.send_text(json.dumps({
+                    "type": "execution_artifact",
+                    "execution_id": execution_id,
+                    "image": image
+                }))
+    
+    if error is not None:
+        result = error
+    else:
+        result = clean_output_for_display("\n".join(output_parts) if output_parts else "Code executed successfully")
+    execution_end_time = time.time()
+    execution_duration = execution_end_time - execution_start_time
+    
+    session.add_execution(code, {
+        "code": code,
+        "result": result,
+        "agent": "direct_agentcore_stream",
+        "executor_type": "agentcore",
+        "interactive": bool(inputs),
+        "inputs_provided": inputs,
+        "images": images,
+        "is_chart_code": detect_chart_code(prepared_code),
+        "timestamp": execution_end_time,
+        "execution_duration": execution_duration,
+        "prompt": "Streaming code execution",
+        "start_time": execution_start_time,
+        "end_time": execution_end_time
+    })
+    
+    await websocket.send_text(json.dumps({
+        "type": "execution_complete",
+        "execution_id": execution_id,
+        "session_id": session_id,
+        "success": error is None,
+        "result": result,
+        "images": images,
+        "execution_duration": execution_duration
+    }))
+
 @app.websocket("/ws/{session_id}")
 async def websocket_endpoint(websocket: WebSocket, session_id: str):
     await websocket.accept()
     print(f"WebSocket connected for session {session_id}")
     
+    # At most one streaming execution per connection, since it holds the session's sandbox
+    stream_task = None
+    cancellation = None
+    
     try:
         while True:
             data = await websocket.receive_text()
             message = json.loads(data)
             
-            if message["type"] == "generate_code":
+            if message["type"] == "execute_stream":
+                if stream_task is not None and not stream_task.done():
+                    await websocket.send_text(json.dumps({
+                        "type": "error",
+                        "success": False,
+                        "error": "An execution is already running for this connection"
+                    }))
+                    continue
+                if executor_type != "agentcore":
+                    await websocket.send_text(json.dumps({
+                        "type": "error",
+                        "success": False,
+                        "error": "Streaming execution requires the AgentCore executor"
+                    }))
+                    continue
+                cancellation = ExecutionCancellation()
+                stream_task = asyncio.create_task(stream_execution(
+                    websocket, session_id, message.get("execution_id") or str(uuid.uuid4()),
+                    message["code"], cancellation, message.get("inputs")
+                ))
+            
+            elif message["type"] == "cancel_execution":
+                if stream_task is not None and not stream_task.done():
+                    await asyncio.to_thread(cancellation.cancel)
+            
+            elif message["type"] == "generate_code":
                 # Handle code generation via WebSocket
                 try:
                     agent_result = code_generator_agent(message["prompt"])
@@ -1452,10 +2393,16 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
             elif message["type"] == "execute_code":
                 # Handle code execution via WebSocket
                 try:
+                    # Run in a worker thread: the session's sandbox may be busy with a
+                    # streaming run whose output this event loop has to keep sending
                     if executor_type == "agentcore":
-                        execution_result = code_executor_agent(f"Execute this code: {message['code']}")
+                        execution_result = await asyncio.to_thread(
+                            run_executor_agent, session_id, f"Execute this code: {message['code']}"
+                        )
                     else:
-                        execution_result = code_executor_agent(f"Simulate execution of: {message['code']}")
+                        execution_result = await asyncio.to_thread(
+                            run_executor_agent, session_id, f"Simulate execution of: {message['code']}"
+                        )
                     
                     await websocket.send_text(json.dumps({
                         "type": "execution_result",
@@ -1472,6 +2419,37 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                     
     except WebSocketDisconnect:
         print(f"WebSocket disconnected for session {session_id}")
+        if stream_task is not None and not stream_task.done():
+            await asyncio.to_thread(cancellation.cancel)
+            await asyncio.gather(stream_task, return_exceptions=True)
+
+@app.get("/api/artifacts/{artifact_id}")
+async def get_artifact(artifact_id: str, request: Request):
+    """Stream a cached chart image by id, honouring If-None-Match"""
+    artifact = artifact_cache.get(artifact_id)
+    if artifact is None:
+        raise HTTPException(status_code=404, detail="Artifact not found or expired")
+    
+    data, media_type = artifact
+    # Artifacts are content-addressed, so the id is a strong ETag and never changes
+    etag = f'"{artifact_id}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "private, max-age=31536000, immutable"
+    }
+    
+    if_none_match = request.headers.get("if-none-match", "")
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    if etag in candidates or "*" in candidates:
+        return Response(status_code=304, headers=headers)
+    
+    def iter_chunks():
+        view = memoryview(data)
+        for start in range(0, len(view), ARTIFACT_CHUNK_SIZE):
+            yield bytes(view[start:start + ARTIFACT_CHUNK_SIZE])
+    
+    headers["Content-Length"] = str(len(data))
+    return StreamingResponse(iter_chunks(), media_type=media_type, headers=headers)
 
 @app.get("/health")
 async def health_check():
@@ -1486,6 +2464,9 @@ async def health_check():
         "current_model": current_model,
         "aws_region": aws_region,
         "authentication": "AWS Profile" if os.getenv('AWS_PROFILE') else "Access Keys",
+        "sandbox_pool": sandbox_pool.stats(),
+        "sessions": active_sessions.stats(),
+        "artifacts": artifact_cache.stats(),
         "architecture": {
             "code_generation": f"Strands-Agents Agent ({current_model})",
             "code_execution": f"{executor_type.title().replace('_', ' ')} Agent ({current_model})"
@@ -1,4 +1,4 @@
-import React, { useState, useEffect, useMemo } from 'react';
+import React, { useState, useEffect, useMemo, useRef } from 'react';
 import {
   AppLayout,
   ContentLayout,
@@ -23,7 +23,7 @@ import SessionHistory from './components/SessionHistory.jsx';
 import InteractiveExecutionModal from './components/InteractiveExecutionModal.jsx';
 import CsvUploadModal from './components/CsvUploadModal.jsx';
 import ExecutionTimer from './components/ExecutionTimer.jsx';
-import { generateCode, executeCode, uploadFile, uploadCsvFile, getSessionHistory, analyzeCode } from './services/api';
+import { generateCode, executeCode, uploadFile, uploadCsvFile, getSessionHistory, analyzeCode, WebSocketService } from './services/api';
 import { v4 as uuidv4 } from 'uuid';
 
 function App() {
@@ -46,6 +46,11 @@ function App() {
   const [uploadedCsv, setUploadedCsv] = useState(null);
   const [csvUploadLoading, setCsvUploadLoading] = useState(false);
   const [isExecuting, setIsExecuting] = useState(false);
+  const [isStreaming, setIsStreaming] = useState(false);
+  // Session websocket, the streaming execution in progress, and the latest editor code for socket handlers
+  const wsRef = useRef(null);
+  const streamRef = useRef(null);
+  const editedCodeRef = useRef('');
 
   // Memoized session ID initialization
   const initialSessionId = useMemo(() => uuidv4(), []);
@@ -55,52 +60,113 @@ function App() {
     setSessionId(initialSessionId);
   }, [initialSessionId]);
 
+  useEffect(() => {
+    editedCodeRef.current = editedCode;
+  }, [editedCode]);
+
+  const finishStream = () => {
+    streamRef.current = null;
+    setIsStreaming(false);
+    setLoading(false);
+    setIsExecuting(false);
+    // Force a history refresh when the user visits the history tab
+    setSessionHistory(null);
+  };
+
+  // Ignore messages of executions that are no longer current
+  const isCurrentStream = (data) => streamRef.current && data.execution_id === streamRef.current.executionId;
+
   useEffect(() => {
     // Initialize WebSocket connection when sessionId is available
-    if (sessionId) {
-      const ws = new WebSocket(`ws://localhost:8000/ws/${sessionId}`);
-      
-      ws.onopen = () => {
-        // WebSocket connection established
-      };
-      
-      ws.onmessage = (event) => {
-        const data = JSON.parse(event.data);
-        
-        if (data.type === 'code_generated' && data.success) {
-          const code = typeof data.code === 'string' ? data.code : '';
-          setGeneratedCode(code);
-          setEditedCode(code);
-          setActiveTab('editor');
-          setSuccessMessage('Code generated successfully via WebSocket!');
-          setTimeout(() => setSuccessMessage(null), 5000);
-        } else if (data.type === 'execution_result' && data.success) {
-          setExecutionResult({
-            code: editedCode,
-            result: data.result,
-            success: data.success,
-            images: data.images || [],
-            timestamp: new Date().toISOString()
-          });
-          setActiveTab('results');
-        }
-      };
-      
-      ws.onclose = () => {
-        // WebSocket connection closed
-      };
-      
-      ws.onerror = (error) => {
-      };
-      
-      // Cleanup on unmount
-      return () => {
-        if (ws.readyState === WebSocket.OPEN) {
-          ws.close();
-        }
-      };
-    }
-  }, [sessionId, editedCode]);
+    if (!sessionId) return;
+
+    const service = new WebSocketService(sessionId);
+
+    service.on('code_generated', (data) => {
+      if (!data.success) return;
+      const code = typeof data.code === 'string' ? data.code : '';
+      setGeneratedCode(code);
+      setEditedCode(code);
+      setActiveTab('editor');
+      setSuccessMessage('Code generated successfully via WebSocket!');
+      setTimeout(() => setSuccessMessage(null), 5000);
+    });
+
+    service.on('execution_result', (data) => {
+      if (!data.success) return;
+      setExecutionResult({
+        code: editedCodeRef.current,
+        result: data.result,
+        success: data.success,
+        images: data.images || [],
+        timestamp: new Date().toISOString()
+      });
+      setActiveTab('results');
+    });
+
+    // Streaming execution: output and charts arrive while the code runs
+    service.on('execution_output', (data) => {
+      if (!isCurrentStream(data)) return;
+      setExecutionResult(prev => ({ ...prev, result: (prev.result || '') + data.data }));
+    });
+
+    service.on('execution_artifact', (data) => {
+      if (!isCurrentStream(data)) return;
+      setExecutionResult(prev => ({ ...prev, images: [...(prev.images || []), data.image] }));
+    });
+
+    service.on('execution_complete', (data) => {
+      if (!isCurrentStream(data)) return;
+      setExecutionResult(prev => ({
+        ...prev,
+        status: 'complete',
+        result: data.result,
+        success: data.success,
+        images: data.images || prev.images
+      }));
+      finishStream();
+    });
+
+    service.on('execution_cancelled', (data) => {
+      if (!isCurrentStream(data)) return;
+      setExecutionResult(prev => ({
+        ...prev,
+        status: 'cancelled',
+        success: false,
+        result: `${prev.result || ''}\n\nExecution cancelled.`
+      }));
+      finishStream();
+    });
+
+    // The backend refuses to stream (e.g. non-AgentCore executor): run over HTTP instead
+    service.on('error', (data) => {
+      if (!streamRef.current || !data || !data.error) return;
+      const { code, interactive, inputs } = streamRef.current;
+      streamRef.current = null;
+      setIsStreaming(false);
+      runExecution(code, interactive, inputs);
+    });
+
+    service.on('disconnected', () => {
+      if (!streamRef.current) return;
+      setExecutionResult(prev => ({
+        ...prev,
+        status: 'complete',
+        success: false,
+        result: `${prev.result || ''}\n\nConnection to the backend was lost.`
+      }));
+      finishStream();
+    });
+
+    service.connect();
+    wsRef.current = service;
+
+    // Cleanup on unmount
+    return () => {
+      wsRef.current = null;
+      service.disconnect();
+    };
+  }, [sessionId]);
 
   const handleGenerateCode = async () => {
     if (!prompt.trim()) {
@@ -176,6 +242,33 @@ function App() {
     setIsExecuting(true);
     setError(null);
 
+    // Stream output over the session websocket when it is connected
+    const service = wsRef.current;
+    if (service && service.isConnected()) {
+      const executionId = uuidv4();
+      streamRef.current = { executionId, code, interactive, inputs };
+      setIsStreaming(true);
+      setExecutionResult({
+        code: code,
+        result: '',
+        status: 'running',
+        interactive: interactive,
+        inputs_used: inputs,
+        images: [],
+        timestamp: new Date().toISOString()
+      });
+      setActiveTab('results');
+      service.executeCodeStream(code, inputs, executionId);
+      return;
+    }
+
+    await runExecution(code, interactive, inputs);
+  };
+
+  const runExecution = async (code, interactive, inputs) => {
+    setLoading(true);
+    setIsExecuting(true);
+
     try {
       const response = await executeCode(code, sessionId, interactive, inputs);
       setExecutionResult({
@@ -190,9 +283,7 @@ function App() {
       setActiveTab('results');
       
       // Clear session history to force refresh when user visits history tab
-      if (sessionHistory) {
-        setSessionHistory(null);
-      }
+      setSessionHistory(null);
     } catch (err) {
       setError(`Code execution failed: ${err.message}`);
     } finally {
@@ -338,6 +429,12 @@ function App() {
     setShowEditModal(false);
   };
 
+  const handleCancelExecution = () => {
+    if (wsRef.current && streamRef.current) {
+      wsRef.current.cancelExecution();
+    }
+  };
+
   const handleInteractiveExecution = async (code, interactive, inputs) => {
     await handleExecuteCode(code, interactive, inputs);
   };
@@ -558,6 +655,11 @@ function App() {
                   >
                     Execute Code
                   </Button>
+                  {isStreaming && (
+                    <Button onClick={handleCancelExecution} iconName="close">
+                      Cancel Execution
+                    </Button>
+                  )}
                   <Button
                     onClick={async () => {
                       if (!editedCode || typeof editedCode !== 'string' || !editedCode.trim()) {
@@ -610,6 +712,7 @@ function App() {
         <ExecutionResults
           result={executionResult}
           onExecuteAgain={() => handleExecuteCode()}
+          onCancel={isStreaming ? handleCancelExecution : null}
         />
       )
     },
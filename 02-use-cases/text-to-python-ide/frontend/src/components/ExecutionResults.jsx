@@ -14,8 +14,14 @@ import CodeEditor from './CodeEditor.jsx';
 import CodeDisplay from './CodeDisplay.jsx';
 import ImageDisplay from './ImageDisplay.jsx';
 
-const ExecutionResults = memo(({ result, onExecuteAgain }) => {
+const ExecutionResults = memo(({ result, onExecuteAgain, onCancel }) => {
+  const isRunning = result?.status === 'running';
+  const isCancelled = result?.status === 'cancelled';
+
   const isError = useMemo(() => {
+    if (result?.status === 'running' || result?.status === 'cancelled') {
+      return false;
+    }
     // Check if there's an explicit success field (false means error)
     if (result?.success !== undefined) {
       return !result.success;
@@ -36,7 +42,7 @@ const ExecutionResults = memo(({ result, onExecuteAgain }) => {
     }
     
     return false;
-  }, [result?.result, result?.success]);
+  }, [result?.result, result?.success, result?.status]);
 
   const formatTimestamp = useMemo(() => {
     if (!result?.timestamp) return '';
@@ -59,9 +65,15 @@ const ExecutionResults = memo(({ result, onExecuteAgain }) => {
         <Header 
           variant="h2"
           actions={
-            <Button onClick={onExecuteAgain}>
-              Execute Again
-            </Button>
+            isRunning && onCancel ? (
+              <Button onClick={onCancel} iconName="close">
+                Cancel Execution
+              </Button>
+            ) : (
+              <Button onClick={onExecuteAgain} disabled={isRunning}>
+                Execute Again
+              </Button>
+            )
           }
         >
           Execution Results
@@ -72,9 +84,15 @@ const ExecutionResults = memo(({ result, onExecuteAgain }) => {
         <ColumnLayout columns={2}>
           <Box>
             <Box variant="awsui-key-label">Status</Box>
-            <StatusIndicator type={isError ? "error" : "success"}>
-              {isError ? "Execution Failed" : "Execution Successful"}
-            </StatusIndicator>
+            {isRunning ? (
+              <StatusIndicator type="in-progress">Running</StatusIndicator>
+            ) : isCancelled ? (
+              <StatusIndicator type="stopped">Execution Cancelled</StatusIndicator>
+            ) : (
+              <StatusIndicator type={isError ? "error" : "success"}>
+                {isError ? "Execution Failed" : "Execution Successful"}
+              </StatusIndicator>
+            )}
           </Box>
           <Box>
             <Box variant="awsui-key-label">Executed At</Box>
@@ -119,7 +137,7 @@ const ExecutionResults = memo(({ result, onExecuteAgain }) => {
               <CodeDisplay content={result.result} />
             </Alert>
           ) : (
-            <CodeDisplay content={result.result || 'No output generated'} />
+            <CodeDisplay content={result.result || (isRunning ? 'Waiting for output...' : 'No output generated')} />
           )}
         </Container>
 
@@ -128,7 +146,7 @@ const ExecutionResults = memo(({ result, onExecuteAgain }) => {
         )}
 
         <Box textAlign="center">
-          <Button onClick={onExecuteAgain}>
+          <Button onClick={onExecuteAgain} disabled={isRunning}>
             Execute Again
           </Button>
         </Box>
@@ -8,20 +8,29 @@ import {
   ColumnLayout,
   Badge
 } from '@cloudscape-design/components';
+import { getArtifactUrl } from '../services/api';
+
+// Charts are referenced by artifact URL; older results carry inline base64 data
+const imageSrc = (image) => (
+  image.url ? getArtifactUrl(image.url) : `data:image/png;base64,${image.data}`
+);
 
 const ImageDisplay = memo(({ images = [] }) => {
   if (!images || images.length === 0) {
     return null;
   }
 
-  const downloadImage = (imageData, index) => {
+  const downloadImage = async (image, index) => {
     try {
+      const response = await fetch(imageSrc(image));
+      const objectUrl = URL.createObjectURL(await response.blob());
       const link = document.createElement('a');
-      link.href = `data:image/png;base64,${imageData}`;
-      link.download = `chart_${index + 1}.png`;
+      link.href = objectUrl;
+      link.download = `chart_${index + 1}.${image.format === 'jpeg' ? 'jpg' : 'png'}`;
       document.body.appendChild(link);
       link.click();
       document.body.removeChild(link);
+      URL.revokeObjectURL(objectUrl);
     } catch (error) {
       // eslint-disable-next-line no-console
       console.error('Failed to download image:', error);
@@ -40,14 +49,14 @@ const ImageDisplay = memo(({ images = [] }) => {
                 <Button
                   variant="link"
                   iconName="download"
-                  onClick={() => downloadImage(images[0].data, 0)}
+                  onClick={() => downloadImage(images[0], 0)}
                 >
                   Download PNG
                 </Button>
               </Box>
               <Box textAlign="center">
                 <img
-                  src={`data:image/png;base64,${images[0].data}`}
+                  src={imageSrc(images[0])}
                   alt="Generated Chart 1"
                   style={{
                     maxWidth: '100%',
@@ -71,14 +80,14 @@ const ImageDisplay = memo(({ images = [] }) => {
                     <Button
                       variant="link"
                       iconName="download"
-                      onClick={() => downloadImage(image.data, index)}
+                      onClick={() => downloadImage(image, index)}
                     >
                       Download PNG
                     </Button>
                   </Box>
                   <Box textAlign="center">
                     <img
-                      src={`data:image/png;base64,${image.data}`}
+                      src={imageSrc(image)}
                       alt={`Generated Chart ${index + 1}`}
                       style={{
                         maxWidth: '100%',
@@ -152,6 +152,9 @@ export const healthCheck = async () => {
   }
 };
 
+// Absolute URL of a chart artifact served by the backend
+export const getArtifactUrl = (url) => `${API_BASE_URL}${url}`;
+
 // WebSocket connection for real-time communication
 export class WebSocketService {
   constructor(sessionId) {
@@ -200,6 +203,10 @@ export class WebSocketService {
     }
   }
 
+  isConnected() {
+    return Boolean(this.ws && this.ws.readyState === WebSocket.OPEN);
+  }
+
   send(message) {
     if (this.ws && this.ws.readyState === WebSocket.OPEN) {
       this.ws.send(JSON.stringify(message));
@@ -233,6 +240,22 @@ export class WebSocketService {
       code: code
     });
   }
+
+  // Streams execution_output and execution_artifact messages, then execution_complete
+  executeCodeStream(code, inputs = null, executionId = null) {
+    this.send({
+      type: 'execute_stream',
+      code: code,
+      inputs: inputs,
+      execution_id: executionId
+    });
+  }
+
+  cancelExecution() {
+    this.send({
+      type: 'cancel_execution'
+    });
+  }
 }
 
 export default api;